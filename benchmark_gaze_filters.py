@@ -0,0 +1,246 @@
+"""
+Bakış Filtresi Karşılaştırması
+- Oyunun kaydettiği .gztr izi, CSV izi (t, x, y[, true_x, true_y]) veya
+  sentetik iz üzerinde tüm filtreleri çalıştırır
+- .gztr izinde ham bakış kayıtlı kalibrasyon eşlemesiyle hesaplanır; gerçek
+  değer topun örnek anındaki konumudur
+- Gecikme (ms), titreme (px) ve güncelleme maliyeti (µs) raporlar
+
+Kullanım:
+    python benchmark_gaze_filters.py               # sentetik iz
+    python benchmark_gaze_filters.py iz.gztr       # oyunda kaydedilen iz
+    python benchmark_gaze_filters.py iz.csv        # CSV iz
+"""
+
+import csv
+import sys
+import time
+
+import numpy as np
+
+from gaze_calibration import GazeMapping
+from gaze_filters import GAZE_FILTERS, make_gaze_filter
+from landmark_adapter import iris_position
+from landmark_trace import TraceMapping, read_trace
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+SYNTHETIC_FPS = 30.0
+SYNTHETIC_DURATION = 60.0  # Saniye
+SYNTHETIC_NOISE_PX = 25.0  # Ölçüm gürültüsü standart sapması
+MAX_LAG_SECONDS = 0.5  # Çapraz korelasyonda aranan en büyük gecikme
+SETTLE_SECONDS = 0.5  # Sıçramadan sonra titreme / takip ölçümüne kadar beklenen süre
+PURSUIT_MIN_SPEED = 30.0  # Takip sayılan en düşük hedef hızı (piksel/sn)
+PURSUIT_MAX_SPEED = 2000.0  # Bunun üstü sıçrama sayılır (piksel/sn)
+
+
+# ============================================
+# İZ YÜKLEME / ÜRETME
+# ============================================
+
+def load_trace(path):
+    """Uzantıya göre .gztr veya CSV izi oku: (t, raw (K, 2), truth (K, 2) veya None)"""
+    if path.endswith('.gztr'):
+        return load_gaze_trace(path)
+    return load_csv_trace(path)
+
+
+def load_gaze_trace(path):
+    """Oyunun .gztr izinden ham bakış örneklerini çıkar
+
+    Sadece yeni çıkarım örneği taşıyan, yüzü ve iris geometrisi geçerli,
+    kalibrasyon eşlemesi olan kareler kullanılır. Ham bakış oyundaki gibi
+    ekrana sınırlanır; gerçek değer top konumunun örnek zamanına
+    enterpolasyonudur (top kare zamanında kaydedilir).
+    """
+    header, records = read_trace(path)
+    frame_t, balls = [], []
+    t, raw = [], []
+    mapping = None
+    for record in records:
+        if isinstance(record, TraceMapping):
+            mapping = GazeMapping(record.coeffs) if record.coeffs is not None else None
+            continue
+        frame_t.append(record.t)
+        balls.append(record.ball[:2])
+        if not record.new_sample or record.points is None or mapping is None:
+            continue
+        iris_x, iris_y, valid = iris_position(record.points)
+        if not valid:
+            continue
+        x, y = mapping.apply(float(iris_x), float(iris_y))
+        t.append(record.sample_time)
+        raw.append((min(max(x, 0), header.screen_width), min(max(y, 0), header.screen_height)))
+
+    t = np.array(t)
+    raw = np.array(raw).reshape(-1, 2)
+    frame_t = np.array(frame_t)
+    balls = np.array(balls).reshape(-1, 2)
+    truth = np.stack([np.interp(t, frame_t, balls[:, 0]), np.interp(t, frame_t, balls[:, 1])], axis=1)
+    return t, raw, truth
+
+
+def load_csv_trace(path):
+    """CSV izi oku: (t, raw (K, 2), truth (K, 2) veya None)"""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    t = np.array([float(r['t']) for r in rows])
+    raw = np.array([(float(r['x']), float(r['y'])) for r in rows])
+    truth = None
+    if rows and 'true_x' in rows[0]:
+        truth = np.array([(float(r['true_x']), float(r['true_y'])) for r in rows])
+    return t, raw, truth
+
+
+def synthetic_trace(seed=0):
+    """Sabit bakış + sıçrama + takip bölümlerinden oluşan gürültülü iz"""
+    rng = np.random.default_rng(seed)
+    n = int(SYNTHETIC_DURATION * SYNTHETIC_FPS)
+    # Gerçekçi kare zamanı oynaması (±%20)
+    dt = (1.0 / SYNTHETIC_FPS) * rng.uniform(0.8, 1.2, n)
+    t = np.cumsum(dt)
+
+    truth = np.empty((n, 2))
+    x, y = 640.0, 360.0
+    i = 0
+    while i < n:
+        segment = int(rng.integers(int(SYNTHETIC_FPS), int(3 * SYNTHETIC_FPS)))
+        end = min(n, i + segment)
+        if rng.random() < 0.5:
+            # Sıçrama + sabit bakış
+            x, y = rng.uniform(100, 1180), rng.uniform(100, 620)
+            truth[i:end] = (x, y)
+        else:
+            # Yumuşak takip (top hızına benzer)
+            vx, vy = rng.choice([-1, 1], 2) * rng.uniform(90, 150, 2)
+            steps = t[i:end] - t[i]
+            truth[i:end, 0] = np.clip(x + vx * steps, 50, 1230)
+            truth[i:end, 1] = np.clip(y + vy * steps, 50, 670)
+            x, y = truth[end - 1]
+        i = end
+
+    raw = truth + rng.normal(0, SYNTHETIC_NOISE_PX, truth.shape)
+    return t, raw, truth
+
+
+# ============================================
+# METRİKLER
+# ============================================
+
+def estimate_lag(t, reference, filtered):
+    """Çapraz korelasyonla çıktının girdiye göre gecikmesi (saniye)
+
+    Her kaydırmada skor örtüşen bölümün normalize korelasyonudur (kısa
+    örtüşme büyük kaydırmaları cezalandırmaz); tepe parabolle kare altı
+    çözünürlüğe inceltilir.
+    """
+    frame_dt = float(np.median(np.diff(t)))
+    max_shift = max(1, int(MAX_LAG_SECONDS / frame_dt))
+    scores = np.full(max_shift + 1, -np.inf)
+    for shift in range(max_shift + 1):
+        ref = reference[:len(reference) - shift]
+        out = filtered[shift:]
+        ref = ref - ref.mean(axis=0)
+        out = out - out.mean(axis=0)
+        norm = np.sqrt(np.sum(ref ** 2) * np.sum(out ** 2))
+        if norm > 0:
+            scores[shift] = np.sum(ref * out) / norm
+
+    best = int(np.argmax(scores))
+    offset = 0.0
+    if 0 < best < max_shift:
+        left, mid, right = scores[best - 1:best + 2]
+        curvature = left - 2 * mid + right
+        if curvature < 0:
+            offset = 0.5 * (left - right) / curvature
+    return max(0.0, (best + offset) * frame_dt)
+
+
+def pursuit_lag(t, truth, filtered):
+    """Takip bölümlerinde gecikme (saniye); takip bölümü yoksa None
+
+    Hedef PURSUIT_MIN_SPEED..PURSUIT_MAX_SPEED hızında en az SETTLE_SECONDS
+    boyunca hareket ederken, hatanın hareket yönündeki bileşeni hıza
+    bölünür (sabit hızda gecikme * hız = geride kalma). Sıçramadan hemen
+    sonraki örnekler dışarıda kalır; sonuç medyandır.
+    """
+    velocity = np.gradient(truth, t, axis=0)
+    speed_sq = np.sum(velocity ** 2, axis=1)
+    moving = (speed_sq > PURSUIT_MIN_SPEED ** 2) & (speed_sq < PURSUIT_MAX_SPEED ** 2)
+
+    settled = np.zeros_like(moving)
+    since = 0.0
+    for i in range(1, len(moving)):
+        since = since + (t[i] - t[i - 1]) if moving[i] and moving[i - 1] else 0.0
+        settled[i] = since >= SETTLE_SECONDS
+    if not settled.any():
+        return None
+    behind = np.sum((truth - filtered)[settled] * velocity[settled], axis=1) / speed_sq[settled]
+    return float(np.median(behind))
+
+
+def jitter(t, filtered, truth=None):
+    """Titreme: sabit bakış sırasında kare-kare hareketin RMS'i (piksel)
+
+    Gerçek değer varsa sadece en az SETTLE_SECONDS boyunca sabit kalan
+    bölümler kullanılır; yoksa tüm iz kullanılır.
+    """
+    motion = np.sqrt(np.sum(np.diff(filtered, axis=0) ** 2, axis=1))
+    if truth is not None:
+        still = np.all(np.diff(truth, axis=0) == 0, axis=1)
+        settled = np.zeros_like(still)
+        since = 0.0
+        for i in range(len(still)):
+            since = since + (t[i + 1] - t[i]) if still[i] else 0.0
+            settled[i] = since >= SETTLE_SECONDS
+        if settled.any():
+            motion = motion[settled]
+    return float(np.sqrt(np.mean(motion ** 2)))
+
+
+def run_filter(name, t, raw):
+    """Filtreyi iz boyunca çalıştır: (çıktı, µs/güncelleme)"""
+    gaze_filter = make_gaze_filter(name)
+    out = np.empty_like(raw)
+    samples = [(float(t[i]), float(raw[i, 0]), float(raw[i, 1])) for i in range(len(t))]
+
+    start = time.perf_counter()
+    for i, (ti, xi, yi) in enumerate(samples):
+        out[i] = gaze_filter.update(xi, yi, ti)
+    elapsed = time.perf_counter() - start
+    return out, elapsed / len(samples) * 1e6
+
+
+def benchmark(t, raw, truth=None):
+    """Tüm filtreleri karşılaştır ve tablo yazdır"""
+    reference = truth if truth is not None else raw
+    print(f"{'Filtre':<10} {'Takip(ms)':>10} {'XKor(ms)':>9} {'Titreme(px)':>12} {'RMSE(px)':>10} {'us/adim':>9}")
+    print("-" * 65)
+    results = {}
+    for name in GAZE_FILTERS:
+        out, cost_us = run_filter(name, t, raw)
+        pursuit = pursuit_lag(t, truth, out) if truth is not None else None
+        pursuit_ms = pursuit * 1000 if pursuit is not None else float('nan')
+        xcorr_ms = estimate_lag(t, reference, out) * 1000
+        jit = jitter(t, out, truth)
+        rmse = float(np.sqrt(np.mean(np.sum((out - truth) ** 2, axis=1)))) if truth is not None else float('nan')
+        results[name] = {
+            'lag_ms': pursuit_ms if pursuit is not None else xcorr_ms,
+            'pursuit_lag_ms': pursuit_ms, 'xcorr_lag_ms': xcorr_ms,
+            'jitter_px': jit, 'rmse_px': rmse, 'cost_us': cost_us,
+        }
+        print(f"{name:<10} {pursuit_ms:>10.1f} {xcorr_ms:>9.1f} {jit:>12.2f} {rmse:>10.1f} {cost_us:>9.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        trace = load_trace(sys.argv[1])
+        print(f"Iz: {sys.argv[1]} ({len(trace[0])} ornek)")
+    else:
+        trace = synthetic_trace()
+        print(f"Sentetik iz ({len(trace[0])} ornek, {SYNTHETIC_NOISE_PX:.0f} px gurultu)")
+    benchmark(*trace)
@@ -0,0 +1,164 @@
+"""
+Anahtar Kare + Optik Akış Ölçümü
+- Aynı kareleri farklı KEYFRAME_INTERVAL değerleriyle IrisFlowTracker'dan geçirir
+- Her akış karesi o karenin referans noktalarıyla karşılaştırılır (iris hatası)
+- Kare başına maliyet (anahtar karede FaceMesh, arada akış) ve bundan çıkan
+  en yüksek örnek hızı raporlanır
+- Sentetik kaynakta referans kaynağın gerçek göz noktalarıdır, FaceMesh
+  süresi `--mesh-ms` ile verilir; video / resim klasöründe referans her
+  karede çalıştırılan gerçek FaceMesh'tir (MediaPipe gerekir)
+
+Kullanım:
+    python benchmark_iris_flow.py                         # sentetik, 600 kare
+    python benchmark_iris_flow.py --source video.mp4      # gerçek FaceMesh ile
+    python benchmark_iris_flow.py --intervals 1,2,3,5 --mesh-ms 25
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from frame_sources import SyntheticFaceSource, open_frame_source
+from iris_flow import IrisFlowTracker
+from landmark_adapter import LandmarkAdapter, iris_position
+from lazy_imports import LazyModule
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+BENCH_FRAMES = 600
+BENCH_SCREEN = (1280, 720)
+BENCH_INTERVALS = (1, 2, 3, 5)
+SYNTHETIC_MESH_MS = 20.0  # Sentetik kaynakta varsayılan FaceMesh süresi (tipik CPU değeri)
+
+LANDMARK_INDICES = {
+    'left_iris_center': 468, 'right_iris_center': 473,
+    'left_eye_left': 33, 'left_eye_right': 133,
+    'right_eye_left': 362, 'right_eye_right': 263,
+    'left_eye_top': 159, 'left_eye_bottom': 145,
+    'right_eye_top': 386, 'right_eye_bottom': 374,
+}
+
+mp = LazyModule('mediapipe')
+
+
+# ============================================
+# REFERANS NOKTALAR
+# ============================================
+
+class SyntheticReference:
+    """Sentetik kaynağın gerçek göz noktaları; FaceMesh süresi sabit kabul edilir"""
+
+    def __init__(self, mesh_ms):
+        self.mesh_ms = mesh_ms
+
+    def __call__(self, source, index, frame):
+        return source.eye_points(index), self.mesh_ms
+
+
+class FaceMeshReference:
+    """Her karede tam kare FaceMesh; süresi ölçülür"""
+
+    def __init__(self):
+        self.face_mesh = mp.solutions.face_mesh.FaceMesh(max_num_faces=1, refine_landmarks=True)
+        self.adapter = LandmarkAdapter(LANDMARK_INDICES)
+
+    def __call__(self, source, index, frame):
+        rgb = frame[:, :, ::-1].copy()
+        start = time.perf_counter()
+        results = self.face_mesh.process(rgb)
+        mesh_ms = (time.perf_counter() - start) * 1000
+        if not results.multi_face_landmarks:
+            return None, mesh_ms
+        return self.adapter.to_array(results.multi_face_landmarks[0].landmark), mesh_ms
+
+
+# ============================================
+# ÖLÇÜM
+# ============================================
+
+def run_interval(spec, reference, interval, n_frames):
+    """Tek aralık için: akış istatistikleri, iris hatası ve kare başına maliyet"""
+    source = open_frame_source(spec, *BENCH_SCREEN)
+    if isinstance(source, SyntheticFaceSource):
+        source.frame_count = n_frames
+    source.start()
+    tracker = IrisFlowTracker(interval)
+    errors = []
+    cost_ms = []
+    index = 0
+    try:
+        while index < n_frames:
+            ret, frame, _ = source.read_with_timestamp()
+            if not ret:
+                break
+            points, mesh_ms = reference(source, index, frame)
+            index += 1
+            if points is None:
+                tracker.reset()
+                cost_ms.append(mesh_ms)
+                continue
+
+            if interval > 1 and not tracker.needs_keyframe():
+                start = time.perf_counter()
+                tracked = tracker.track(frame)
+                flow_ms = (time.perf_counter() - start) * 1000
+                if tracked is not None:
+                    estimate = iris_position(tracked)
+                    truth = iris_position(points)
+                    errors.append(np.hypot(estimate[0] - truth[0], estimate[1] - truth[1]))
+                    cost_ms.append(flow_ms)
+                    continue
+                # Kayma: aynı karede FaceMesh
+                tracker.mark_forced()
+                mesh_ms += flow_ms
+            tracker.set_keyframe(frame, points)
+            cost_ms.append(mesh_ms)
+    finally:
+        source.release()
+
+    stats = tracker.get_stats()
+    mean_cost = float(np.mean(cost_ms)) if cost_ms else float('nan')
+    return {
+        'frames': index,
+        'flow_rate': stats['flow_rate'] if interval > 1 else 0.0,
+        'forced': stats['forced_keyframes'],
+        'iris_error': float(np.mean(errors)) if errors else 0.0,
+        'iris_error_p95': float(np.percentile(errors, 95)) if errors else 0.0,
+        'cost_ms': mean_cost,
+        'max_rate': 1000.0 / mean_cost if mean_cost > 0 else float('inf'),
+    }
+
+
+def benchmark(spec, intervals, n_frames, mesh_ms):
+    if isinstance(spec, str) and spec.startswith('synthetic'):
+        reference = SyntheticReference(mesh_ms)
+        print(f"Sentetik kaynak, {n_frames} kare, FaceMesh {mesh_ms:.1f} ms varsayildi\n")
+    else:
+        reference = FaceMeshReference()
+        print(f"Kaynak: {spec}, referans: her karede FaceMesh\n")
+
+    print(f"{'Aralik':>6} {'Akis(%)':>8} {'Kayma':>6} {'IrisHata':>9} {'p95':>8} {'ms/kare':>8} {'EnFazla Hz':>11}")
+    print("-" * 62)
+    results = {}
+    for interval in intervals:
+        r = run_interval(spec, reference, interval, n_frames)
+        results[interval] = r
+        print(f"{interval:>6} {r['flow_rate']:>8.0f} {r['forced']:>6} {r['iris_error']:>9.4f} "
+              f"{r['iris_error_p95']:>8.4f} {r['cost_ms']:>8.2f} {r['max_rate']:>11.1f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Anahtar kare + optik akis: ornek hizi ve iris hatasi")
+    parser.add_argument('--source', default='synthetic', help="synthetic[:fps], video dosyasi veya resim klasoru")
+    parser.add_argument('--frames', type=int, default=BENCH_FRAMES)
+    parser.add_argument('--intervals', default=','.join(str(i) for i in BENCH_INTERVALS),
+                        help="Virgulle ayrilmis KEYFRAME_INTERVAL degerleri (1 = her kare FaceMesh)")
+    parser.add_argument('--mesh-ms', type=float, default=SYNTHETIC_MESH_MS,
+                        help="Sentetik kaynakta FaceMesh suresi (ms)")
+    args = parser.parse_args()
+    benchmark(args.source, [int(i) for i in args.intervals.split(',')], args.frames, args.mesh_ms)
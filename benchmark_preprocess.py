@@ -0,0 +1,185 @@
+"""
+Kare Ön İşleme Bellek Ölçümü
+- Eski yol (cv2.flip + yeni RGB dizi + yeni landmark dizisi) ile yeniden kullanılan
+  tamponlu yolu aynı sentetik kareler üzerinde karşılaştırır
+- Her adımın kare başına yeni bellek ayırıp ayırmadığı tracemalloc ile sayılır
+- Kare başına süre (p50 / p99) ve çöp toplayıcı çalışma sayısı raporlanır
+
+Kullanım:
+    python benchmark_preprocess.py            # 600 kare, 640 px çıkarım genişliği
+    python benchmark_preprocess.py 1200 960
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from face_roi import to_inference_rgb
+from frame_buffers import FrameBuffer
+from frame_sources import SyntheticFaceSource
+from landmark_adapter import LandmarkAdapter
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+BENCH_FRAMES = 600
+BENCH_INFERENCE_WIDTH = 640
+BENCH_SCREEN = (1280, 720)
+BENCH_UNIQUE_FRAMES = 60  # Bellekte tutulan farklı sentetik kare sayısı
+
+LANDMARK_INDICES = {
+    'left_iris_center': 468, 'right_iris_center': 473,
+    'left_eye_left': 33, 'left_eye_right': 133,
+    'right_eye_left': 362, 'right_eye_right': 263,
+    'left_eye_top': 159, 'left_eye_bottom': 145,
+    'right_eye_top': 386, 'right_eye_bottom': 374,
+}
+
+
+# Adımın çıktısının tutulduğu anahtar (ayırma kontrolü için)
+STEP_OUTPUTS = {
+    'flip': 'display', 'resize': 'small', 'cvtColor': 'rgb',
+    'resize+cvtColor': 'rgb', 'landmarks': 'points',
+}
+
+
+class _Landmark:
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+# ============================================
+# ÖN İŞLEME YOLLARI
+# ============================================
+
+def legacy_steps(width):
+    """Eski yol: ayna kopya, küçültme ve renk dönüşümü yeni dizilere, yeni landmark dizisi"""
+    adapter = LandmarkAdapter(LANDMARK_INDICES)
+
+    def flip(state):
+        state['display'] = cv2.flip(state['frame'], 1)
+
+    def resize(state):
+        image = state['display']
+        h, w = image.shape[:2]
+        state['small'] = cv2.resize(image, (width, int(h * width / w)), interpolation=cv2.INTER_AREA)
+
+    def convert(state):
+        state['rgb'] = cv2.cvtColor(state['small'], cv2.COLOR_BGR2RGB)
+
+    def landmarks(state):
+        state['points'] = adapter.to_array(state['landmarks'])
+
+    return [('flip', flip), ('resize', resize), ('cvtColor', convert), ('landmarks', landmarks)]
+
+
+def buffered_steps(width):
+    """Tamponlu yol: ayna sadece ekran için dst= ile, çıkarım aynalanmamış karede"""
+    adapter = LandmarkAdapter(LANDMARK_INDICES, mirror=True)
+    display_buffer, rgb_buffer, scratch_buffer = FrameBuffer(), FrameBuffer(), FrameBuffer()
+    points_buffer = np.empty((len(adapter.indices), 3))
+
+    def flip(state):
+        frame = state['frame']
+        state['display'] = cv2.flip(frame, 1, dst=display_buffer.view(frame.shape))
+
+    def preprocess(state):
+        state['rgb'] = to_inference_rgb(state['frame'], width, rgb_buffer, scratch_buffer)
+
+    def landmarks(state):
+        state['points'] = adapter.to_array(state['landmarks'], points_buffer)
+
+    return [('flip', flip), ('resize+cvtColor', preprocess), ('landmarks', landmarks)]
+
+
+# ============================================
+# ÖLÇÜM
+# ============================================
+
+def make_inputs():
+    """Sentetik kareler ve sahte landmark listesi"""
+    source = SyntheticFaceSource(*BENCH_SCREEN, frame_count=BENCH_UNIQUE_FRAMES).start()
+    frames = []
+    while True:
+        ret, frame, _ = source.read_with_timestamp()
+        if not ret:
+            break
+        frames.append(frame)
+    source.release()
+    rng = np.random.default_rng(0)
+    landmarks = [_Landmark(*rng.uniform(0.3, 0.7, 3)) for _ in range(478)]
+    return frames, landmarks
+
+
+def count_allocations(steps, frames, landmarks, n_frames):
+    """Adım başına yeni dizi ayrılan kare oranı ve kare başına geçici bayt
+
+    Önceki çıktı adım sonunda bırakıldığından net fark sıfır kalır; bu yüzden
+    adım içindeki tepe bellek çıktının boyutuyla karşılaştırılır.
+    """
+    state = {'landmarks': landmarks}
+    for frame in frames[:2]:  # Tamponlar ilk karelerde oluşur
+        state['frame'] = frame
+        for _, step in steps:
+            step(state)
+
+    allocs = {name: 0 for name, _ in steps}
+    total_bytes = 0
+    tracemalloc.start()
+    for i in range(n_frames):
+        state['frame'] = frames[i % len(frames)]
+        for name, step in steps:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            step(state)
+            _, peak = tracemalloc.get_traced_memory()
+            transient = peak - before
+            output = state[STEP_OUTPUTS[name]]
+            if transient >= output.nbytes:
+                allocs[name] += 1
+            total_bytes += transient
+    tracemalloc.stop()
+    return {name: count / n_frames for name, count in allocs.items()}, total_bytes / n_frames
+
+
+def time_steps(steps, frames, landmarks, n_frames):
+    """Kare başına süre (ms) ve çöp toplayıcı çalışma sayısı"""
+    state = {'landmarks': landmarks}
+    durations = np.empty(n_frames)
+    collections_before = sum(s['collections'] for s in gc.get_stats())
+    for i in range(n_frames):
+        state['frame'] = frames[i % len(frames)]
+        start = time.perf_counter_ns()
+        for _, step in steps:
+            step(state)
+        durations[i] = (time.perf_counter_ns() - start) / 1e6
+    collections = sum(s['collections'] for s in gc.get_stats()) - collections_before
+    return np.percentile(durations, 50), np.percentile(durations, 99), collections
+
+
+def benchmark(n_frames=BENCH_FRAMES, width=BENCH_INFERENCE_WIDTH):
+    frames, landmarks = make_inputs()
+    print(f"{n_frames} kare, {BENCH_SCREEN[0]}x{BENCH_SCREEN[1]} -> {width} px\n")
+    for title, make_steps in (("Eski yol", legacy_steps), ("Tamponlu yol", buffered_steps)):
+        allocs, bytes_per_frame = count_allocations(make_steps(width), frames, landmarks, n_frames)
+        p50, p99, collections = time_steps(make_steps(width), frames, landmarks, n_frames)
+        print(f"{title}:")
+        for name, rate in allocs.items():
+            print(f"  {name:<16} yeni dizi: %{rate * 100:.0f} kare")
+        print(f"  Kare basina: {sum(allocs.values()):.2f} yeni dizi, {bytes_per_frame / 1024:.1f} KB gecici bellek")
+        print(f"  Sure: p50 {p50:.3f} ms, p99 {p99:.3f} ms, GC: {collections}\n")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    benchmark(*args)
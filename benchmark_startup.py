@@ -0,0 +1,128 @@
+"""
+Açılış Süresi Ölçümü
+- `main.py` yeni bir Python sürecinde başlatılır; süreç oluşturma anından ana
+  menünün ilk karesinin çizilmesine kadar geçen süre ölçülür
+- İlk `cv2.imshow` çağrısı yakalanır (pencere açılmaz), menü döngüsü orada kesilir
+- MediaPipe'ın menüden önce yüklenmesi gerileme sayılır
+- Sonuçlar results/startup_benchmark.csv dosyasına eklenir; medyan bütçeyi
+  aşarsa çıkış kodu 1 olur
+
+Kullanım:
+    python benchmark_startup.py            # 5 tekrar
+    python benchmark_startup.py 10         # 10 tekrar
+    python benchmark_startup.py --eager    # MediaPipe önceden yüklenerek (karşılaştırma)
+"""
+
+import csv
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+STARTUP_RUNS = 5
+STARTUP_BUDGET_MS = 1500.0  # İlk menü karesi için kabul edilen en uzun medyan süre
+STARTUP_RESULTS_FILE = "results/startup_benchmark.csv"
+
+# Alt süreçte çalışan ölçüm kodu: ilk imshow çağrısında menü döngüsünden çıkılır
+_CHILD_CODE = r'''
+import sys
+import time
+
+import cv2
+
+class _FirstFrame(Exception):
+    pass
+
+def _imshow(name, image):
+    raise _FirstFrame
+
+cv2.imshow = _imshow
+if "--eager" in sys.argv:
+    import mediapipe
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+try:
+    main.show_main_menu()
+except _FirstFrame:
+    pass
+done = time.perf_counter()
+print(time.time(), imported - start, done - imported, "mediapipe" in sys.modules)
+'''
+
+
+# ============================================
+# ÖLÇÜM
+# ============================================
+
+def measure_once(eager=False):
+    """Tek açılış: (toplam ms, main içe aktarma ms, menü çizimi ms, mediapipe yüklendi mi)"""
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    args = [sys.executable, "-c", _CHILD_CODE] + (["--eager"] if eager else [])
+    spawn_time = time.time()
+    result = subprocess.run(args, cwd=repo_dir, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Alt surec hatasi:\n{result.stderr}")
+
+    # Son satır ölçüm satırıdır (öncesinde uygulamanın uyarıları olabilir)
+    first_frame_time, import_s, menu_s, mediapipe_loaded = result.stdout.strip().splitlines()[-1].split()
+    total_ms = (float(first_frame_time) - spawn_time) * 1000
+    return total_ms, float(import_s) * 1000, float(menu_s) * 1000, mediapipe_loaded == "True"
+
+
+def save_result(runs, median_ms, max_ms, mediapipe_loaded, eager):
+    """Sonucu geçmiş dosyasına ekle"""
+    os.makedirs(os.path.dirname(STARTUP_RESULTS_FILE), exist_ok=True)
+    file_exists = os.path.isfile(STARTUP_RESULTS_FILE)
+    try:
+        with open(STARTUP_RESULTS_FILE, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if not file_exists:
+                writer.writerow(["Tarih", "Tekrar", "MedyanMs", "MaksMs", "MediaPipeYuklu", "Mod"])
+            writer.writerow([datetime.now().strftime('%Y-%m-%d %H:%M:%S'), runs,
+                             f"{median_ms:.1f}", f"{max_ms:.1f}", mediapipe_loaded,
+                             "eager" if eager else "lazy"])
+    except PermissionError:
+        print(f"  UYARI: {STARTUP_RESULTS_FILE} kaydedilemedi!")
+
+
+def benchmark(runs=STARTUP_RUNS, eager=False):
+    """Açılışı `runs` kez ölç, tabloyu yazdır; bütçe içindeyse True"""
+    print(f"{'#':>3} {'Toplam(ms)':>11} {'import main':>12} {'Menu(ms)':>9} {'MediaPipe':>10}")
+    print("-" * 49)
+    totals = []
+    mediapipe_loaded = False
+    for i in range(runs):
+        total_ms, import_ms, menu_ms, loaded = measure_once(eager)
+        totals.append(total_ms)
+        mediapipe_loaded |= loaded
+        print(f"{i + 1:>3} {total_ms:>11.1f} {import_ms:>12.1f} {menu_ms:>9.1f} {'evet' if loaded else 'hayir':>10}")
+
+    median_ms = float(np.median(totals))
+    max_ms = max(totals)
+    print(f"\nIlk menu karesi: medyan {median_ms:.1f} ms, en kotu {max_ms:.1f} ms "
+          f"(butce {STARTUP_BUDGET_MS:.0f} ms)")
+    save_result(runs, median_ms, max_ms, mediapipe_loaded, eager)
+
+    ok = median_ms <= STARTUP_BUDGET_MS
+    if not ok:
+        print("GERILEME: acilis suresi butceyi asti!")
+    if mediapipe_loaded and not eager:
+        print("GERILEME: MediaPipe menu acilmadan yuklendi!")
+        ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    eager_mode = "--eager" in sys.argv
+    counts = [arg for arg in sys.argv[1:] if arg.isdigit()]
+    run_count = int(counts[0]) if counts else STARTUP_RUNS
+    sys.exit(0 if benchmark(run_count, eager_mode) else 1)
@@ -0,0 +1,121 @@
+"""
+Stage 1 Hedef Motoru Karşılaştırması
+- Eski liste tabanlı hedefler ([x, y, r, isim, renk, dx, dy]) ile TargetField
+  dizi deposunu aynı hedef sayılarında karşılaştırır
+- Kare başına hareket + sekme, çizim ve tıklama testi süreleri ayrı ölçülür
+
+Kullanım:
+    python benchmark_targets.py              # 4, 100, 400, 1000 hedef
+    python benchmark_targets.py 400 2000
+"""
+
+import itertools
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from target_field import TargetField
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+BENCH_COUNTS = (4, 100, 400, 1000)
+BENCH_FRAMES = 300
+BENCH_CLICKS = 2000
+WIDTH, HEIGHT = 1000, 800
+PALETTE = {
+    "pembe": (180, 105, 240),
+    "sari": (0, 255, 255),
+    "mavi": (255, 0, 0),
+    "yesil": (106, 187, 106),
+}
+
+
+# ============================================
+# ESKİ YOL (LİSTE)
+# ============================================
+
+def legacy_targets(count, rng):
+    names = list(PALETTE)
+    targets = []
+    for i in range(count):
+        name = names[i % len(names)]
+        targets.append([float(rng.integers(100, WIDTH - 100)), float(rng.integers(150, HEIGHT - 100)),
+                        int(rng.integers(8, 17)), name, PALETTE[name],
+                        float(rng.choice((-3, 3))), float(rng.choice((-3, 3)))])
+    return targets
+
+
+def legacy_step(targets):
+    for t in targets:
+        t[0] += t[5]
+        t[1] += t[6]
+        if t[0] - t[2] <= 0 or t[0] + t[2] >= WIDTH:
+            t[5] *= -1
+        if t[1] - t[2] <= 100 or t[1] + t[2] >= HEIGHT:
+            t[6] *= -1
+
+
+def legacy_draw(targets, screen):
+    for t in targets:
+        cv2.circle(screen, (int(t[0]), int(t[1])), t[2], t[4], -1)
+
+
+def legacy_hit(targets, x, y):
+    for i, t in enumerate(targets):
+        if (x - t[0]) ** 2 + (y - t[1]) ** 2 <= t[2] ** 2:
+            return i
+    return -1
+
+
+# ============================================
+# ÖLÇÜM
+# ============================================
+
+def field_targets(count):
+    field = TargetField(PALETTE, (0, 100, WIDTH, HEIGHT), seed=0)
+    names = list(PALETTE)
+    for i, name in enumerate(names):
+        field.spawn(count // len(names) + (i < count % len(names)), name,
+                    (100, 150, WIDTH - 100, HEIGHT - 100), (8, 16), 3.0)
+    return field
+
+
+def time_per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def benchmark(counts=BENCH_COUNTS):
+    rng = np.random.default_rng(0)
+    screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    clicks = rng.integers((0, 100), (WIDTH, HEIGHT), (BENCH_CLICKS, 2)).tolist()
+    click_iter = itertools.cycle(clicks)
+
+    print(f"{'Hedef':>6} {'Yol':<8} {'Hareket(us)':>12} {'Cizim(us)':>10} {'Tiklama(us)':>12}")
+    print("-" * 52)
+    for count in counts:
+        targets = legacy_targets(count, rng)
+        field = field_targets(count)
+        rows = (
+            ("liste", lambda: legacy_step(targets), lambda: legacy_draw(targets, screen),
+             lambda: legacy_hit(targets, *next(click_iter))),
+            ("dizi", field.step, lambda: field.draw(screen),
+             lambda: field.hit_test(*next(click_iter))),
+        )
+        for name, step, draw, hit in rows:
+            step_us = time_per_call(step, BENCH_FRAMES)
+            draw_us = time_per_call(draw, BENCH_FRAMES)
+            hit_us = time_per_call(hit, BENCH_FRAMES)
+            print(f"{count:>6} {name:<8} {step_us:>12.1f} {draw_us:>10.1f} {hit_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    counts = [int(a) for a in sys.argv[1:]] or BENCH_COUNTS
+    benchmark(counts)
@@ -4,14 +4,46 @@ Göz Odak Takip Oyunu (MediaPipe ile Gerçek Göz Takibi)
 - Kalibrasyon ile ekran koordinatlarına eşler
 - Hareket eden topu gözlerinizle takip edin
 - 1 saniye odaklanma = +5 puan
+- Oturum landmark izi olarak kaydedilip kamerasız yeniden oynatılabilir
+
+Kullanım:
+    python eye_focus_trainer.py                        # canlı oyun
+    python eye_focus_trainer.py --record iz.gztr       # canlı oyun + iz kaydı
+    python eye_focus_trainer.py --replay iz.gztr       # izi en yüksek hızda oynat
+    python eye_focus_trainer.py --replay iz.gztr --realtime
+    python eye_focus_trainer.py --source video.mp4 --no-display  # kayıtlı girdiyle toplu çalıştırma
+    python eye_focus_trainer.py --source synthetic:60 --no-display
+    python eye_focus_trainer.py --players 2                # tek kamerada 2-4 oyuncu
 """
 
+import argparse
 import cv2
 import numpy as np
-import mediapipe as mp
 import random
 import time
-from collections import deque
+from frame_sources import open_frame_source
+from inference_worker import FaceMeshWorker
+from face_roi import FaceROITracker, to_inference_rgb
+from landmark_adapter import LandmarkAdapter, iris_position
+from frame_clock import FrameClock, REFERENCE_FPS
+from game_loop import GameLoop
+from game_rules import FocusRule, FOCUS_SUCCESS, FOCUS_LOST, move_ball
+from gaze_calibration import GazeMapping, apply_mappings, make_calibration_grid
+from gaze_filters import make_gaze_filter
+from ui_layers import LayerCache
+from landmark_trace import TraceWriter, TraceMapping, read_trace
+from latency_profiler import LatencyProfiler
+from quality_governor import FrameBudgetGovernor
+from iris_flow import IrisFlowTracker
+from face_presence import FacePresenceMonitor
+from lazy_imports import LazyModule, module_available
+from frame_buffers import FrameBuffer
+from multi_player import FaceAssigner, face_centers, MULTI_PLAYER_MIN, MULTI_PLAYER_MAX
+
+# MediaPipe sadece canlı takip için gerekli (iz oynatma onsuz çalışır);
+# içe aktarma ilk FaceMesh oluşturulurken yapılır
+MEDIAPIPE_AVAILABLE = module_available('mediapipe')
+mp = LazyModule('mediapipe')
 
 
 # ============================================
@@ -24,7 +56,8 @@ SCREEN_HEIGHT = 720
 
 # Top özellikleri
 BALL_RADIUS = 45
-BALL_SPEED_OPTIONS = [-5, -4, -3, 3, 4, 5]
+BALL_SPEED_OPTIONS = [-5, -4, -3, 3, 4, 5]  # REFERENCE_FPS'te piksel/kare
+BALL_UPDATE_RATE = 60  # Hz - topun sabit fizik adımı
 
 # Odak kontrolü
 FOCUS_THRESHOLD = 100  # Piksel cinsinden odak mesafesi
@@ -32,20 +65,44 @@ FOCUS_REQUIRED_TIME = 1.0  # Saniye
 POINT_REWARD = 5
 
 # Smoothing ve stabilizasyon
-SMOOTHING_FACTOR = 0.22  # Daha hızlı tepki - rahat takip için
-GAZE_HISTORY_SIZE = 6  # Daha az gecikme
+GAZE_FILTER = 'one_euro'  # 'one_euro', 'kalman' veya 'legacy' (eski ağırlıklı ortalama)
 
 # Odak kaybı toleransı (stabilizasyon için)
 FOCUS_LOSS_TOLERANCE = 0.5  # Saniye - küçük refleksleri tolere et
 FOCUS_DECAY_RATE = 0.3  # Odak kaybında ne kadar hızlı düşsün
 
+# Kare kaynağı: kamera indeksi, video dosyası, resim klasörü veya 'synthetic[:fps]'
+FRAME_SOURCE = 0
+
+# Gecikme ölçümü (P tuşu ile ekran paneli, oturum sonunda histogram dosyası)
+LATENCY_PROFILING = True
+
+# Kare süresi bütçesi: aşılırsa FaceMesh çözünürlüğü düşürülür, pay oluşunca geri artırılır
+ADAPTIVE_QUALITY = True
+FRAME_BUDGET_MS = 33.0
+
 # MediaPipe güven eşikleri
 DETECTION_CONFIDENCE = 0.7
 TRACKING_CONFIDENCE = 0.7
+# Çıkarım modu:
+#   'pipelined' - FaceMesh ayrı thread'de, çizim son bilinen iris ile yapılır
+#   'keyframe'  - senkron; her KEYFRAME_INTERVAL karede FaceMesh, arada optik akış (sadece tek oyuncu)
+#   'sync'      - her karede senkron FaceMesh
+INFERENCE_MODE = 'pipelined'
+INFERENCE_MODES = ('pipelined', 'keyframe', 'sync')
+ROI_TRACKING = True  # Yüz bulunduktan sonra sadece yüz bölgesi küçültülerek işlenir
+KEYFRAME_INTERVAL = 3  # 'keyframe' modunda FaceMesh aralığı (kare)
+FACE_ABSENT_POWER_SAVE = True  # Yüz yokken algılama düşük hızda ve küçük karede yapılır
 
 # Kalibrasyon
+CALIBRATION_GRID = 9  # Kalibrasyon nokta sayısı: 5, 9 veya 16
 CALIBRATION_HOLD_TIME = 2.0  # Saniye
 CALIBRATION_STABILITY_THRESHOLD = 0.04  # İris hareketi toleransı (gevşetildi)
+CALIBRATION_UNSTABLE_DECAY = 1.5  # Saniye/saniye - bakış sabit değilken ilerleme kaybı
+CALIBRATION_LOST_DECAY = 3.0  # Saniye/saniye - göz bulunamazken ilerleme kaybı
+CALIBRATION_STABLE_SAMPLES = 8  # Stabilite kontrolü ve ortalama için son örnek sayısı
+CALIBRATION_DIM_ALPHA = 0.4  # Kalibrasyonda kamera görüntüsünün parlaklık oranı
+CALIBRATION_DIM_COLOR = 20  # Karartma rengi (gri seviye)
 
 # Renkler (BGR formatında)
 COLORS = {
@@ -62,6 +119,9 @@ COLORS = {
     'dark_gray': (50, 50, 50),
 }
 
+# Çok oyunculu mod: oyuncu sırasına göre top / bakış / etiket rengi
+PLAYER_COLORS = (COLORS['magenta'], COLORS['cyan'], COLORS['yellow'], COLORS['orange'])
+
 # MediaPipe Landmark indeksleri
 LANDMARK_INDICES = {
     'left_iris_center': 468,
@@ -102,37 +162,103 @@ def clamp(value, min_val, max_val):
 # ============================================
 
 class EyeFocusTrainer:
-    def __init__(self):
-        self._init_camera()
-        self._init_mediapipe()
+    max_faces = 1  # FaceMesh'in aradığı en fazla yüz (çok oyunculu alt sınıf artırır)
+
+    def __init__(self, headless=False, record_path=None, source=FRAME_SOURCE, realtime=False,
+                 inference_mode=INFERENCE_MODE):
+        """`headless=True`: kamera, MediaPipe ve çizim olmadan (iz oynatma için)
+
+        `source` open_frame_source tanımıdır; `realtime` kayıtlı kaynakları
+        kendi FPS'lerinde, aksi halde işlenebildiği en yüksek hızda verir.
+        `inference_mode` INFERENCE_MODES'tan biridir.
+        """
+        if inference_mode not in INFERENCE_MODES:
+            raise ValueError(f"Bilinmeyen cikarim modu: {inference_mode} (secenekler: {INFERENCE_MODES})")
+        self.inference_mode = inference_mode
+        self.clock = FrameClock()  # Tüm zamanlayıcılar için tek saat
+        self.loop = GameLoop(BALL_UPDATE_RATE)  # Top fiziği; kamera hızında döner, FPS sınırı yok
+        self.profiler = LatencyProfiler(enabled=LATENCY_PROFILING)
+        self.screen_width = SCREEN_WIDTH
+        self.screen_height = SCREEN_HEIGHT
+        self.cap = None
+        self.face_mesh = None
+        self.roi_tracker = None
+        self.inference = None
+        self.governor = None
+        self.flow_tracker = None
+        self.presence = None
+        self.inference_width = None  # Tam kare çıkarım genişliği (None = doğal)
+        self.inference_ms = None  # Pipeline sonucunun çıkarım süresi (senkron yolda döngü süresine dahil)
+        # Kare başına ön işleme tamponları (ayna görüntü, senkron yol RGB girdisi, küçültme)
+        self._display_buffer = FrameBuffer()
+        self._rgb_buffer = FrameBuffer()
+        self._scratch_buffer = FrameBuffer()
+        if not headless:
+            self._init_camera(source, realtime)
+            self._init_ui_layers()
+            self._init_mediapipe()
         self._init_ball()
         self._init_game_state()
         self._init_eye_tracking()
         self._init_calibration()
+        
+        # Landmark iz kaydı (opsiyonel)
+        self.recorder = None
+        if record_path:
+            self.recorder = TraceWriter(record_path, self.landmark_adapter.landmark_indices,
+                                        self.screen_width, self.screen_height)
     
-    def _init_camera(self):
-        """Kamera başlatma"""
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, SCREEN_WIDTH)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, SCREEN_HEIGHT)
-        self.screen_width = SCREEN_WIDTH
-        self.screen_height = SCREEN_HEIGHT
+    def _init_camera(self, source=FRAME_SOURCE, realtime=False):
+        """Kare kaynağını başlat (arka plan thread'inde okunur/önceden okunur)"""
+        self.cap = open_frame_source(source, self.screen_width, self.screen_height, realtime=realtime).start()
+    
+    def _init_ui_layers(self):
+        """Sabit arayüz katmanları için önbellek"""
+        self.ui_layers = LayerCache(self.screen_width, self.screen_height)
     
     def _init_mediapipe(self):
         """MediaPipe Face Mesh başlatma"""
         self.mp_face_mesh = mp.solutions.face_mesh
         self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
+            max_num_faces=self.max_faces,
             refine_landmarks=True,
             min_detection_confidence=DETECTION_CONFIDENCE,
             min_tracking_confidence=TRACKING_CONFIDENCE
         )
+        # ROI ve optik akış tek yüz içindir; çok yüzde her kare tam kare işlenir
+        single_face = self.max_faces == 1
+        self.roi_tracker = FaceROITracker(LANDMARK_INDICES.values()) if ROI_TRACKING and single_face else None
+        self.inference = None
+        if self.inference_mode == 'pipelined':
+            self.inference = FaceMeshWorker(self.face_mesh, self.roi_tracker, self.profiler).start()
+        elif self.inference_mode == 'keyframe' and single_face:
+            # Pipeline modunda çıkarım zaten ana döngüyü bekletmez; akış senkron yol içindir
+            self.flow_tracker = IrisFlowTracker(KEYFRAME_INTERVAL)
+        if FACE_ABSENT_POWER_SAVE:
+            self.presence = FacePresenceMonitor()
+        if ADAPTIVE_QUALITY:
+            self.governor = FrameBudgetGovernor(FRAME_BUDGET_MS)
+            self._apply_quality_level()
+    
+    def _apply_quality_level(self):
+        """Çıkarım genişliklerini uygula (denetleyici seviyesi; yüz yokken küçük kare)"""
+        full_width = self.governor.full_width if self.governor is not None else None
+        if self.presence is not None and self.presence.idle:
+            full_width = self.presence.idle_width
+        self.inference_width = full_width
+        if self.roi_tracker is not None:
+            self.roi_tracker.full_width = full_width
+            if self.governor is not None:
+                self.roi_tracker.inference_width = self.governor.roi_width
+        if self.inference is not None:
+            self.inference.max_width = full_width
     
     def _init_ball(self):
         """Top özelliklerini başlat"""
         self.ball_radius = BALL_RADIUS
         self.ball_x = self.screen_width // 2
         self.ball_y = self.screen_height // 2
+        self.ball_prev = (self.ball_x, self.ball_y)  # Önceki fizik adımındaki konum
         self.ball_speed_x = random.choice(BALL_SPEED_OPTIONS)
         self.ball_speed_y = random.choice(BALL_SPEED_OPTIONS)
         self.ball_color = get_random_bright_color()
@@ -140,17 +266,12 @@ class EyeFocusTrainer:
     def _init_game_state(self):
         """Oyun durumunu başlat"""
         self.score = 0
-        self.focus_start_time = None
-        self.focus_duration = 0.0
-        self.is_focused = False
+        # Odak puanlama kuralı (kayıp toleransı ve biriken süre durumu kural içinde)
+        self.focus = FocusRule(FOCUS_THRESHOLD, FOCUS_REQUIRED_TIME, FOCUS_LOSS_TOLERANCE, FOCUS_DECAY_RATE)
         self.warning_message = ""
         self.warning_time = 0
         self.success_message = ""
         self.success_time = 0
-        
-        # Stabilizasyon için ek değişkenler
-        self.focus_loss_start = None  # Odak kaybının başladığı zaman
-        self.accumulated_focus = 0.0  # Biriken odak süresi (toleranslı)
     
     def _init_eye_tracking(self):
         """Göz takip verilerini başlat"""
@@ -158,37 +279,37 @@ class EyeFocusTrainer:
         self.iris_y = 0.5
         self.face_detected = False
         self.eyes_valid = False
+        self.last_points = None  # Son geçerli göz landmark'ları, (N, 3)
+        self.sample_points = None  # Son örneğin ham landmark'ları (yüz yoksa None)
+        # Çıkarım aynalanmamış karede yapılır; noktalar ekrandaki ayna görüntüye çevrilir
+        self.landmark_adapter = LandmarkAdapter(LANDMARK_INDICES, mirror=True)
+        self._points_buffer = np.empty((len(self.landmark_adapter.indices), 3))
+        
+        # Örnek zamanı (iris verisinin geldiği karenin yakalama zamanı)
+        self.sample_seq = 0
+        self.sample_time = self.clock.now
+        self.has_new_sample = False
         
         # Bakış noktası
         self.gaze_x = self.screen_width // 2
         self.gaze_y = self.screen_height // 2
         
-        # Smoothing için geçmiş değerler
-        self.gaze_history_x = deque(maxlen=GAZE_HISTORY_SIZE)
-        self.gaze_history_y = deque(maxlen=GAZE_HISTORY_SIZE)
-        self.prev_gaze_x = self.screen_width // 2
-        self.prev_gaze_y = self.screen_height // 2
+        # Smoothing filtresi (durum filtre içinde önceden ayrılmış)
+        self.gaze_filter = make_gaze_filter(GAZE_FILTER)
     
     def _init_calibration(self):
         """Kalibrasyon verilerini başlat"""
+        grid = make_calibration_grid(CALIBRATION_GRID, self.screen_width, self.screen_height)
         self.calibration_points = {
-            'center': {'screen': (self.screen_width // 2, self.screen_height // 2), 'iris': None},
-            'left': {'screen': (200, self.screen_height // 2), 'iris': None},
-            'right': {'screen': (self.screen_width - 200, self.screen_height // 2), 'iris': None},
-            'top': {'screen': (self.screen_width // 2, 150), 'iris': None},
-            'bottom': {'screen': (self.screen_width // 2, self.screen_height - 150), 'iris': None},
+            name: {'screen': pos, 'label': label, 'iris': None} for name, label, pos in grid
         }
-        self.calibration_order = ['center', 'left', 'right', 'top', 'bottom']
+        self.calibration_order = [name for name, _, _ in grid]
         self.current_calibration_index = 0
         self.is_calibrated = False
         self.calibration_hold_time = 0
         
-        # Kalibrasyon sonuçları
-        self.iris_center = (0.5, 0.5)
-        self.iris_left = None
-        self.iris_right = None
-        self.iris_top = None
-        self.iris_bottom = None
+        # Kalibrasyon sonucu: iris -> ekran eşleme modeli
+        self.gaze_mapping = None
         
         # Kalibrasyon stabilitesi için
         self.calibration_iris_history = []
@@ -197,29 +318,25 @@ class EyeFocusTrainer:
     # TOP KONTROLÜ
     # ============================================
 
-    def update_ball(self):
-        """Topu hareket ettir"""
-        self.ball_x += self.ball_speed_x
-        self.ball_y += self.ball_speed_y
+    def update_ball(self, dt):
+        """Topu bir fizik adımı (`dt` saniye) hareket ettir"""
+        # Hızlar REFERENCE_FPS'te piksel/kare olarak tanımlı
+        step = dt * REFERENCE_FPS
+        self.ball_prev = (self.ball_x, self.ball_y)
+        self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y, bounced = move_ball(
+            self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y,
+            self.ball_radius, self.screen_width, self.screen_height, step)
         
-        # Duvar çarpışmaları
-        if self.ball_x <= self.ball_radius or self.ball_x >= self.screen_width - self.ball_radius:
-            self.ball_speed_x = -self.ball_speed_x
-            self.ball_color = get_random_bright_color()
-            
-        if self.ball_y <= self.ball_radius or self.ball_y >= self.screen_height - self.ball_radius:
-            self.ball_speed_y = -self.ball_speed_y
+        # Duvar çarpışmasında renk değişir
+        if bounced:
             self.ball_color = get_random_bright_color()
-        
-        # Sınırları zorla
-        self.ball_x = clamp(self.ball_x, self.ball_radius, self.screen_width - self.ball_radius)
-        self.ball_y = clamp(self.ball_y, self.ball_radius, self.screen_height - self.ball_radius)
 
     def reset_ball(self):
         """Topu yeni pozisyona taşı"""
         margin = 150
         self.ball_x = random.randint(self.ball_radius + margin, self.screen_width - self.ball_radius - margin)
         self.ball_y = random.randint(self.ball_radius + margin, self.screen_height - self.ball_radius - margin)
+        self.ball_prev = (self.ball_x, self.ball_y)
         self.ball_speed_x = random.choice(BALL_SPEED_OPTIONS)
         self.ball_speed_y = random.choice(BALL_SPEED_OPTIONS)
         self.ball_color = get_random_bright_color()
@@ -229,113 +346,135 @@ class EyeFocusTrainer:
     # ============================================
 
     def get_iris_position(self, landmarks):
-        """İris pozisyonunu hesapla (göz içindeki pozisyon, 0-1 arası)"""
-        idx = LANDMARK_INDICES
-        
-        # Sol göz
-        left_iris = landmarks[idx['left_iris_center']]
-        left_eye_left = landmarks[idx['left_eye_left']]
-        left_eye_right = landmarks[idx['left_eye_right']]
-        left_eye_top = landmarks[idx['left_eye_top']]
-        left_eye_bottom = landmarks[idx['left_eye_bottom']]
-        
-        # Sağ göz
-        right_iris = landmarks[idx['right_iris_center']]
-        right_eye_left = landmarks[idx['right_eye_left']]
-        right_eye_right = landmarks[idx['right_eye_right']]
-        right_eye_top = landmarks[idx['right_eye_top']]
-        right_eye_bottom = landmarks[idx['right_eye_bottom']]
-        
-        # Sol göz X normalize
-        left_eye_width = left_eye_right.x - left_eye_left.x
-        if left_eye_width > 0.005:
-            left_iris_x = (left_iris.x - left_eye_left.x) / left_eye_width
-        else:
+        """İris pozisyonunu hesapla (göz içindeki pozisyon, 0-1 arası)
+
+        `landmarks` MediaPipe landmark listesi veya hazır (N, 3) dizi olabilir.
+        """
+        points = landmarks if isinstance(landmarks, np.ndarray) else self.landmark_adapter.to_array(landmarks)
+        iris_x, iris_y, valid = iris_position(points)
+        
+        if not valid:
             return None, None  # Geçersiz göz tespiti
         
-        # Sol göz Y normalize (göz kapakları arası)
-        left_eye_height = left_eye_bottom.y - left_eye_top.y
-        if left_eye_height > 0.002:
-            left_iris_y = (left_iris.y - left_eye_top.y) / left_eye_height
-        else:
-            return None, None
+        return float(iris_x), float(iris_y)
+
+    def detect_face(self, frame, frame_time=None, display=None):
+        """MediaPipe ile yüz ve göz iris tespiti
+
+        `frame` kamera yönündeki karedir; `display` ekrana çizilecek aynalanmış
+        kopyasıdır (landmark koordinatları ona göredir). Dönen kare `display`'dir.
+        """
+        if frame_time is None:
+            frame_time = self.clock.now
+        if display is None:
+            display = frame
+        self.has_new_sample = False
+        self.inference_ms = None
         
-        # Sağ göz X normalize
-        right_eye_width = right_eye_right.x - right_eye_left.x
-        if right_eye_width > 0.005:
-            right_iris_x = (right_iris.x - right_eye_left.x) / right_eye_width
-        else:
-            return None, None
+        # Yüz yokken algılama sadece belirli aralıklarla yapılır
+        detect = True
+        if self.presence is not None:
+            self.presence.sample_cpu()
+            detect = self.presence.should_detect(self.clock.now)
         
-        # Sağ göz Y normalize
-        right_eye_height = right_eye_bottom.y - right_eye_top.y
-        if right_eye_height > 0.002:
-            right_iris_y = (right_iris.y - right_eye_top.y) / right_eye_height
+        if self.inference is not None:
+            # Pipeline: bu kare worker'a gider, son tamamlanan sonuç kullanılır
+            if detect:
+                self.inference.submit(frame, frame_time)
+            result = self.inference.latest()
+            if result is not None and result.seq != self.sample_seq:
+                self.inference_ms = result.process_time * 1000
+                self._apply_face_result(result.multi_face_landmarks, result.seq, result.timestamp)
+        elif not detect:
+            pass  # Tasarruf modu: bu kare algılanmadan geçer
+        elif self.flow_tracker is not None and not self.flow_tracker.needs_keyframe():
+            # Anahtar kare arası: noktalar optik akışla taşınır, kayma varsa hemen FaceMesh
+            with self.profiler.span('optical_flow'):
+                points = self.flow_tracker.track(display)
+            if points is not None:
+                self._apply_eye_points(points, self.sample_seq + 1, frame_time)
+            else:
+                self.flow_tracker.mark_forced()
+                self._process_keyframe(frame, frame_time, display)
         else:
-            return None, None
+            self._process_keyframe(frame, frame_time, display)
         
-        # İki gözün ortalaması
-        avg_iris_x = (left_iris_x + right_iris_x) / 2
-        avg_iris_y = (left_iris_y + right_iris_y) / 2
+        if self.presence is not None and self.has_new_sample:
+            if self.presence.update(self.face_detected, self.clock.now):
+                self._apply_quality_level()
+                print(f"Algilama modu: {self.presence.describe()}")
         
-        # Değerlerin mantıklı aralıkta olup olmadığını kontrol et
-        if not (0.1 < avg_iris_x < 0.9 and 0.1 < avg_iris_y < 0.9):
-            # Aşırı değerler = muhtemelen hatalı tespit
-            return None, None
+        # Görselleştirme: İris noktalarını çiz (bütçe darken atlanır)
+        draw_landmarks = self.governor is None or self.governor.draw_landmarks
+        if draw_landmarks and self.eyes_valid and self.last_points is not None:
+            h, w, _ = display.shape
+            self._draw_eye_landmarks(display, self.last_points, w, h)
         
-        return avg_iris_x, avg_iris_y
+        return display
+
+    def _process_keyframe(self, frame, frame_time, display):
+        """Senkron yol: kareyi FaceMesh ile işle (akış takibi varsa referansı yenile)"""
+        with self.profiler.span('preprocess'):
+            if self.roi_tracker is not None:
+                rgb_input, roi = self.roi_tracker.prepare(frame, self._rgb_buffer)
+            else:
+                rgb_input = to_inference_rgb(frame, self.inference_width, self._rgb_buffer, self._scratch_buffer)
+                roi = None
+        start_ns = time.perf_counter_ns()
+        results = self.face_mesh.process(rgb_input)
+        self.profiler.record('face_mesh', time.perf_counter_ns() - start_ns)
+        multi_face_landmarks = results.multi_face_landmarks
+        if self.roi_tracker is not None:
+            multi_face_landmarks = self.roi_tracker.finish(multi_face_landmarks, roi, frame.shape)
+        self._apply_face_result(multi_face_landmarks, self.sample_seq + 1, frame_time)
+        if self.flow_tracker is not None:
+            self.flow_tracker.set_keyframe(display, self.last_points)
 
-    def detect_face(self, frame):
-        """MediaPipe ile yüz ve göz iris tespiti"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_mesh.process(rgb_frame)
+    def _apply_face_result(self, multi_face_landmarks, seq, timestamp):
+        """Çıkarım sonucunu göz takip durumuna uygula"""
+        points = None
+        if multi_face_landmarks:
+            points = self.landmark_adapter.to_array(multi_face_landmarks[0].landmark, self._points_buffer)
+        self._apply_eye_points(points, seq, timestamp)
+
+    def _apply_eye_points(self, points, seq, timestamp):
+        """Göz landmark dizisini ((N, 3) veya yüz yoksa None) duruma uygula"""
+        self.sample_seq = seq
+        self.sample_time = timestamp
+        self.sample_points = points
+        self.has_new_sample = True
         
         self.face_detected = False
         self.eyes_valid = False
+        self.last_points = None
         
-        if results.multi_face_landmarks:
-            face_landmarks = results.multi_face_landmarks[0]
+        if points is not None:
             self.face_detected = True
             
-            h, w, _ = frame.shape
-            landmarks = face_landmarks.landmark
-            
             # İris pozisyonunu hesapla
-            iris_x, iris_y = self.get_iris_position(landmarks)
+            iris_x, iris_y = self.get_iris_position(points)
             
             if iris_x is not None and iris_y is not None:
                 self.iris_x = iris_x
                 self.iris_y = iris_y
                 self.eyes_valid = True
-                
-                # Görselleştirme: İris noktalarını çiz
-                self._draw_eye_landmarks(frame, landmarks, w, h)
-        
-        return frame
+                self.last_points = points
 
-    def _draw_eye_landmarks(self, frame, landmarks, w, h):
-        """Göz landmark'larını çiz"""
-        idx = LANDMARK_INDICES
+    def _draw_eye_landmarks(self, frame, points, w, h):
+        """Göz landmark'larını çiz (points: EYE_LANDMARK_ORDER sırasında (N, 3))"""
+        pixels = (points[:, :2] * (w, h)).astype(np.int32)
         
         # İris merkezleri (yeşil)
-        for key in ['left_iris_center', 'right_iris_center']:
-            point = landmarks[idx[key]]
-            px = (int(point.x * w), int(point.y * h))
-            cv2.circle(frame, px, 5, COLORS['green'], -1)
+        for px in pixels[0:2]:
+            cv2.circle(frame, (int(px[0]), int(px[1])), 5, COLORS['green'], -1)
         
         # Göz köşeleri (mavi)
-        corner_keys = ['left_eye_left', 'left_eye_right', 'right_eye_left', 'right_eye_right']
-        for key in corner_keys:
-            point = landmarks[idx[key]]
-            px = (int(point.x * w), int(point.y * h))
-            cv2.circle(frame, px, 3, COLORS['blue'], -1)
+        for px in pixels[2:6]:
+            cv2.circle(frame, (int(px[0]), int(px[1])), 3, COLORS['blue'], -1)
         
         # Göz kapakları (turuncu)
-        eyelid_keys = ['left_eye_top', 'left_eye_bottom', 'right_eye_top', 'right_eye_bottom']
-        for key in eyelid_keys:
-            point = landmarks[idx[key]]
-            px = (int(point.x * w), int(point.y * h))
-            cv2.circle(frame, px, 2, COLORS['orange'], -1)
+        for px in pixels[6:10]:
+            cv2.circle(frame, (int(px[0]), int(px[1])), 2, COLORS['orange'], -1)
 
     # ============================================
     # KALİBRASYON
@@ -351,10 +490,9 @@ class EyeFocusTrainer:
         current_point = self.calibration_points[current_point_name]
         screen_x, screen_y = current_point['screen']
         
-        # Arka plan karart
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (self.screen_width, self.screen_height), (20, 20, 20), -1)
-        frame = cv2.addWeighted(overlay, 0.6, frame, 0.4, 0)
+        # Arka plan karart (yeniden kullanılan tampona tek ölçekleme)
+        frame = self.ui_layers.dim(frame, CALIBRATION_DIM_ALPHA,
+                                   CALIBRATION_DIM_COLOR * (1 - CALIBRATION_DIM_ALPHA))
         
         # Hedef noktayı çiz
         self._draw_calibration_target(frame, screen_x, screen_y)
@@ -364,17 +502,18 @@ class EyeFocusTrainer:
         
         # İlerlemeyi işle
         if self.face_detected and self.eyes_valid:
-            # İris stabilitesini kontrol et
-            self.calibration_iris_history.append((self.iris_x, self.iris_y))
+            # İris stabilitesini kontrol et (sadece yeni örneklerle)
+            if self.has_new_sample:
+                self.calibration_iris_history.append((self.iris_x, self.iris_y))
             
             # Son 15 frame'i tut
             if len(self.calibration_iris_history) > 15:
                 self.calibration_iris_history.pop(0)
             
-            # Stabilite kontrolü - son 8 frame'de iris ne kadar hareket etti?
+            # Stabilite kontrolü - son örneklerde iris ne kadar hareket etti?
             is_stable = True
-            if len(self.calibration_iris_history) >= 8:
-                recent = self.calibration_iris_history[-8:]
+            if len(self.calibration_iris_history) >= CALIBRATION_STABLE_SAMPLES:
+                recent = self.calibration_iris_history[-CALIBRATION_STABLE_SAMPLES:]
                 x_values = [p[0] for p in recent]
                 y_values = [p[1] for p in recent]
                 x_range = max(x_values) - min(x_values)
@@ -386,12 +525,12 @@ class EyeFocusTrainer:
                 is_stable = True  # Yeterli veri yoksa kabul et
             
             if is_stable:
-                self.calibration_hold_time += 1 / 30.0
+                self.calibration_hold_time += self.clock.dt
                 self._draw_calibration_progress(frame)
                 
                 if self.calibration_hold_time >= CALIBRATION_HOLD_TIME:
                     # Stabil pozisyonun ortalamasını al
-                    recent = self.calibration_iris_history[-8:] if len(self.calibration_iris_history) >= 8 else self.calibration_iris_history
+                    recent = self.calibration_iris_history[-CALIBRATION_STABLE_SAMPLES:]
                     avg_x = sum(p[0] for p in recent) / len(recent)
                     avg_y = sum(p[1] for p in recent) / len(recent)
                     self.calibration_points[current_point_name]['iris'] = (avg_x, avg_y)
@@ -400,11 +539,11 @@ class EyeFocusTrainer:
                     self.calibration_iris_history.clear()
             else:
                 # Stabil değil - ilerlemeyi yavaşça azalt
-                self.calibration_hold_time = max(0, self.calibration_hold_time - 0.05)
+                self.calibration_hold_time = max(0, self.calibration_hold_time - CALIBRATION_UNSTABLE_DECAY * self.clock.dt)
                 cv2.putText(frame, "SABIT BAKIN!", (self.screen_width // 2 - 100, self.screen_height // 2 + 80),
                             cv2.FONT_HERSHEY_SIMPLEX, 0.8, COLORS['orange'], 2)
         else:
-            self.calibration_hold_time = max(0, self.calibration_hold_time - 0.1)
+            self.calibration_hold_time = max(0, self.calibration_hold_time - CALIBRATION_LOST_DECAY * self.clock.dt)
             status = "YUZ TESPIT EDILEMIYOR!" if not self.face_detected else "GOZ TESPIT EDILEMIYOR!"
             cv2.putText(frame, status, (self.screen_width // 2 - 200, self.screen_height // 2 + 50),
                         cv2.FONT_HERSHEY_SIMPLEX, 1, COLORS['red'], 3)
@@ -413,30 +552,32 @@ class EyeFocusTrainer:
 
     def _draw_calibration_target(self, frame, x, y):
         """Kalibrasyon hedef noktasını çiz"""
-        pulse = int(20 * np.sin(time.time() * 4) + 60)
+        pulse = int(20 * np.sin(self.clock.now * 4) + 60)
         cv2.circle(frame, (x, y), pulse, (0, 80, 200), -1)
         cv2.circle(frame, (x, y), 45, COLORS['red'], -1)
         cv2.circle(frame, (x, y), 45, COLORS['white'], 4)
         cv2.circle(frame, (x, y), 15, COLORS['white'], -1)
 
-    def _draw_calibration_instructions(self, frame, current_point_name):
-        """Kalibrasyon talimatlarını çiz"""
-        cv2.putText(frame, "KALIBRASYON", (self.screen_width // 2 - 150, 50),
+    def _render_calibration_header(self, canvas):
+        """Sabit kalibrasyon başlığı (bir kez çizilip önbelleğe alınır)"""
+        cv2.putText(canvas, "KALIBRASYON", (self.screen_width // 2 - 150, 50),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.5, COLORS['cyan'], 3)
         
-        cv2.putText(frame, "Sadece GOZLERINIZLE kirmizi noktaya bakin!",
+        cv2.putText(canvas, "Sadece GOZLERINIZLE kirmizi noktaya bakin!",
                     (self.screen_width // 2 - 300, 100),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.9, COLORS['white'], 2)
         
-        cv2.putText(frame, "(Basinizi hareket ettirmeyin, sadece gozlerinizi kullanin)",
+        cv2.putText(canvas, "(Basinizi hareket ettirmeyin, sadece gozlerinizi kullanin)",
                     (self.screen_width // 2 - 350, 140),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, COLORS['gray'], 2)
+
+    def _draw_calibration_instructions(self, frame, current_point_name):
+        """Kalibrasyon talimatlarını çiz"""
+        self.ui_layers.composite(frame, 'calibration_header', self._render_calibration_header)
         
-        point_names = {
-            'center': 'MERKEZ', 'left': 'SOL', 'right': 'SAG',
-            'top': 'YUKARI', 'bottom': 'ASAGI'
-        }
-        progress_text = f"Nokta: {point_names[current_point_name]} ({self.current_calibration_index + 1}/5)"
+        point = self.calibration_points[current_point_name]
+        progress_text = (f"Nokta: {point['label']} "
+                         f"({self.current_calibration_index + 1}/{len(self.calibration_order)})")
         cv2.putText(frame, progress_text, (20, self.screen_height - 60),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.9, COLORS['cyan'], 2)
         
@@ -472,14 +613,21 @@ class EyeFocusTrainer:
                     cv2.FONT_HERSHEY_SIMPLEX, 0.8, COLORS['white'], 2)
 
     def _finish_calibration(self):
-        """Kalibrasyon tamamlandı"""
-        self.iris_center = self.calibration_points['center']['iris']
-        self.iris_left = self.calibration_points['left']['iris']
-        self.iris_right = self.calibration_points['right']['iris']
-        self.iris_top = self.calibration_points['top']['iris']
-        self.iris_bottom = self.calibration_points['bottom']['iris']
+        """Kalibrasyon tamamlandı - eşleme modelini bir kez uydur"""
+        names = [name for name in self.calibration_order if self.calibration_points[name]['iris'] is not None]
+        iris_points = [self.calibration_points[name]['iris'] for name in names]
+        screen_points = [self.calibration_points[name]['screen'] for name in names]
+        
+        self.gaze_mapping = GazeMapping.fit(iris_points, screen_points)
+        if self.gaze_mapping is None:
+            print("Kalibrasyon verisi yetersiz, tekrar deneniyor...")
+            self.reset_calibration()
+            return
+        
         self.is_calibrated = True
-        print("Kalibrasyon tamamlandi!")
+        if self.recorder is not None:
+            self.recorder.write_mapping(self.gaze_mapping.coeffs)
+        print(f"Kalibrasyon tamamlandi! (ortalama hata: {self.gaze_mapping.residual_px:.1f} px)")
 
     # ============================================
     # BAKIŞ NOKTASI HESAPLAMA
@@ -487,150 +635,48 @@ class EyeFocusTrainer:
 
     def calculate_gaze(self):
         """Kalibrasyon verilerine göre bakış noktasını hesapla"""
-        if not self.is_calibrated or not self.eyes_valid:
-            return
-        
-        # Kalibrasyon verilerinin geçerliliğini kontrol et
-        if not all([self.iris_center, self.iris_left, self.iris_right, self.iris_top, self.iris_bottom]):
+        if not self.is_calibrated or not self.eyes_valid or self.gaze_mapping is None:
             return
         
-        # X ekseni normalize
-        center_x = self.iris_center[0]
-        left_x = self.iris_left[0]
-        right_x = self.iris_right[0]
+        # Önceden hesaplanmış katsayılarla tek matris-vektör çarpımı
+        target_x, target_y = self.gaze_mapping.apply(self.iris_x, self.iris_y)
+        target_x = clamp(target_x, 0, self.screen_width)
+        target_y = clamp(target_y, 0, self.screen_height)
         
-        if self.iris_x < center_x:
-            # Sola bakıyor
-            range_x = center_x - left_x
-            norm_x = -(center_x - self.iris_x) / range_x if range_x > 0.001 else 0
-        else:
-            # Sağa bakıyor
-            range_x = right_x - center_x
-            norm_x = (self.iris_x - center_x) / range_x if range_x > 0.001 else 0
-        
-        # Y ekseni normalize
-        center_y = self.iris_center[1]
-        top_y = self.iris_top[1]
-        bottom_y = self.iris_bottom[1]
-        
-        if self.iris_y < center_y:
-            # Yukarı bakıyor
-            range_y = center_y - top_y
-            norm_y = -(center_y - self.iris_y) / range_y if range_y > 0.001 else 0
-        else:
-            # Aşağı bakıyor
-            range_y = bottom_y - center_y
-            norm_y = (self.iris_y - center_y) / range_y if range_y > 0.001 else 0
+        # Filtrele (örnek zamanı ile - kare hızından bağımsız)
+        filtered_x, filtered_y = self.gaze_filter.update(target_x, target_y, self.sample_time)
         
         # Sınırla
-        norm_x = clamp(norm_x, -1.5, 1.5)
-        norm_y = clamp(norm_y, -1.5, 1.5)
-        
-        # Ekran koordinatlarına çevir
-        target_x = int(self.screen_width / 2 + norm_x * (self.screen_width / 2 - 100))
-        target_y = int(self.screen_height / 2 + norm_y * (self.screen_height / 2 - 50))  # Y için daha geniş alan
-        
-        # Geçmiş değerlere ekle
-        self.gaze_history_x.append(target_x)
-        self.gaze_history_y.append(target_y)
-        
-        # Ağırlıklı ortalama (son değerler daha önemli)
-        if len(self.gaze_history_x) >= 3:
-            weights = np.linspace(0.5, 1.0, len(self.gaze_history_x))
-            weights = weights / weights.sum()
-            
-            avg_x = np.average(list(self.gaze_history_x), weights=weights)
-            avg_y = np.average(list(self.gaze_history_y), weights=weights)
-        else:
-            avg_x = target_x
-            avg_y = target_y
-        
-        # Ani büyük sıçramaları sınırla (ama çok kısıtlayıcı olmasın)
-        max_jump = 150  # piksel - makul bir limit
-        delta_x = avg_x - self.prev_gaze_x
-        delta_y = avg_y - self.prev_gaze_y
-        
-        if abs(delta_x) > max_jump:
-            avg_x = self.prev_gaze_x + (max_jump if delta_x > 0 else -max_jump)
-        if abs(delta_y) > max_jump:
-            avg_y = self.prev_gaze_y + (max_jump if delta_y > 0 else -max_jump)
-        
-        # Smoothing uygula
-        self.gaze_x = int(self.prev_gaze_x + (avg_x - self.prev_gaze_x) * SMOOTHING_FACTOR)
-        self.gaze_y = int(self.prev_gaze_y + (avg_y - self.prev_gaze_y) * SMOOTHING_FACTOR)
-        
-        # Sınırla
-        self.gaze_x = clamp(self.gaze_x, 50, self.screen_width - 50)
-        self.gaze_y = clamp(self.gaze_y, 50, self.screen_height - 50)
-        
-        self.prev_gaze_x = self.gaze_x
-        self.prev_gaze_y = self.gaze_y
+        self.gaze_x = int(clamp(filtered_x, 50, self.screen_width - 50))
+        self.gaze_y = int(clamp(filtered_y, 50, self.screen_height - 50))
 
     # ============================================
     # ODAK KONTROLÜ
     # ============================================
 
     def check_focus(self):
-        """Odaklanma durumunu kontrol et - Stabilize edilmiş versiyon"""
+        """Odaklanma durumunu kontrol et - Stabilize edilmiş versiyon (kural: game_rules.FocusRule)"""
         if not self.eyes_valid or not self.is_calibrated:
             # Göz tespit edilemezse tolerans süresi kadar bekle
-            if self.is_focused and self.focus_loss_start is None:
-                self.focus_loss_start = time.time()
-            
-            if self.focus_loss_start:
-                loss_duration = time.time() - self.focus_loss_start
-                if loss_duration > FOCUS_LOSS_TOLERANCE:
-                    self._reset_focus()
+            self.focus.lose_eyes(self.clock.now)
             return
         
-        self.calculate_gaze()
+        # Zamanlama, iris verisinin geldiği karenin zamanına göre yapılır
+        if self.has_new_sample:
+            with self.profiler.span('calculate_gaze'):
+                self.calculate_gaze()
         
         distance = calculate_distance(self.gaze_x, self.gaze_y, self.ball_x, self.ball_y)
+        event = self.focus.update(distance, self.sample_time, self.clock.dt)
         
-        if distance < FOCUS_THRESHOLD:
-            # Odak içinde - kayıp zamanlayıcısını sıfırla
-            self.focus_loss_start = None
-            
-            if not self.is_focused:
-                self.is_focused = True
-                self.focus_start_time = time.time()
-                self.accumulated_focus = 0.0
-            else:
-                self.focus_duration = time.time() - self.focus_start_time
-                self.accumulated_focus = self.focus_duration
-                
-                if self.accumulated_focus >= FOCUS_REQUIRED_TIME:
-                    self.score += POINT_REWARD
-                    self.success_message = f"+{POINT_REWARD} PUAN!"
-                    self.success_time = time.time()
-                    self._reset_focus()
-                    self.reset_ball()
-        else:
-            # Odak dışında - tolerans kontrolü
-            if self.is_focused:
-                if self.focus_loss_start is None:
-                    # İlk kayıp anı
-                    self.focus_loss_start = time.time()
-                else:
-                    loss_duration = time.time() - self.focus_loss_start
-                    
-                    if loss_duration > FOCUS_LOSS_TOLERANCE:
-                        # Tolerans aşıldı - odağı kaybet
-                        if self.accumulated_focus > 0.3:
-                            self.warning_message = "Odak kaybedildi!"
-                            self.warning_time = time.time()
-                        self._reset_focus()
-                    # else: Tolerans içinde - odağı koru, biriken süreyi düşür
-                    elif self.accumulated_focus > 0:
-                        self.accumulated_focus -= FOCUS_DECAY_RATE * (1/30)  # Frame başına azalt
-
-    def _reset_focus(self):
-        """Odak durumunu sıfırla"""
-        self.is_focused = False
-        self.focus_start_time = None
-        self.focus_duration = 0.0
-        self.focus_loss_start = None
-        self.accumulated_focus = 0.0
+        if event == FOCUS_SUCCESS:
+            self.score += POINT_REWARD
+            self.success_message = f"+{POINT_REWARD} PUAN!"
+            self.success_time = self.clock.now
+            self.reset_ball()
+        elif event == FOCUS_LOST:
+            self.warning_message = "Odak kaybedildi!"
+            self.warning_time = self.clock.now
 
     # ============================================
     # ARAYÜZ ÇİZİMİ
@@ -657,27 +703,29 @@ class EyeFocusTrainer:
             cv2.line(frame, (x, y - 50), (x, y + 50), color, 2)
 
     def _draw_ball(self, frame):
-        """Topu çiz"""
-        x, y = int(self.ball_x), int(self.ball_y)
+        """Topu son iki fizik adımı arasındaki konumda çiz"""
+        alpha = self.loop.alpha
+        x = int(self.ball_prev[0] + (self.ball_x - self.ball_prev[0]) * alpha)
+        y = int(self.ball_prev[1] + (self.ball_y - self.ball_prev[1]) * alpha)
         
         cv2.circle(frame, (x, y), self.ball_radius, self.ball_color, -1)
         cv2.circle(frame, (x, y), self.ball_radius, COLORS['white'], 3)
         
         # Odaklanma halesi
-        if self.is_focused:
+        if self.focus.is_focused:
             cv2.circle(frame, (x, y), self.ball_radius + 20, COLORS['green'], 4)
 
     def _draw_top_bar(self, frame):
         """Üst bilgi çubuğunu çiz"""
-        cv2.rectangle(frame, (0, 0), (self.screen_width, 80), (30, 30, 30), -1)
+        self.ui_layers.composite(frame, 'top_bar', self._render_top_bar)
         
         # Skor
         cv2.putText(frame, f"SKOR: {self.score}", (20, 55),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.5, COLORS['green'], 3)
         
         # Odaklanma ilerleme çubuğu
-        if self.is_focused:
-            progress = min(self.focus_duration / FOCUS_REQUIRED_TIME, 1.0)
+        if self.focus.is_focused:
+            progress = min(self.focus.duration / FOCUS_REQUIRED_TIME, 1.0)
             bar_width = 300
             bar_height = 25
             bar_x = self.screen_width // 2 - bar_width // 2
@@ -687,7 +735,7 @@ class EyeFocusTrainer:
             cv2.rectangle(frame, (bar_x, bar_y), (bar_x + int(bar_width * progress), bar_y + bar_height), COLORS['green'], -1)
             cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), COLORS['white'], 2)
             
-            time_text = f"{self.focus_duration:.1f}s"
+            time_text = f"{self.focus.duration:.1f}s"
             cv2.putText(frame, time_text, (bar_x + bar_width + 15, bar_y + 22),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.7, COLORS['white'], 2)
         
@@ -707,20 +755,28 @@ class EyeFocusTrainer:
 
     def _draw_messages(self, frame):
         """Uyarı ve başarı mesajlarını çiz"""
-        if self.warning_message and time.time() - self.warning_time < 1.5:
+        if self.warning_message and self.clock.now - self.warning_time < 1.5:
             cv2.putText(frame, self.warning_message, (self.screen_width // 2 - 150, self.screen_height // 2),
                         cv2.FONT_HERSHEY_SIMPLEX, 1.2, COLORS['red'], 3)
         
-        if self.success_message and time.time() - self.success_time < 1.5:
+        if self.success_message and self.clock.now - self.success_time < 1.5:
             cv2.putText(frame, self.success_message, (self.screen_width // 2 - 100, self.screen_height // 2),
                         cv2.FONT_HERSHEY_SIMPLEX, 2, COLORS['green'], 4)
 
-    def _draw_footer(self, frame):
-        """Alt bilgi çubuğunu çiz"""
+    def _render_top_bar(self, canvas):
+        """Üst çubuk arka planı (sabit katman)"""
+        cv2.rectangle(canvas, (0, 0), (self.screen_width, 80), (30, 30, 30), -1)
+
+    def _render_footer(self, canvas):
+        """Alt bilgi metni (sabit katman)"""
         text = "Mor hedefi topa getirin ve 1sn tutun | R = Yeniden Kalibrasyon | Q = Cikis"
-        cv2.putText(frame, text, (self.screen_width // 2 - 400, self.screen_height - 15),
+        cv2.putText(canvas, text, (self.screen_width // 2 - 400, self.screen_height - 15),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, COLORS['gray'], 2)
 
+    def _draw_footer(self, frame):
+        """Alt bilgi çubuğunu çiz"""
+        self.ui_layers.composite(frame, 'footer', self._render_footer)
+
     # ============================================
     # ANA DÖNGÜ
     # ============================================
@@ -728,60 +784,627 @@ class EyeFocusTrainer:
     def reset_calibration(self):
         """Kalibrasyonu sıfırla"""
         self.is_calibrated = False
+        self.gaze_mapping = None
         self.current_calibration_index = 0
         self.calibration_hold_time = 0
-        self.gaze_history_x.clear()
-        self.gaze_history_y.clear()
+        self.calibration_iris_history.clear()
+        self.gaze_filter.reset()
         for point in self.calibration_points.values():
             point['iris'] = None
+        if self.recorder is not None:
+            self.recorder.write_mapping(None)
         print("Yeniden kalibrasyon baslatiliyor...")
 
-    def run(self):
-        """Ana döngü"""
+    def run(self, display=True):
+        """Ana döngü (`display=False`: pencere açmadan, kaynak bitene kadar)"""
         print("\n" + "=" * 60)
         print("GOZ ODAK TAKIP OYUNU - MediaPipe Edition")
         print("=" * 60)
         print("\nKontroller:")
         print("- Q = Cikis")
         print("- R = Yeniden kalibrasyon")
+        print("- P = Gecikme paneli")
         print("=" * 60 + "\n")
         
+        wall_start = time.perf_counter()
+        profiler = self.profiler
         while True:
-            ret, frame = self.cap.read()
+            loop_start_ns = time.perf_counter_ns()
+            # Canlı kaynakta saat duvar saatidir; kayıtlı kaynakta kare zamanı ile ilerler
+            if self.cap.live:
+                self.clock.tick()
+            capture_start_ns = time.perf_counter_ns()
+            ret, frame, frame_time = self.cap.read_with_timestamp()
+            capture_ns = time.perf_counter_ns() - capture_start_ns
+            profiler.record('capture', capture_ns)
             if not ret:
-                print("Kamera okunamadi!")
+                print("Kamera okunamadi!" if self.cap.live else "Kaynak sona erdi.")
                 break
+            if not self.cap.live:
+                self.clock.tick(frame_time)
             
-            frame = cv2.flip(frame, 1)
-            frame = self.detect_face(frame)
+            # Ayna görüntü sadece ekran için yeniden kullanılan tampona yazılır; çıkarım
+            # kamera yönündeki karede yapılır ve landmark'lar koordinat olarak aynalanır
+            display_frame = cv2.flip(frame, 1, dst=self._display_buffer.view(frame.shape))
+            frame = self.detect_face(frame, frame_time, display_frame)
+            if self.recorder is not None:
+                self._record_frame()
             
-            if not self.is_calibrated:
-                frame = self.run_calibration(frame)
-            else:
-                self.update_ball()
-                self.check_focus()
-                frame = self.draw_ui(frame)
+            frame = self.update_frame(frame)
             
-            cv2.imshow('Goz Odak Takip Oyunu', frame)
+            key = -1
+            if display:
+                profiler.draw_hud(frame)
+                with profiler.span('imshow'):
+                    cv2.imshow('Goz Odak Takip Oyunu', frame)
+                with profiler.span('waitKey'):
+                    key = cv2.waitKey(self.loop.wait_ms()) & 0xFF
+            
+            loop_ns = time.perf_counter_ns() - loop_start_ns
+            profiler.record('frame', loop_ns)
+            self._update_quality((loop_ns - capture_ns) / 1e6)
             
-            key = cv2.waitKey(1) & 0xFF
             if key == ord('q'):
                 break
             elif key == ord('r'):
                 self.reset_calibration()
+            else:
+                profiler.handle_key(key)
+        
+        elapsed = time.perf_counter() - wall_start
+        if elapsed > 0:
+            print(f"Islem hizi: {self.clock.frame_count} kare, {elapsed:.1f} s "
+                  f"({self.clock.frame_count / elapsed:.1f} kare/s)")
+        print(f"Dongu: {self.loop.describe()}")
+        self._cleanup(display)
+
+    def update_frame(self, frame):
+        """Kalibrasyon veya oyun adımını işle, arayüzü çiz"""
+        # Top sadece kalibrasyondan sonra hareket eder
+        self.loop.tick(self.update_ball if self.is_calibrated else None, self.clock.now)
+        if not self.is_calibrated:
+            with self.profiler.span('calibration'):
+                return self.run_calibration(frame)
+        self.check_focus()
+        with self.profiler.span('draw_ui'):
+            return self.draw_ui(frame)
+
+    def _update_quality(self, frame_ms):
+        """Kare süresini bütçe denetleyicisine bildir, gerekirse seviyeyi değiştir"""
+        if self.governor is not None and self.governor.update(frame_ms, self.inference_ms):
+            self._apply_quality_level()
+            print(f"Cikarim kalitesi: {self.governor.describe()}")
+
+    def _record_frame(self):
+        """Bu karenin girdisini (örnek + top durumu) ize yaz"""
+        self.recorder.write_frame(
+            self.clock.now, self.sample_time, self.has_new_sample, self.sample_points,
+            (self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y),
+        )
+
+    # ============================================
+    # İZ OYNATMA
+    # ============================================
+
+    def replay(self, path, realtime=False):
+        """Kayıtlı izi get_iris_position -> calculate_gaze -> check_focus zincirine oynat
+
+        Kamera, MediaPipe ve çizim kullanılmaz. `realtime=False` iken kareler
+        beklemeden işlenir; zamanlayıcılar her durumda kayıtlı zamanları kullanır.
+        """
+        header, records = read_trace(path)
+        if header.landmark_indices != self.landmark_adapter.landmark_indices:
+            raise ValueError("Iz dosyasindaki landmark indeksleri bu surumle uyusmuyor")
+        
+        frames = [r for r in records if not isinstance(r, TraceMapping)]
+        if not frames:
+            return {'frames': 0, 'elapsed': 0.0, 'fps': 0.0, 'score': self.score}
         
-        self._cleanup()
+        t0 = frames[0].t
+        self.clock = FrameClock(start=t0)
+        self.loop = GameLoop(BALL_UPDATE_RATE)  # Adımlar kayıtlı kare zamanlarından aynen çıkar
+        wall_start = time.perf_counter()
+        
+        for record in records:
+            if isinstance(record, TraceMapping):
+                if record.coeffs is None:
+                    self.reset_calibration()
+                else:
+                    self.gaze_mapping = GazeMapping(record.coeffs)
+                    self.is_calibrated = True
+                continue
+            
+            if realtime:
+                delay = (record.t - t0) - (time.perf_counter() - wall_start)
+                if delay > 0:
+                    time.sleep(delay)
+            
+            self.clock.tick(record.t)
+            self.has_new_sample = False
+            if record.new_sample:
+                self._apply_eye_points(record.points, self.sample_seq + 1, record.sample_time)
+            self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y = record.ball
+            
+            self.loop.tick(self.update_ball if self.is_calibrated else None, record.t)
+            if self.is_calibrated:
+                self.check_focus()
+        
+        elapsed = time.perf_counter() - wall_start
+        return {
+            'frames': len(frames),
+            'elapsed': elapsed,
+            'fps': len(frames) / elapsed if elapsed > 0 else 0.0,
+            'score': self.score,
+        }
 
-    def _cleanup(self):
+    def _cleanup(self, display=True):
         """Kaynakları temizle"""
+        capture_stats = self.cap.get_stats()
         self.cap.release()
-        cv2.destroyAllWindows()
+        if display:
+            cv2.destroyAllWindows()
+        if self.inference is not None:
+            self.inference.stop()
         self.face_mesh.close()
+        print(f"Kaynak: {capture_stats['captured']} kare, "
+              f"{capture_stats['dropped']} dusuruldu (%{capture_stats['drop_rate']:.1f})")
+        if self.inference is not None:
+            inference_stats = self.inference.get_stats()
+            print(f"Cikarim: {inference_stats['processed']} kare islendi, "
+                  f"{inference_stats['skipped']} atlandi")
+        if self.recorder is not None:
+            print(f"Iz kaydi: {self.recorder.frames_written} kare")
+            self.recorder.close()
+        if self.flow_tracker is not None:
+            flow_stats = self.flow_tracker.get_stats()
+            print(f"Optik akis: {flow_stats['keyframes']} anahtar kare "
+                  f"({flow_stats['forced_keyframes']} kayma nedeniyle), "
+                  f"{flow_stats['flow_frames']} akis karesi (%{flow_stats['flow_rate']:.0f}), "
+                  f"ort. hata: iris {flow_stats['iris_error']:.4f}, nokta {flow_stats['point_error_px']:.2f} px")
+        if self.presence is not None:
+            presence_stats = self.presence.get_stats()
+            cpu_active, cpu_idle = presence_stats['cpu_active'], presence_stats['cpu_idle']
+            print(f"CPU: takip %{cpu_active or 0:.0f}, "
+                  f"yuz yok %{cpu_idle or 0:.0f} ({presence_stats['idle_seconds']:.1f} sn, "
+                  f"{presence_stats['idle_entries']} kez, {presence_stats['skipped_detections']} algilama atlandi)")
+        if self.governor is not None:
+            governor_stats = self.governor.get_stats()
+            print(f"Kare butcesi ({self.governor.budget_ms:.0f} ms): "
+                  f"%{governor_stats['over_budget_rate']:.1f} kare asti, "
+                  f"{governor_stats['downgrades']} dusurme, {governor_stats['upgrades']} yukseltme, "
+                  f"son {self.governor.describe()}")
+        self.profiler.print_summary()
+        histogram_path = self.profiler.export_histogram('eye_focus_trainer')
+        if histogram_path:
+            print(f"Gecikme histogrami: {histogram_path}")
         print(f"\n{'=' * 60}")
         print(f"OYUN BITTI! Toplam skor: {self.score}")
         print(f"{'=' * 60}")
 
 
+
+# ============================================
+# ÇOK OYUNCULU MOD
+# ============================================
+
+class MultiPlayerEyeTrainer(EyeFocusTrainer):
+    """Tek kamerada 2-4 oyuncu: kare başına tek FaceMesh çağrısı, yüz başına
+    kalibrasyon, top ve skor.
+
+    Oyuncu durumu (iris, bakış, kalibrasyon ilerlemesi, top, skor) oyuncu
+    eksenli dizilerde tutulur ve kare başına vektörel güncellenir; odak
+    puanlaması tek oyunculu modla aynı FocusRule ile oyuncu başına yapılır.
+    Yüzler FaceAssigner ile kareler arasında aynı oyuncuya bağlanır; yerine
+    yeni kişi gelen oyuncunun kalibrasyonu sıfırlanır.
+    """
+
+    def __init__(self, players=MULTI_PLAYER_MIN, **kwargs):
+        if not MULTI_PLAYER_MIN <= players <= MULTI_PLAYER_MAX:
+            raise ValueError(f"Oyuncu sayisi {MULTI_PLAYER_MIN}-{MULTI_PLAYER_MAX} arasinda olmali: {players}")
+        if kwargs.get('record_path'):
+            raise ValueError("Iz kaydi cok oyunculu modda desteklenmiyor")
+        self.players = players
+        self.max_faces = players
+        super().__init__(**kwargs)
+
+    @property
+    def score(self):
+        """Tüm oyuncuların toplam skoru"""
+        return int(self.scores.sum())
+
+    def _init_ball(self):
+        """Oyuncu başına top: konum ve hız (P, 2) dizilerde"""
+        self.ball_radius = BALL_RADIUS
+        self.ball_pos = np.empty((self.players, 2))
+        self.ball_prev = np.empty((self.players, 2))  # Önceki fizik adımındaki konumlar
+        self.ball_vel = np.empty((self.players, 2))
+        for player in range(self.players):
+            self._reset_player_ball(player)
+
+    def _init_game_state(self):
+        """Oyuncu başına odak kuralı (tek oyunculu FocusRule) ve skor durumu"""
+        players = self.players
+        self.scores = np.zeros(players, dtype=np.int64)
+        self.focus = [FocusRule(FOCUS_THRESHOLD, FOCUS_REQUIRED_TIME, FOCUS_LOSS_TOLERANCE, FOCUS_DECAY_RATE)
+                      for _ in range(players)]
+        self.focus_successes = np.zeros(players, dtype=np.int64)
+        self.focus_losses = np.zeros(players, dtype=np.int64)
+        self.focus_durations = [[] for _ in range(players)]  # Başarılı odak süreleri
+        self.success_time = np.full(players, -np.inf)
+        self.warning_time = np.full(players, -np.inf)
+
+    def _init_eye_tracking(self):
+        """Ortak örnek alanları + oyuncu başına göz ve bakış durumu"""
+        super()._init_eye_tracking()
+        players = self.players
+        rows = len(self.landmark_adapter.indices)
+        self._faces_buffer = np.empty((players, rows, 3))  # Bu karenin yüzleri (ilk K satır dolu)
+        self.player_points = np.zeros((players, rows, 3))
+        self.player_iris = np.full((players, 2), 0.5)
+        self.player_face = np.zeros(players, dtype=bool)
+        self.player_eyes_valid = np.zeros(players, dtype=bool)
+        self.player_new_sample = np.zeros(players, dtype=bool)
+        self.gaze = np.tile((self.screen_width / 2, self.screen_height / 2), (players, 1))
+        self.gaze_filters = [make_gaze_filter(GAZE_FILTER) for _ in range(players)]
+        self.assigner = FaceAssigner(players)
+
+    def _init_calibration(self):
+        """Ortak kalibrasyon ızgarası, oyuncu başına ilerleme"""
+        grid = make_calibration_grid(CALIBRATION_GRID, self.screen_width, self.screen_height)
+        players = self.players
+        self.calibration_labels = [label for _, label, _ in grid]
+        self.calibration_screen = np.array([pos for _, _, pos in grid], dtype=np.float64)
+        self.calibration_iris = np.full((players, len(grid), 2), np.nan)
+        self.calibration_index = np.zeros(players, dtype=np.intp)
+        self.calibration_hold = np.zeros(players)
+        # Son CALIBRATION_STABLE_SAMPLES iris örneği (halka tampon, NaN = boş)
+        self.calibration_history = np.full((players, CALIBRATION_STABLE_SAMPLES, 2), np.nan)
+        self.calibration_count = np.zeros(players, dtype=np.intp)
+        self.calibration_unstable = np.zeros(players, dtype=bool)
+        self.player_calibrated = np.zeros(players, dtype=bool)
+        self.gaze_coeffs = None  # (P, F, 2) eşleme katsayıları; ilk uydurmada ayrılır
+
+    # ============================================
+    # YÜZLER -> OYUNCULAR
+    # ============================================
+
+    def _apply_face_result(self, multi_face_landmarks, seq, timestamp):
+        """Tüm yüzleri tek yığına çevir, iris pozisyonlarını tek çağrıda hesapla, oyunculara dağıt"""
+        faces = multi_face_landmarks[:self.players] if multi_face_landmarks else ()
+        points = self._faces_buffer[:len(faces)]
+        for face, out in zip(faces, points):
+            self.landmark_adapter.to_array(face.landmark, out)
+        iris_x, iris_y, valid = iris_position(points)
+
+        face_of_player = self.assigner.assign(face_centers(points), timestamp)
+        for player in self.assigner.claimed:
+            self._reset_player_calibration(player)
+            print(f"Oyuncu {player + 1} katildi")
+
+        present = face_of_player >= 0
+        matched = face_of_player[present]
+        self.player_face[:] = present
+        self.player_new_sample[:] = present
+        self.player_eyes_valid[:] = False
+        self.player_eyes_valid[present] = valid[matched]
+        self.player_points[present] = points[matched]
+        eyes = self.player_eyes_valid
+        self.player_iris[eyes, 0] = iris_x[face_of_player[eyes]]
+        self.player_iris[eyes, 1] = iris_y[face_of_player[eyes]]
+
+        # Ortak alanlar: algılama döngüsü ve güç tasarrufu bunları kullanır
+        self.sample_seq = seq
+        self.sample_time = timestamp
+        self.has_new_sample = True
+        self.face_detected = len(faces) > 0
+        self.eyes_valid = bool(eyes.any())
+
+    # ============================================
+    # KARE GÜNCELLEMESİ
+    # ============================================
+
+    def update_frame(self, frame):
+        """Kalibrasyondaki oyuncular kendi hedef noktasında, kalibre olanlar kendi topunda"""
+        new_sample = self.player_new_sample & self.has_new_sample
+        if not self.player_calibrated.all():
+            with self.profiler.span('calibration'):
+                frame = self.ui_layers.dim(frame, CALIBRATION_DIM_ALPHA,
+                                           CALIBRATION_DIM_COLOR * (1 - CALIBRATION_DIM_ALPHA))
+                self.update_calibration(new_sample)
+        self.loop.tick(self.update_ball, self.clock.now)
+        self.check_focus(new_sample)
+        with self.profiler.span('draw_ui'):
+            return self.draw_ui(frame)
+
+    def update_calibration(self, new_sample):
+        """Kalibrasyondaki oyuncuların bekleme süresi ve nokta ilerlemesi"""
+        dt = self.clock.dt
+        calibrating = ~self.player_calibrated
+        tracking = calibrating & self.player_eyes_valid
+
+        # Yeni örnekler halka tampona
+        adding = np.flatnonzero(tracking & new_sample)
+        slots = self.calibration_count[adding] % CALIBRATION_STABLE_SAMPLES
+        self.calibration_history[adding, slots] = self.player_iris[adding]
+        self.calibration_count[adding] += 1
+
+        # Stabilite: tampon dolduysa son örneklerin yayılımı eşik içinde olmalı
+        history = self.calibration_history
+        spread = history.max(axis=1) - history.min(axis=1)
+        full = self.calibration_count >= CALIBRATION_STABLE_SAMPLES
+        stable = ~full | (spread <= CALIBRATION_STABILITY_THRESHOLD).all(axis=1)
+
+        hold = self.calibration_hold
+        holding = tracking & stable
+        unstable = tracking & ~stable
+        lost = calibrating & ~tracking
+        hold[holding] += dt
+        hold[unstable] = np.maximum(0.0, hold[unstable] - CALIBRATION_UNSTABLE_DECAY * dt)
+        hold[lost] = np.maximum(0.0, hold[lost] - CALIBRATION_LOST_DECAY * dt)
+        self.calibration_unstable = unstable
+
+        for player in np.flatnonzero(holding & (hold >= CALIBRATION_HOLD_TIME)):
+            if self.calibration_count[player] == 0:
+                continue  # Bu noktada henüz örnek yok
+            # Stabil pozisyonun ortalaması (boş halka elemanları NaN)
+            self.calibration_iris[player, self.calibration_index[player]] = np.nanmean(history[player], axis=0)
+            self.calibration_index[player] += 1
+            hold[player] = 0.0
+            history[player] = np.nan
+            self.calibration_count[player] = 0
+            if self.calibration_index[player] >= len(self.calibration_labels):
+                self._finish_player_calibration(player)
+
+    def _finish_player_calibration(self, player):
+        """Oyuncunun eşleme modelini uydur ve katsayı yığınına yaz"""
+        mapping = GazeMapping.fit(self.calibration_iris[player], self.calibration_screen)
+        if mapping is None:
+            print(f"Oyuncu {player + 1}: kalibrasyon verisi yetersiz, tekrar deneniyor...")
+            self._reset_player_calibration(player)
+            return
+        if self.gaze_coeffs is None:
+            self.gaze_coeffs = np.zeros((self.players,) + mapping.coeffs.shape)
+        self.gaze_coeffs[player] = mapping.coeffs
+        self.player_calibrated[player] = True
+        self.gaze_filters[player].reset()
+        print(f"Oyuncu {player + 1} kalibrasyonu tamamlandi! (ortalama hata: {mapping.residual_px:.1f} px)")
+
+    def _reset_player_calibration(self, player):
+        """Tek oyuncunun kalibrasyonunu ve odağını sıfırla"""
+        self.player_calibrated[player] = False
+        self.calibration_iris[player] = np.nan
+        self.calibration_index[player] = 0
+        self.calibration_hold[player] = 0.0
+        self.calibration_history[player] = np.nan
+        self.calibration_count[player] = 0
+        self.gaze_filters[player].reset()
+        self.focus[player].reset()
+
+    def reset_calibration(self):
+        """Tüm oyuncuların kalibrasyonunu sıfırla"""
+        for player in range(self.players):
+            self._reset_player_calibration(player)
+        print("Yeniden kalibrasyon baslatiliyor...")
+
+    def update_ball(self, dt):
+        """Tüm topları bir fizik adımı hareket ettir"""
+        step = dt * REFERENCE_FPS
+        pos, vel = self.ball_pos, self.ball_vel
+        self.ball_prev[:] = pos
+        pos += vel * step
+        low = self.ball_radius
+        high = np.array((self.screen_width, self.screen_height)) - self.ball_radius
+        bounced = (pos <= low) | (pos >= high)
+        vel[bounced] = -vel[bounced]
+        np.clip(pos, low, high, out=pos)
+
+    def _reset_player_ball(self, player):
+        """Oyuncunun topunu yeni pozisyona taşı"""
+        margin = 150
+        self.ball_pos[player] = (
+            random.randint(self.ball_radius + margin, self.screen_width - self.ball_radius - margin),
+            random.randint(self.ball_radius + margin, self.screen_height - self.ball_radius - margin),
+        )
+        self.ball_prev[player] = self.ball_pos[player]
+        self.ball_vel[player] = (random.choice(BALL_SPEED_OPTIONS), random.choice(BALL_SPEED_OPTIONS))
+
+    def calculate_gaze(self, new_sample):
+        """Yeni örneği olan kalibre oyuncuların bakışı (eşlemeler tek çarpımla)"""
+        players = np.flatnonzero(self.player_calibrated & self.player_eyes_valid & new_sample)
+        if len(players) == 0:
+            return
+        targets = apply_mappings(self.gaze_coeffs[players], self.player_iris[players])
+        np.clip(targets, 0, (self.screen_width, self.screen_height), out=targets)
+        for player, (target_x, target_y) in zip(players, targets):
+            self.gaze[player] = self.gaze_filters[player].update(target_x, target_y, self.sample_time)
+        self.gaze[players] = np.clip(self.gaze[players], 50, (self.screen_width - 50, self.screen_height - 50))
+
+    def check_focus(self, new_sample):
+        """Tüm oyuncuların odak durumu (kural: oyuncu başına game_rules.FocusRule)"""
+        clock_now = self.clock.now
+        tracking = self.player_calibrated & self.player_eyes_valid
+        with self.profiler.span('calculate_gaze'):
+            self.calculate_gaze(new_sample)
+
+        distance = np.hypot(*(self.gaze - self.ball_pos).T)
+        for player, focus in enumerate(self.focus):
+            if not tracking[player]:
+                # Göz yok: tolerans süresi kadar odak korunur
+                focus.lose_eyes(clock_now)
+                continue
+            event = focus.update(float(distance[player]), self.sample_time, self.clock.dt)
+            if event == FOCUS_SUCCESS:
+                self.scores[player] += POINT_REWARD
+                self.success_time[player] = clock_now
+                self.focus_successes[player] += 1
+                self.focus_durations[player].append(focus.event_duration)
+                self._reset_player_ball(player)
+            elif event == FOCUS_LOST:
+                self.warning_time[player] = clock_now
+                self.focus_losses[player] += 1
+
+    # ============================================
+    # ÇİZİM
+    # ============================================
+
+    def draw_ui(self, frame):
+        """Oyuncu başına hedef/top/bakış, üst skor çubuğu ve alt bilgi"""
+        self._draw_player_landmarks(frame)
+        for player in range(self.players):
+            if self.player_calibrated[player]:
+                self._draw_player_ball(frame, player)
+                self._draw_player_gaze(frame, player)
+            else:
+                self._draw_player_calibration(frame, player)
+        self._draw_top_bar(frame)
+        if not self.player_calibrated.all():
+            self.ui_layers.composite(frame, 'multi_calibration_hint', self._render_calibration_hint)
+        self.ui_layers.composite(frame, 'multi_footer', self._render_footer)
+        return frame
+
+    def _draw_player_landmarks(self, frame):
+        """Göz landmark'ları ve yüzün üstünde oyuncu etiketi"""
+        if self.governor is not None and not self.governor.draw_landmarks:
+            return
+        h, w = frame.shape[:2]
+        for player in np.flatnonzero(self.player_eyes_valid):
+            points = self.player_points[player]
+            self._draw_eye_landmarks(frame, points, w, h)
+            x, y = (points[0:2, :2].mean(axis=0) * (w, h)).astype(int)
+            cv2.putText(frame, f"O{player + 1}", (int(x) - 20, int(y) - 40),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.9, PLAYER_COLORS[player], 2)
+
+    def _draw_player_calibration(self, frame, player):
+        """Oyuncunun sıradaki kalibrasyon noktası ve bekleme halkası"""
+        index = self.calibration_index[player]
+        x, y = (int(v) for v in self.calibration_screen[index])
+        color = PLAYER_COLORS[player]
+        cv2.circle(frame, (x, y), 40, COLORS['red'], -1)
+        cv2.circle(frame, (x, y), 40, color, 4)
+        cv2.circle(frame, (x, y), 12, COLORS['white'], -1)
+
+        # Aynı noktadaki oyuncular üst üste binmesin: halka ve etiket oyuncuya göre kaydırılır
+        radius = 52 + 10 * player
+        progress = min(self.calibration_hold[player] / CALIBRATION_HOLD_TIME, 1.0)
+        if progress > 0:
+            cv2.ellipse(frame, (x, y), (radius, radius), -90, 0, 360 * progress, color, 6)
+        label = f"O{player + 1} {index + 1}/{len(self.calibration_labels)}"
+        if not self.player_face[player]:
+            label += " YUZ YOK"
+        elif not self.player_eyes_valid[player]:
+            label += " GOZ YOK"
+        elif self.calibration_unstable[player]:
+            label += " SABIT BAKIN!"
+        cv2.putText(frame, label, (x - 60, y - 75 - 28 * player),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+
+    def _draw_player_ball(self, frame, player):
+        """Oyuncunun topu, odak halkası ve puan / uyarı mesajı"""
+        prev = self.ball_prev[player]
+        x, y = (int(v) for v in prev + (self.ball_pos[player] - prev) * self.loop.alpha)
+        radius = self.ball_radius
+        cv2.circle(frame, (x, y), radius, PLAYER_COLORS[player], -1)
+        cv2.circle(frame, (x, y), radius, COLORS['white'], 3)
+        cv2.putText(frame, str(player + 1), (x - 12, y + 12),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1.1, COLORS['dark_gray'], 3)
+
+        focus = self.focus[player]
+        if focus.is_focused:
+            progress = min(focus.duration / FOCUS_REQUIRED_TIME, 1.0)
+            cv2.ellipse(frame, (x, y), (radius + 20, radius + 20), -90, 0, 360 * progress, COLORS['green'], 5)
+
+        now = self.clock.now
+        if now - self.success_time[player] < 1.5:
+            cv2.putText(frame, f"+{POINT_REWARD}", (x + radius, y - radius),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1.2, COLORS['green'], 3)
+        elif now - self.warning_time[player] < 1.5:
+            cv2.putText(frame, "Odak kaybedildi!", (x - 100, y - radius - 15),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, COLORS['red'], 2)
+
+    def _draw_player_gaze(self, frame, player):
+        """Oyuncunun bakış noktası (oyuncu renginde)"""
+        if not self.player_eyes_valid[player]:
+            return
+        x, y = (int(v) for v in self.gaze[player])
+        color = PLAYER_COLORS[player]
+        cv2.circle(frame, (x, y), 30, color, 3)
+        cv2.circle(frame, (x, y), 10, color, -1)
+        cv2.line(frame, (x - 40, y), (x + 40, y), color, 2)
+        cv2.line(frame, (x, y - 40), (x, y + 40), color, 2)
+
+    def _draw_top_bar(self, frame):
+        """Oyuncu başına skor ve takip durumu"""
+        self.ui_layers.composite(frame, 'top_bar', self._render_top_bar)
+        slot_width = self.screen_width // self.players
+        for player in range(self.players):
+            x = player * slot_width + 20
+            cv2.putText(frame, f"O{player + 1}: {self.scores[player]}", (x, 50),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1.1, PLAYER_COLORS[player], 3)
+            if not self.player_face[player]:
+                status_text, status_color = "YUZ YOK", COLORS['red']
+            elif not self.player_eyes_valid[player]:
+                status_text, status_color = "GOZ YOK", COLORS['orange']
+            elif not self.player_calibrated[player]:
+                status_text, status_color = "KALIBRASYON", COLORS['cyan']
+            else:
+                status_text, status_color = "GOZ OK", COLORS['green']
+            cv2.putText(frame, status_text, (x + 170, 48),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.55, status_color, 2)
+
+    def _render_calibration_hint(self, canvas):
+        """Kalibrasyon açıklaması (sabit katman)"""
+        cv2.putText(canvas, "KALIBRASYON: Her oyuncu kendi numarali noktasina sadece GOZLERIYLE baksin",
+                    (self.screen_width // 2 - 480, 115),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, COLORS['white'], 2)
+
+    def _render_footer(self, canvas):
+        """Alt bilgi metni (sabit katman)"""
+        text = "Bakisinizi kendi renginizdeki topa getirin ve 1sn tutun | R = Yeniden Kalibrasyon | Q = Cikis"
+        cv2.putText(canvas, text, (self.screen_width // 2 - 480, self.screen_height - 15),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, COLORS['gray'], 2)
+
+    def _cleanup(self, display=True):
+        """Kaynakları temizle, oyuncu skorlarını yazdır"""
+        super()._cleanup(display)
+        for player in range(self.players):
+            durations = self.focus_durations[player]
+            avg_duration = sum(durations) / len(durations) if durations else 0.0
+            print(f"Oyuncu {player + 1}: {self.scores[player]} puan, {self.focus_successes[player]} basarili / "
+                  f"{self.focus_losses[player]} kayip odak (ort. {avg_duration:.2f} sn)")
+        assigner_stats = self.assigner.get_stats()
+        print(f"Yuz eslestirme: {assigner_stats['claims']} katilim, "
+              f"{assigner_stats['reacquired']} yeniden yakalama, "
+              f"{assigner_stats['ignored_faces']} fazla yuz")
+
 if __name__ == "__main__":
-    trainer = EyeFocusTrainer()
-    trainer.run()
+    parser = argparse.ArgumentParser(description="Goz odak takip oyunu")
+    parser.add_argument('--record', metavar='IZ', help="Canli oturumu landmark izi olarak kaydet")
+    parser.add_argument('--replay', metavar='IZ', help="Kayitli izi kamera/MediaPipe olmadan oynat")
+    parser.add_argument('--source', default=FRAME_SOURCE,
+                        help="Kare kaynagi: kamera indeksi, video, resim klasoru veya synthetic[:fps]")
+    parser.add_argument('--realtime', action='store_true', help="Iz/kayitli kaynagi kayit hizinda oynat")
+    parser.add_argument('--inference', choices=INFERENCE_MODES, default=INFERENCE_MODE,
+                        help=f"Cikarim modu (keyframe: her {KEYFRAME_INTERVAL} karede FaceMesh, arada optik akis)")
+    parser.add_argument('--no-display', action='store_true', help="Pencere acmadan calis (toplu/yuk testi)")
+    parser.add_argument('--players', type=int, default=1,
+                        help=f"Oyuncu sayisi: 1 veya {MULTI_PLAYER_MIN}-{MULTI_PLAYER_MAX} (tek kamera)")
+    args = parser.parse_args()
+    if args.players > 1 and (args.record or args.replay):
+        parser.error("--players iz kaydi / oynatma ile birlikte kullanilamaz")
+    
+    if args.replay:
+        trainer = EyeFocusTrainer(headless=True)
+        stats = trainer.replay(args.replay, realtime=args.realtime)
+        print(f"Oynatma: {stats['frames']} kare, {stats['elapsed']:.3f} s "
+              f"({stats['fps']:.0f} kare/s), skor: {stats['score']}")
+    elif not MEDIAPIPE_AVAILABLE:
+        print("HATA: MediaPipe kurulu değil!")
+        print("Kurmak için: pip install mediapipe==0.10.9")
+    elif args.players > 1:
+        trainer = MultiPlayerEyeTrainer(args.players, source=args.source, realtime=args.realtime,
+                                        inference_mode=args.inference)
+        trainer.run(display=not args.no_display)
+    else:
+        trainer = EyeFocusTrainer(record_path=args.record, source=args.source, realtime=args.realtime,
+                                  inference_mode=args.inference)
+        trainer.run(display=not args.no_display)
@@ -0,0 +1,122 @@
+"""
+Göz Takibi Kaynaklarının Arka Planda Hazırlanması
+- FaceMesh modeli ve kamera, göz aşaması başlamadan ayrı bir thread'de açılır
+- İlk `process` çağrısı boş kare ile önceden yapılır (model yükleme gecikmesi)
+- Kaynaklar tekrarlanan göz oturumları arasında paylaşılır; program sonunda
+  bir kez kapatılır
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from frame_sources import open_frame_source
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+WARMUP_FIRST_FRAME_TIMEOUT = 5.0  # Kameradan ilk kare için beklenecek süre (saniye)
+WARMUP_WAIT_TIMEOUT = 30.0  # Oturum başlarken hazırlığın bitmesi için en fazla bekleme
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class EyeTrackingResources:
+    """Kamera ve FaceMesh'i bir kez açıp oturumlara ödünç veren taşıyıcı.
+
+    `face_mesh_factory` argümansız çağrılıp FaceMesh nesnesi döndürür;
+    MediaPipe içe aktarması çağıranda kalır. Canlı kamera oturumlar arasında
+    açık tutulur, kayıtlı kaynaklar (video, sentetik) her oturumda baştan açılır.
+    """
+
+    def __init__(self, source, width, height, face_mesh_factory):
+        self.source = source
+        self.width = width
+        self.height = height
+        self.face_mesh_factory = face_mesh_factory
+
+        self.cap = None
+        self.face_mesh = None
+        self.error = None  # Hazırlık sırasında oluşan istisna
+        self.warmup_time = None  # Hazırlığın sürdüğü süre (saniye)
+        self.wait_time = 0.0  # Oturum başında hazırlık için beklenen toplam süre
+        self.sessions = 0
+
+        self._ready = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Hazırlık thread'ini başlat (zincirleme kullanım için self döner)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._warm_up, name="EyeWarmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def _warm_up(self):
+        """Modeli yükle, kamerayı aç ve ilk kareyi bekle"""
+        start = time.perf_counter()
+        try:
+            self.face_mesh = self.face_mesh_factory()
+            self.face_mesh.process(np.zeros((self.height, self.width, 3), dtype=np.uint8))
+            self._open_source()
+        except Exception as error:  # Hata oturum başlarken raporlanır
+            self.error = error
+        self.warmup_time = time.perf_counter() - start
+        self._ready.set()
+
+    def _open_source(self):
+        self.cap = open_frame_source(self.source, self.width, self.height).start()
+        if self.cap.live:
+            self.cap.read_with_timestamp(timeout=WARMUP_FIRST_FRAME_TIMEOUT)
+
+    @property
+    def ready(self):
+        return self._ready.is_set()
+
+    # ============================================
+    # OTURUM
+    # ============================================
+
+    def acquire(self, timeout=WARMUP_WAIT_TIMEOUT):
+        """Oturum için (cap, face_mesh) döndür; hazırlık sürüyorsa bekler
+
+        Hazırlık başarısız olduysa veya zaman aşılırsa None döner (neden `error`).
+        """
+        self.start()
+        start = time.perf_counter()
+        finished = self._ready.wait(timeout)
+        self.wait_time += time.perf_counter() - start
+        if not finished:
+            self.error = TimeoutError("Kamera/FaceMesh hazirligi zaman asimina ugradi")
+            return None
+        if self.error is not None:
+            return None
+
+        if self.cap is None:
+            self._open_source()
+        else:
+            self.cap.reset_stats()  # Oturumlar arası kareler düşmüş sayılmasın
+        self.sessions += 1
+        return self.cap, self.face_mesh
+
+    def finish_session(self, keep_source=True):
+        """Oturum bitti: canlı kamera açık kalır, kayıtlı veya okunamayan kaynak kapatılır"""
+        if self.cap is not None and not (keep_source and self.cap.live):
+            self.cap.release()
+            self.cap = None
+
+    def release(self):
+        """Tüm kaynakları kapat (program sonunda)"""
+        if self._thread is not None:
+            self._ready.wait(WARMUP_WAIT_TIMEOUT)
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        if self.face_mesh is not None:
+            self.face_mesh.close()
+            self.face_mesh = None
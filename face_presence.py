@@ -0,0 +1,116 @@
+"""
+Yüz Yokken Güç Tasarrufu
+- Belirli bir süre yüz bulunamazsa algılama düşük hıza ve küçük kareye geçer
+- Yüz tekrar bulunduğu anda tam hızlı takibe dönülür
+- İşlem CPU süresi (tüm thread'ler) iki mod için ayrı ölçülür; böylece boşta
+  kazanılan pay raporlanabilir
+"""
+
+import time
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+FACE_ABSENT_TIMEOUT = 1.0  # Bu kadar saniye yüz yoksa tasarruf moduna geç
+IDLE_DETECTION_INTERVAL = 0.25  # Tasarruf modunda algılama aralığı (saniye, ~4 Hz)
+IDLE_DETECTION_WIDTH = 320  # Tasarruf modunda FaceMesh'e giden kare genişliği (piksel)
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class FacePresenceMonitor:
+    """Yüz varlığına göre algılama hızını seçen ve CPU kullanımını ölçen yardımcı.
+
+    Her karede `should_detect(now)` algılamanın çalışıp çalışmayacağını söyler;
+    yeni sonuç geldiğinde `update(face_found, now)` çağrılır ve mod değiştiyse
+    True döner. `sample_cpu()` kare başına bir kez çağrılır.
+    """
+
+    def __init__(self, absent_timeout=FACE_ABSENT_TIMEOUT, idle_interval=IDLE_DETECTION_INTERVAL,
+                 idle_width=IDLE_DETECTION_WIDTH):
+        self.absent_timeout = absent_timeout
+        self.idle_interval = idle_interval
+        self.idle_width = idle_width
+        self.idle = False  # True = yüz yok, düşük hızlı algılama
+        self._last_face_time = None
+        self._last_detection = 0.0
+
+        # CPU ölçümü: mod -> (işlem CPU süresi, duvar saati süresi)
+        self._cpu_mark = None
+        self._wall_mark = None
+        self.cpu_time = {False: 0.0, True: 0.0}
+        self.wall_time = {False: 0.0, True: 0.0}
+
+        # Sayaçlar
+        self.idle_entries = 0
+        self.idle_detections = 0
+        self.skipped_detections = 0
+
+    def should_detect(self, now):
+        """Bu karede algılama yapılmalı mı?"""
+        if not self.idle:
+            return True
+        if now - self._last_detection >= self.idle_interval:
+            self._last_detection = now
+            self.idle_detections += 1
+            return True
+        self.skipped_detections += 1
+        return False
+
+    def update(self, face_found, now):
+        """Yeni algılama sonucunu işle; mod değiştiyse True"""
+        if face_found:
+            self._last_face_time = now
+            if self.idle:
+                self.idle = False  # Yüz geldi: hemen tam hıza dön
+                return True
+            return False
+
+        if self._last_face_time is None:
+            self._last_face_time = now
+        if not self.idle and now - self._last_face_time >= self.absent_timeout:
+            self.idle = True
+            self.idle_entries += 1
+            self._last_detection = now
+            return True
+        return False
+
+    def sample_cpu(self):
+        """Son çağrıdan beri geçen CPU/duvar süresini mevcut moda yaz"""
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        if self._cpu_mark is not None:
+            self.cpu_time[self.idle] += cpu - self._cpu_mark
+            self.wall_time[self.idle] += wall - self._wall_mark
+        self._cpu_mark = cpu
+        self._wall_mark = wall
+
+    def cpu_percent(self, idle):
+        """Modun ortalama CPU kullanımı (%, 100 = bir çekirdek); ölçüm yoksa None"""
+        wall = self.wall_time[idle]
+        if wall <= 0:
+            return None
+        return self.cpu_time[idle] / wall * 100
+
+    def get_stats(self):
+        """Mod ve CPU istatistiklerini döndür"""
+        return {
+            'idle': self.idle,
+            'idle_entries': self.idle_entries,
+            'idle_seconds': self.wall_time[True],
+            'idle_detections': self.idle_detections,
+            'skipped_detections': self.skipped_detections,
+            'cpu_active': self.cpu_percent(False),
+            'cpu_idle': self.cpu_percent(True),
+        }
+
+    def describe(self):
+        """Modun kısa açıklaması (konsol için)"""
+        if self.idle:
+            return (f"yuz yok, {1 / self.idle_interval:.0f} Hz algilama "
+                    f"({self.idle_width}px)")
+        return "yuz bulundu, tam hiz takip"
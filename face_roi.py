@@ -0,0 +1,181 @@
+"""
+Yüz ROI Takibi
+- Başarılı tespitten sonra sadece yüz çevresindeki bölge FaceMesh'e gönderilir
+- Kırpılan bölge küçültülerek çıkarım yapılır, landmark'lar tam kareye geri eşlenir
+- Yüz kaybolursa tam kare işlemeye geri dönülür
+- Tam kare ve ROI çıkarım genişlikleri çalışma anında değiştirilebilir
+- Küçültme ve renk dönüşümü isteğe bağlı olarak yeniden kullanılan tamponlara yazılır
+"""
+
+import cv2
+
+from frame_buffers import FrameBuffer
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+ROI_PADDING = 0.35  # Yüz kutusu boyutuna göre her yöne eklenen pay
+ROI_INFERENCE_WIDTH = 320  # ROI çıkarım genişliği (piksel)
+ROI_MIN_SIZE = 64  # Bundan küçük kutular güvenilmez sayılır (piksel)
+
+# Yüz sınırlarını belirlemek için kullanılan landmark'lar
+ROI_BOUND_INDICES = (
+    10,   # Alın üstü
+    152,  # Çene
+    234,  # Sol yanak
+    454,  # Sağ yanak
+)
+
+
+# ============================================
+# YARDIMCI FONKSİYONLAR
+# ============================================
+
+def to_inference_rgb(image, max_width=None, out=None, scratch=None):
+    """BGR görüntüyü FaceMesh girdisine çevir
+
+    Genişlik `max_width`'ten büyükse en-boy oranı korunarak küçültülür;
+    normalize landmark koordinatları bundan etkilenmez. `out` / `scratch`
+    (FrameBuffer) verilirse RGB sonuç ve ara küçültme bu tamponlara yazılır,
+    verilmezse yeni diziler ayrılır.
+    """
+    h, w = image.shape[:2]
+    if max_width is not None and w > max_width:
+        size = (max_width, max(1, int(h * max_width / w)))
+        resized = scratch.view((size[1], size[0], 3)) if scratch is not None else None
+        image = cv2.resize(image, size, dst=resized, interpolation=cv2.INTER_AREA)
+    if out is None:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=out.view(image.shape))
+
+
+# ============================================
+# YARDIMCI SINIFLAR
+# ============================================
+
+class MappedLandmark:
+    """Tam kare koordinatlarına eşlenmiş tek landmark"""
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class MappedFace:
+    """MediaPipe NormalizedLandmarkList ile aynı erişimi sunan yüz nesnesi.
+
+    `landmark` bir sözlüktür; sadece eşlenen indekslere `landmark[i]` ile
+    erişilebilir.
+    """
+
+    __slots__ = ('landmark',)
+
+    def __init__(self, landmark):
+        self.landmark = landmark
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class FaceROITracker:
+    """Yüz bölgesini takip edip FaceMesh girdisini küçülten yardımcı"""
+
+    def __init__(self, landmark_indices, padding=ROI_PADDING, inference_width=ROI_INFERENCE_WIDTH,
+                 full_width=None):
+        # Eşlenecek indeksler: oyunun kullandıkları + yüz sınırları
+        self.indices = tuple(sorted(set(landmark_indices) | set(ROI_BOUND_INDICES)))
+        self.padding = padding
+        self.inference_width = inference_width  # ROI çıkarım genişliği
+        self.full_width = full_width  # Tam kare çıkarım genişliği (None = doğal çözünürlük)
+        self.roi = None  # (x0, y0, w, h) piksel; None = tam kare
+        self._scratch = FrameBuffer()  # Küçültme ara tamponu (prepare çağıran thread'e ait)
+
+        # Sayaçlar
+        self.roi_frames = 0
+        self.full_frames = 0
+
+    def reset(self):
+        """Tam kare moduna dön"""
+        self.roi = None
+
+    def prepare(self, frame, out=None):
+        """Kareyi çıkarıma hazırla: (rgb_input, roi)
+
+        RGB girdi `out` tamponuna (FrameBuffer) veya yeni diziye yazılır;
+        kare değiştirilmez, çağıran üzerine güvenle çizim yapabilir.
+        """
+        return self.prepare_roi(frame, self.roi, out)
+
+    def prepare_roi(self, frame, roi, out=None):
+        """Kareyi verilen ROI anlık görüntüsüyle hazırla (self.roi okunmaz)
+
+        Boru hattında `roi` worker kilidi altında okunur; `finish` worker
+        thread'inde ROI'yi değiştirirken kırpma bu kopyayla yapılır.
+        """
+        if roi is None:
+            self.full_frames += 1
+            return to_inference_rgb(frame, self.full_width, out, self._scratch), None
+
+        self.roi_frames += 1
+        x0, y0, w, h = roi
+        crop = frame[y0:y0 + h, x0:x0 + w]
+        return to_inference_rgb(crop, self.inference_width, out, self._scratch), roi
+
+    def finish(self, multi_face_landmarks, roi, frame_shape):
+        """Çıkarım sonucunu tam kareye eşle ve sonraki ROI'yi güncelle"""
+        if not multi_face_landmarks:
+            # Yüz kayboldu - tam kareye geri dön
+            self.roi = None
+            return multi_face_landmarks
+
+        frame_h, frame_w = frame_shape[:2]
+        landmarks = multi_face_landmarks[0].landmark
+
+        if roi is None:
+            mapped = None
+            points = [(landmarks[i].x, landmarks[i].y) for i in ROI_BOUND_INDICES]
+        else:
+            x0, y0, w, h = roi
+            sx, sy = w / frame_w, h / frame_h
+            ox, oy = x0 / frame_w, y0 / frame_h
+            mapped = {}
+            for i in self.indices:
+                lm = landmarks[i]
+                mapped[i] = MappedLandmark(ox + lm.x * sx, oy + lm.y * sy, lm.z * sx)
+            points = [(mapped[i].x, mapped[i].y) for i in ROI_BOUND_INDICES]
+
+        self.roi = self._compute_roi(points, frame_w, frame_h)
+
+        if mapped is None:
+            return multi_face_landmarks
+        return [MappedFace(mapped)]
+
+    def process(self, face_mesh, frame):
+        """Senkron yol: hazırla + çıkarım + eşle"""
+        rgb_input, roi = self.prepare(frame)
+        results = face_mesh.process(rgb_input)
+        return self.finish(results.multi_face_landmarks, roi, frame.shape)
+
+    def _compute_roi(self, points, frame_w, frame_h):
+        """Normalize noktalardan pay eklenmiş piksel kutusu hesapla"""
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        min_x, max_x = min(xs) * frame_w, max(xs) * frame_w
+        min_y, max_y = min(ys) * frame_h, max(ys) * frame_h
+
+        pad_x = (max_x - min_x) * self.padding
+        pad_y = (max_y - min_y) * self.padding
+        x0 = int(max(0, min_x - pad_x))
+        y0 = int(max(0, min_y - pad_y))
+        x1 = int(min(frame_w, max_x + pad_x))
+        y1 = int(min(frame_h, max_y + pad_y))
+
+        if x1 - x0 < ROI_MIN_SIZE or y1 - y0 < ROI_MIN_SIZE:
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
@@ -0,0 +1,45 @@
+"""
+Yeniden Kullanılan Kare Tamponları
+- Ön işleme adımları (ayna, küçültme, renk dönüşümü) `dst=` ile bu tamponlara yazar
+- Tampon düz bir bellek bloğudur; istenen şekilde bitişik görünüm döndürülür,
+  böylece ROI boyutu kareden kareye değişse de yeni dizi ayrılmaz
+- Bellek sadece daha büyük bir şekil istendiğinde büyütülür (sayılır)
+"""
+
+import math
+
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+FRAME_BUFFER_GROWTH = 1.25  # Büyütmede ayrılan pay (ROI boyut oynamalarını karşılar)
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class FrameBuffer:
+    """İstenen şekilde bitişik dizi görünümü veren, büyüyebilen tampon.
+
+    Dönen görünüm bir sonraki `view` çağrısına kadar geçerlidir; aynı anda
+    iki tüketiciye verilecek veriler için ayrı tamponlar kullanılmalıdır.
+    """
+
+    __slots__ = ('dtype', '_data', 'allocations')
+
+    def __init__(self, dtype=np.uint8):
+        self.dtype = dtype
+        self._data = np.empty(0, dtype=dtype)
+        self.allocations = 0  # Belleğin (yeniden) ayrılma sayısı
+
+    def view(self, shape):
+        """`shape` boyutunda, içeriği tanımsız bitişik görünüm"""
+        size = math.prod(shape)
+        if size > self._data.size:
+            self._data = np.empty(int(size * FRAME_BUFFER_GROWTH), dtype=self.dtype)
+            self.allocations += 1
+        return self._data[:size].reshape(shape)
@@ -0,0 +1,184 @@
+"""
+Arka Plan Kamera Yakalama
+- Kamera okumasını ayrı bir thread'de yapar
+- Sadece en yeni kareleri küçük bir halka tamponda tutar
+- Eski kareleri kuyruğa almak yerine düşürür ve sayar
+- Tüm kare kaynaklarının ortak arayüzü (FrameSource) burada tanımlıdır
+"""
+
+import threading
+import time
+from collections import deque
+
+import cv2
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+CAPTURE_BUFFER_SIZE = 2  # Halka tampondaki kare sayısı
+CAPTURE_READ_TIMEOUT = 1.0  # Saniye - yeni kare bekleme süresi
+CAPTURE_MAX_FAILURES = 30  # Ardışık okuma hatası sonrası kamera kapalı sayılır
+
+
+# ============================================
+# ORTAK ARAYÜZ
+# ============================================
+
+class FrameSource:
+    """Kare kaynağı arayüzü (kamera, video, resim klasörü, sentetik)
+
+    Zaman damgaları her kaynakta time.perf_counter ölçeğinde saniyedir.
+    `live=True` kaynaklarda damga yakalama anıdır; kayıtlı girdilerde
+    kaynağın başlama anına eklenen medya zamanıdır.
+    """
+
+    live = False  # Canlı kaynak: kareler gerçek zamanda gelir, yetişilemeyenler düşer
+
+    def start(self):
+        """Okumayı başlat (zincirleme kullanım için self döner)"""
+        return self
+
+    def read_with_timestamp(self, timeout=CAPTURE_READ_TIMEOUT):
+        """Sıradaki kare: (ret, frame, timestamp)"""
+        raise NotImplementedError
+
+    def read(self, timeout=CAPTURE_READ_TIMEOUT):
+        """VideoCapture.read() uyumlu okuma: (ret, frame)"""
+        ret, frame, _ = self.read_with_timestamp(timeout)
+        return ret, frame
+
+    def isOpened(self):
+        return True
+
+    def get_stats(self):
+        """Yakalama istatistikleri: captured, delivered, dropped, drop_rate"""
+        raise NotImplementedError
+
+    def reset_stats(self):
+        """Sayaçları sıfırla (açık kaynak yeni oturuma devredilirken)"""
+
+    def release(self):
+        """Kaynağı kapat"""
+
+
+# ============================================
+# CANLI KAMERA
+# ============================================
+
+class ThreadedCamera(FrameSource):
+    """cv2.VideoCapture'ı arka planda okuyan, en yeni kareyi veren sarmalayıcı.
+
+    `read()` ve `release()` VideoCapture ile aynı imzaya sahiptir; mevcut
+    döngüler değişmeden kullanabilir.
+    """
+
+    live = True
+
+    def __init__(self, device=0, width=None, height=None, buffer_size=CAPTURE_BUFFER_SIZE):
+        self.cap = cv2.VideoCapture(device)
+        if width:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        if height:
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+        self._buffer = deque(maxlen=buffer_size)
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+        # Sayaçlar
+        self.captured_frames = 0  # Kameradan okunan kare
+        self.delivered_frames = 0  # read() ile teslim edilen kare
+        self.dropped_frames = 0  # Hiç teslim edilmeden üzerine yazılan kare
+        self._last_seq = 0
+        self._base_seq = 0  # reset_stats anındaki kare sırası
+
+    # ============================================
+    # THREAD KONTROLÜ
+    # ============================================
+
+    def start(self):
+        """Yakalama thread'ini başlat"""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="ThreadedCamera", daemon=True)
+        self._thread.start()
+        return self
+
+    def _capture_loop(self):
+        """Kameradan sürekli oku, en yeni kareyi tampona koy"""
+        failures = 0
+        while self._running:
+            ret, frame = self.cap.read()
+            if not ret:
+                failures += 1
+                if failures >= CAPTURE_MAX_FAILURES:
+                    break
+                time.sleep(0.005)
+                continue
+            failures = 0
+
+            with self._cond:
+                self.captured_frames += 1
+                self._buffer.append((self.captured_frames, time.perf_counter(), frame))
+                self._cond.notify_all()
+
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    # ============================================
+    # OKUMA
+    # ============================================
+
+    def read_with_timestamp(self, timeout=CAPTURE_READ_TIMEOUT):
+        """En yeni kareyi yakalama zamanıyla birlikte döndür: (ret, frame, timestamp)"""
+        deadline = time.perf_counter() + timeout
+        with self._cond:
+            while not self._buffer or self._buffer[-1][0] == self._last_seq:
+                remaining = deadline - time.perf_counter()
+                if not self._running or remaining <= 0:
+                    return False, None, None
+                self._cond.wait(remaining)
+
+            seq, timestamp, frame = self._buffer[-1]
+            # Teslim edilmeden atlanan kareler düşmüş sayılır
+            self.dropped_frames += seq - self._last_seq - 1
+            self.delivered_frames += 1
+            self._last_seq = seq
+            return True, frame, timestamp
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def get_stats(self):
+        """Yakalama istatistiklerini döndür"""
+        total = self.captured_frames - self._base_seq
+        drop_rate = (self.dropped_frames / total * 100) if total > 0 else 0
+        return {
+            'captured': total,
+            'delivered': self.delivered_frames,
+            'dropped': self.dropped_frames,
+            'drop_rate': drop_rate,
+        }
+
+    def reset_stats(self):
+        """Sayaçları sıfırla; o ana kadar yakalanan kareler teslim edilmez"""
+        with self._cond:
+            self._base_seq = self.captured_frames
+            self._last_seq = self.captured_frames
+            self.delivered_frames = 0
+            self.dropped_frames = 0
+
+    def release(self):
+        """Thread'i durdur ve kamerayı serbest bırak"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.cap.release()
@@ -0,0 +1,49 @@
+"""
+Kare Saati
+- Her döngü adımında bir kez okunan monoton saat (time.perf_counter)
+- `now` ve `dt` değerlerini tüm zamanlayıcılara tek kaynaktan verir
+"""
+
+import time
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+REFERENCE_FPS = 30.0  # Kare başına tanımlı eski sabitlerin referans hızı
+MAX_FRAME_DT = 0.25  # Saniye - takılmalarda tek adımda ilerleyen en fazla süre
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class FrameClock:
+    """Döngü başına bir kez `tick()` edilen monoton saat"""
+
+    def __init__(self, max_dt=MAX_FRAME_DT, start=None):
+        self.max_dt = max_dt
+        self.start = time.perf_counter() if start is None else start
+        self.now = self.start
+        self.dt = 0.0
+        self.frame_count = 0
+
+    def tick(self, now=None):
+        """Yeni kare: `now` ve `dt` değerlerini güncelle
+
+        `now` verilirse saat okunmaz (kayıtlı izin yeniden oynatılması).
+        """
+        current = time.perf_counter() if now is None else now
+        self.dt = min(current - self.now, self.max_dt)
+        self.now = current
+        self.frame_count += 1
+        return self.dt
+
+    def elapsed(self):
+        """Saat başlangıcından bu kareye kadar geçen süre"""
+        return self.now - self.start
+
+    def fps(self):
+        """Son kare süresine göre anlık FPS"""
+        return 1.0 / self.dt if self.dt > 0 else 0.0
@@ -0,0 +1,334 @@
+"""
+Kayıtlı ve Sentetik Kare Kaynakları
+- Video dosyası, resim klasörü ve yüze benzer sentetik test deseni
+- Kareler arka plan thread'inde önceden okunur (sınırlı tampon, kare düşürülmez)
+- Zaman damgaları kare indeksinden/medya zamanından türetilir; isteğe bağlı
+  gerçek zaman hızında teslim edilir
+- `open_frame_source` ile kamera dahil tüm kaynaklar tek yerden açılır
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+from frame_capture import FrameSource, ThreadedCamera, CAPTURE_READ_TIMEOUT
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+PREFETCH_SIZE = 8  # Önceden okunan kare sayısı
+DEFAULT_SOURCE_FPS = 30.0  # FPS bilgisi olmayan kaynaklar için
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+# Sentetik yüz deseni
+SYNTHETIC_BACKGROUND = (70, 70, 70)
+SYNTHETIC_SKIN = (140, 175, 215)
+SYNTHETIC_IRIS_SWEEP = 0.35  # İrisin göz genişliğine oranla salınım genliği
+SYNTHETIC_SWEEP_PERIOD = 4.0  # Saniye
+
+
+# ============================================
+# ÖNCEDEN OKUYAN TEMEL KAYNAK
+# ============================================
+
+class PrefetchSource(FrameSource):
+    """Sırayla üretilen kareleri arka planda tampona dolduran kaynak.
+
+    Alt sınıflar `_next_frame()` (kare veya None) ve gerekirse `_rewind()`,
+    `_close()` uygular. Tampon dolunca üretici bekler; hiçbir kare düşmez.
+    """
+
+    def __init__(self, fps=DEFAULT_SOURCE_FPS, width=None, height=None,
+                 prefetch=PREFETCH_SIZE, realtime=False, loop=False):
+        self.fps = fps
+        self.size = (width, height) if width and height else None
+        self.realtime = realtime  # True: kareler zaman damgalarına göre beklenerek verilir
+        self.loop = loop  # True: kaynak bitince başa dön
+
+        self._buffer = deque()
+        self._prefetch = prefetch
+        self._cond = threading.Condition()
+        self._running = False
+        self._finished = False
+        self._thread = None
+        self._index = 0
+        self.base_time = None
+
+        # Sayaçlar
+        self.captured_frames = 0
+        self.delivered_frames = 0
+        self.underruns = 0  # Tüketici boş tamponda beklemek zorunda kaldı
+
+    # ============================================
+    # ALT SINIF NOKTALARI
+    # ============================================
+
+    def _next_frame(self):
+        """Sıradaki BGR kare; kaynak bittiyse None"""
+        raise NotImplementedError
+
+    def _rewind(self):
+        """Kaynağı başa sar (loop=True için); desteklenmiyorsa False"""
+        return False
+
+    def _close(self):
+        pass
+
+    # ============================================
+    # THREAD KONTROLÜ
+    # ============================================
+
+    def start(self):
+        """Önceden okuma thread'ini başlat"""
+        if self._running:
+            return self
+        self._running = True
+        self.base_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._prefetch_loop, name=type(self).__name__, daemon=True)
+        self._thread.start()
+        return self
+
+    def _prefetch_loop(self):
+        """Tampon dolana kadar kare üret"""
+        while self._running:
+            frame = self._next_frame()
+            if frame is None:
+                if self.loop and self._rewind():
+                    continue
+                break
+            if self.size is not None and (frame.shape[1], frame.shape[0]) != self.size:
+                frame = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+
+            timestamp = self.base_time + self._index / self.fps
+            self._index += 1
+            with self._cond:
+                while self._running and len(self._buffer) >= self._prefetch:
+                    self._cond.wait()
+                self.captured_frames += 1
+                self._buffer.append((timestamp, frame))
+                self._cond.notify_all()
+
+        with self._cond:
+            self._finished = True
+            self._cond.notify_all()
+
+    # ============================================
+    # OKUMA
+    # ============================================
+
+    def read_with_timestamp(self, timeout=CAPTURE_READ_TIMEOUT):
+        """Sıradaki kareyi zaman damgasıyla döndür: (ret, frame, timestamp)"""
+        deadline = time.perf_counter() + timeout
+        with self._cond:
+            if not self._buffer and not self._finished:
+                self.underruns += 1
+            while not self._buffer:
+                remaining = deadline - time.perf_counter()
+                if self._finished or not self._running or remaining <= 0:
+                    return False, None, None
+                self._cond.wait(remaining)
+            timestamp, frame = self._buffer.popleft()
+            self.delivered_frames += 1
+            self._cond.notify_all()
+
+        if self.realtime:
+            delay = timestamp - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return True, frame, timestamp
+
+    def get_stats(self):
+        """Kaynak istatistikleri (kayıtlı kaynaklarda kare düşmez)"""
+        return {
+            'captured': self.captured_frames,
+            'delivered': self.delivered_frames,
+            'dropped': 0,
+            'drop_rate': 0.0,
+            'underruns': self.underruns,
+        }
+
+    def release(self):
+        """Thread'i durdur ve kaynağı kapat"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._close()
+
+
+# ============================================
+# KAYNAKLAR
+# ============================================
+
+class VideoFileSource(PrefetchSource):
+    """Video dosyasından kare okur; FPS dosyadan alınır"""
+
+    def __init__(self, path, width=None, height=None, **kwargs):
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        kwargs.setdefault('fps', fps if fps and fps > 0 else DEFAULT_SOURCE_FPS)
+        super().__init__(width=width, height=height, **kwargs)
+
+    def _next_frame(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def _rewind(self):
+        return self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def _close(self):
+        self.cap.release()
+
+
+class ImageDirectorySource(PrefetchSource):
+    """Klasördeki resimleri ada göre sıralı kare dizisi olarak okur"""
+
+    def __init__(self, directory, width=None, height=None, **kwargs):
+        self.directory = directory
+        self.files = sorted(
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        self._position = 0
+        super().__init__(width=width, height=height, **kwargs)
+
+    def _next_frame(self):
+        while self._position < len(self.files):
+            frame = cv2.imread(self.files[self._position])
+            self._position += 1
+            if frame is not None:
+                return frame
+        return None
+
+    def _rewind(self):
+        self._position = 0
+        return bool(self.files)
+
+    def isOpened(self):
+        return bool(self.files)
+
+
+class SyntheticFaceSource(PrefetchSource):
+    """Yüze benzer test deseni: sabit yüz, iki göz ve yatay/dikey salınan irisler
+
+    `frame_count=None` ise kaynak bitmez.
+    """
+
+    def __init__(self, width=1280, height=720, frame_count=None, **kwargs):
+        self.frame_count = frame_count
+        self._generated = 0
+        super().__init__(width=width, height=height, **kwargs)
+        self._base = self._render_face(width, height)
+        self._eyes = self._eye_geometry(width, height)
+
+    @staticmethod
+    def _eye_geometry(width, height):
+        cx, cy = width // 2, height // 2
+        face_h = int(height * 0.36)
+        eye_dx = int(face_h * 0.38)
+        eye_y = cy - int(face_h * 0.18)
+        eye_w, eye_h = int(face_h * 0.2), int(face_h * 0.09)
+        return [(cx - eye_dx, eye_y, eye_w, eye_h), (cx + eye_dx, eye_y, eye_w, eye_h)]
+
+    def _render_face(self, width, height):
+        """Değişmeyen yüz katmanını bir kez çiz"""
+        frame = np.full((height, width, 3), SYNTHETIC_BACKGROUND, dtype=np.uint8)
+        cx, cy = width // 2, height // 2
+        face_h = int(height * 0.36)
+        cv2.ellipse(frame, (cx, cy), (int(face_h * 0.78), face_h), 0, 0, 360, SYNTHETIC_SKIN, -1, cv2.LINE_AA)
+
+        for ex, ey, ew, eh in self._eye_geometry(width, height):
+            cv2.ellipse(frame, (ex, ey - int(eh * 2.2)), (ew, eh // 2), 0, 0, 360, (60, 80, 100), -1, cv2.LINE_AA)
+            cv2.ellipse(frame, (ex, ey), (ew, eh), 0, 0, 360, (245, 245, 245), -1, cv2.LINE_AA)
+            cv2.ellipse(frame, (ex, ey), (ew, eh), 0, 0, 360, (40, 60, 80), 2, cv2.LINE_AA)
+
+        nose = np.array([[cx, cy - face_h // 8], [cx - face_h // 10, cy + face_h // 5],
+                         [cx + face_h // 10, cy + face_h // 5]], dtype=np.int32)
+        cv2.polylines(frame, [nose], True, (100, 130, 170), 3, cv2.LINE_AA)
+        cv2.ellipse(frame, (cx, cy + int(face_h * 0.5)), (face_h // 3, face_h // 10), 0, 0, 180,
+                    (70, 70, 160), 4, cv2.LINE_AA)
+        return frame
+
+    def _next_frame(self):
+        if self.frame_count is not None and self._generated >= self.frame_count:
+            return None
+        offset_x, offset_y = self._iris_offset(self._generated)
+        self._generated += 1
+
+        frame = self._base.copy()
+        for ex, ey, ew, eh in self._eyes:
+            ix = int(ex + offset_x * ew)
+            iy = int(ey + offset_y * eh)
+            cv2.circle(frame, (ix, iy), int(eh * 0.85), (60, 40, 30), -1, cv2.LINE_AA)
+            cv2.circle(frame, (ix, iy), int(eh * 0.4), (10, 10, 10), -1, cv2.LINE_AA)
+        return frame
+
+    def _rewind(self):
+        self._generated = 0
+        return True
+
+    def _iris_offset(self, index):
+        """`index`. karede irisin göz merkezine göre kayması (göz boyutu oranında)"""
+        phase = 2.0 * np.pi * (index / self.fps) / SYNTHETIC_SWEEP_PERIOD
+        return SYNTHETIC_IRIS_SWEEP * np.sin(phase), 0.5 * SYNTHETIC_IRIS_SWEEP * np.sin(2.0 * phase)
+
+    def eye_points(self, index):
+        """`index`. karenin gerçek göz noktaları: normalize (10, 3)
+
+        Satır sırası landmark_adapter.EYE_LANDMARK_ORDER ile aynıdır (iris
+        merkezleri, köşeler, üst / alt kapaklar; her çiftte önce sol göz).
+        """
+        offset_x, offset_y = self._iris_offset(index)
+        (lx, ly, w, h), (rx, ry, _, _) = self._eyes
+        rows = [
+            (lx + offset_x * w, ly + offset_y * h), (rx + offset_x * w, ry + offset_y * h),
+            (lx - w, ly), (rx - w, ry), (lx + w, ly), (rx + w, ry),
+            (lx, ly - h), (rx, ry - h), (lx, ly + h), (rx, ry + h),
+        ]
+        width, height = self.size
+        points = np.zeros((len(rows), 3))
+        points[:, :2] = np.array(rows) / (width, height)
+        return points
+
+
+# ============================================
+# FABRİKA
+# ============================================
+
+def open_frame_source(spec=0, width=None, height=None, fps=None, realtime=False, loop=False):
+    """Tanımdan kare kaynağı oluştur (başlatılmamış)
+
+    - int veya rakam dizgisi: kamera indeksi (ThreadedCamera)
+    - 'synthetic' veya 'synthetic:60': sentetik yüz deseni (isteğe bağlı FPS)
+    - klasör yolu: resim dizisi
+    - diğer yollar: video dosyası
+    """
+    if isinstance(spec, int) or (isinstance(spec, str) and spec.isdigit()):
+        return ThreadedCamera(int(spec), width, height)
+
+    options = {'realtime': realtime, 'loop': loop}
+    if fps:
+        options['fps'] = fps
+
+    if spec == 'synthetic' or spec.startswith('synthetic:'):
+        _, _, rate = spec.partition(':')
+        if rate:
+            options['fps'] = float(rate)
+        return SyntheticFaceSource(width or 1280, height or 720, **options)
+    if os.path.isdir(spec):
+        return ImageDirectorySource(spec, width, height, **options)
+    if not os.path.isfile(spec):
+        raise ValueError(f"Kare kaynagi bulunamadi: {spec}")
+    return VideoFileSource(spec, width, height, **options)
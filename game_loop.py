@@ -0,0 +1,152 @@
+"""
+Sabit Adımlı Oyun Döngüsü
+- Fizik `update(dt)` ile sabit adımda ilerler; oyun zorluğu makine hızından bağımsızdır
+- Çizim değişken hızdadır; `alpha` (0-1) son iki fizik adımı arasında ara konum verir
+- Adımlar mutlak zaman ızgarasına hizalanır: bir karede kaç adım atılacağı sadece
+  kare zamanlarına bağlıdır, kayıtlı zamanlarla oynatılan oturum aynı adımları atar
+- FPS sınırı, boşta yavaşlama (statik ekranlar) ve düşen kare / jitter sayaçları
+"""
+
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+LOOP_UPDATE_RATE = 60  # Hz - fizik adımı
+LOOP_MAX_UPDATES = 5  # Bir karede en fazla adım; takılmadan sonra fazlası atılır
+LOOP_IDLE_FPS = 10  # Boşta (statik ekran) kare hızı
+LOOP_DROP_FACTOR = 1.5  # Beklenen aralığın bu katından uzun kare = düşen kare
+LOOP_EXPECTED_SMOOTHING = 0.05  # Sınırsız döngüde beklenen aralık (EMA)
+LOOP_STATS_WINDOW = 600  # Jitter yüzdelikleri için son N kare
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class GameLoop:
+    """Sabit adımlı güncelleme + değişken hızlı çizim için kare zamanlayıcısı.
+
+    Her karenin başında `tick(update)` çağrılır: son kareden bu yana geçen
+    her fizik adımı için `update(step_dt)` çalışır ve çizim için `alpha`
+    döner. Kare sonunda bekleme (`waitKey` / girdi pompası) `wait_ms()`
+    kadar yapılır; bu süre `fps_cap` (None = sınırsız) veya `idle` iken
+    LOOP_IDLE_FPS hızına göre bir sonraki kare zamanına kadar kalan süredir.
+    `idle` iken fizik durur ve kare istatistikleri tutulmaz; boştan çıkılan
+    ilk karede de adım atılmaz.
+    """
+
+    def __init__(self, update_rate=LOOP_UPDATE_RATE, fps_cap=None, idle_fps=LOOP_IDLE_FPS,
+                 max_updates=LOOP_MAX_UPDATES):
+        self.step_dt = 1.0 / update_rate
+        self.frame_interval = 1.0 / fps_cap if fps_cap else 0.0
+        self.idle_interval = 1.0 / idle_fps
+        self.max_updates = max_updates
+        self.idle = False
+        self.alpha = 1.0
+        self._step_index = None  # Son karedeki mutlak adım numarası
+        self._last_tick = None
+        self._last_idle = False
+        self._deadline = None  # Sonraki karenin başlaması gereken an
+        self._expected = self.frame_interval or None
+
+        # Sayaçlar
+        self.frames = 0
+        self.idle_frames = 0
+        self.updates = 0
+        self.skipped_updates = 0  # max_updates aşıldığı için atılan adımlar
+        self.dropped_frames = 0
+        self.active_intervals = 0
+        self.active_time = 0.0
+        self.jitter = deque(maxlen=LOOP_STATS_WINDOW)  # |aralık - beklenen| (saniye)
+
+    # ============================================
+    # KARE
+    # ============================================
+
+    def tick(self, update=None, now=None):
+        """Yeni kare: bekleyen fizik adımlarını çalıştır, çizim için alpha döndür
+
+        `now` verilirse saat okunmaz (kayıtlı kaynak / iz oynatma).
+        """
+        now = time.perf_counter() if now is None else now
+        index = math.floor(now / self.step_dt)
+        if self._last_tick is not None:
+            if not self.idle and not self._last_idle:
+                self._record_interval(now - self._last_tick)
+            steps = index - self._step_index
+            if self.idle or self._last_idle or update is None:
+                steps = 0  # Boştan çıkarken birikmiş adımlar atılmaz
+            elif steps > self.max_updates:
+                self.skipped_updates += steps - self.max_updates
+                steps = self.max_updates
+            for _ in range(steps):
+                update(self.step_dt)
+            self.updates += steps
+
+        self._step_index = index
+        self._last_tick = now
+        self._last_idle = self.idle
+        self.frames += 1
+        if self.idle:
+            self.idle_frames += 1
+        self.alpha = now / self.step_dt - index
+        return self.alpha
+
+    def _record_interval(self, interval):
+        """Kare aralığını beklenen aralıkla karşılaştır"""
+        self.active_intervals += 1
+        self.active_time += interval
+        expected = self.frame_interval or self._expected
+        if expected is None:
+            self._expected = interval
+            return
+        self.jitter.append(abs(interval - expected))
+        if interval > expected * LOOP_DROP_FACTOR:
+            self.dropped_frames += max(1, round(interval / expected) - 1)
+        if not self.frame_interval:
+            self._expected += (interval - self._expected) * LOOP_EXPECTED_SMOOTHING
+
+    def wait_ms(self):
+        """Sonraki kare zamanına kadar beklenecek süre (ms, en az 1)"""
+        interval = self.idle_interval if self.idle else self.frame_interval
+        if not interval or self._last_tick is None:
+            return 1
+        now = time.perf_counter()
+        if self._deadline is None or now - self._deadline > interval:
+            # İlk kare veya geride kalındı: ızgarayı bu kareden yeniden başlat
+            self._deadline = self._last_tick
+        self._deadline += interval
+        return max(1, math.ceil((self._deadline - now) * 1000))
+
+    # ============================================
+    # RAPOR
+    # ============================================
+
+    def get_stats(self):
+        """Döngü istatistikleri"""
+        jitter = np.asarray(self.jitter) * 1000
+        return {
+            'frames': self.frames,
+            'idle_frames': self.idle_frames,
+            'fps': self.active_intervals / self.active_time if self.active_time > 0 else 0.0,
+            'updates': self.updates,
+            'skipped_updates': self.skipped_updates,
+            'dropped_frames': self.dropped_frames,
+            'jitter_mean_ms': float(jitter.mean()) if len(jitter) else 0.0,
+            'jitter_p95_ms': float(np.percentile(jitter, 95)) if len(jitter) else 0.0,
+        }
+
+    def describe(self):
+        """Tek satırlık özet"""
+        stats = self.get_stats()
+        return (f"{stats['frames']} kare ({stats['idle_frames']} bosta), ort {stats['fps']:.1f} FPS, "
+                f"{stats['dropped_frames']} kare dustu, jitter ort {stats['jitter_mean_ms']:.2f} / "
+                f"p95 {stats['jitter_p95_ms']:.2f} ms, {stats['updates']} fizik adimi "
+                f"({stats['skipped_updates']} atlandi)")
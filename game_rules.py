@@ -0,0 +1,309 @@
+"""
+Ekrandan Bağımsız Oyun Kuralları
+- Stage 1 (hedef turu, tıklama sonucu, adaptif hız), Stage 2 (komut seçimi, hareket,
+  tuş sonucu) ve Stage 3 (odak puanlama, top hareketi) kuralları OpenCV penceresi
+  olmadan çalışır
+- Oyun aşamaları çizim ve girdiyi, simülasyon (simulation.py) botları bu kurallara bağlar
+- Rastgelelik `rng` (random.Random uyumlu) ve `seed` ile verilir; aynı tohum aynı oyunu üretir
+"""
+
+import random
+from collections import namedtuple
+
+from target_field import TargetField
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+# Stage 1 - Mouse
+MOUSE_ROUNDS = 10
+MOUSE_BASE_SPEED = 3  # Adım başına piksel (MOUSE_UPDATE_RATE'te)
+MOUSE_SPEED_PENALTY = 0.2  # Yanlış tıklamada hız çarpanı artışı
+MOUSE_UPDATE_RATE = 60  # Hz - sabit fizik adımı
+MOUSE_TARGET_RADIUS = (30, 60)
+SWARM_TARGET_COUNT = 30  # Sürü modu: doğru renkten hedef sayısı
+SWARM_DISTRACTOR_COUNT = 370
+SWARM_RADIUS = (8, 16)
+
+# Stage 2 - Klavye
+KEYBOARD_MAX_MOVES = 20
+KEYBOARD_BASE_SPEED = 4.0  # Adım başına piksel (KEYBOARD_UPDATE_RATE'te)
+KEYBOARD_SPEED_INCREASE = 0.2  # Doğru tuşta hız artışı
+KEYBOARD_UPDATE_RATE = 50  # Hz - sabit fizik adımı (eski 20 ms döngü hızı)
+KEYBOARD_PLAYER_RADIUS = 18
+KEYBOARD_TOP = 120  # Oyun alanının üst sınırı (komut yazısının altı)
+COMMANDS = ("YUKARI", "ASAGI", "SOL", "SAG")
+OPPOSITE_COMMAND = {"YUKARI": "ASAGI", "ASAGI": "YUKARI", "SOL": "SAG", "SAG": "SOL"}
+
+# Stage 3 - Odak
+FOCUS_THRESHOLD = 100  # Piksel
+FOCUS_REQUIRED_TIME = 1.0  # Saniye
+FOCUS_LOSS_TOLERANCE = 0.5  # Saniye
+FOCUS_DECAY_RATE = 0.3
+FOCUS_MIN_ATTEMPT = 0.3  # Saniye; bundan kısa odak kaybı deneme sayılmaz
+FOCUS_SUCCESS = 'BASARILI_ODAK'
+FOCUS_LOST = 'ODAK_KAYBI'
+
+
+ClickResult = namedtuple('ClickResult', 'round correct target clicked')
+MoveResult = namedtuple('MoveResult', 'correct target pressed')
+
+
+# ============================================
+# STAGE 1 - MOUSE
+# ============================================
+
+class MouseRules:
+    """Renk hedefi turları: tur oluşturma, tıklama değerlendirme, adaptif hız.
+
+    Hedefler `targets` (TargetField) içinde tutulur; `update(dt)` sabit
+    fizik adımıdır. `click(x, y)` boşa tıklamada None, aksi halde
+    ClickResult döndürür; ardından `advance()` tur sayısı dolduysa
+    `game_over` yapar, yoksa yeni tur oluşturur.
+    """
+
+    def __init__(self, palette, bounds, swarm=False, rounds=MOUSE_ROUNDS, base_speed=MOUSE_BASE_SPEED,
+                 speed_penalty=MOUSE_SPEED_PENALTY, update_rate=MOUSE_UPDATE_RATE, rng=None, seed=None):
+        self.targets = TargetField(palette, bounds, seed=seed)
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.swarm = swarm
+        self.rounds = rounds
+        self.base_speed = base_speed
+        self.speed_penalty = speed_penalty
+        self.update_rate = update_rate
+        self.spawn_area = (bounds[0] + 100, bounds[1] + 50, bounds[2] - 100, bounds[3] - 100)
+
+        self.round = 0
+        self.correct = 0
+        self.wrong = 0
+        self.speed_multiplier = 1.0
+        self.target_name = None
+        self.game_over = False
+
+    def new_round(self):
+        """Yeni tur: hedef renk seç, hedefleri ve çeldiricileri yerleştir"""
+        rng, targets = self.rng, self.targets
+        self.round += 1
+        self.target_name = rng.choice(targets.names)
+        distractors = [name for name in targets.names if name != self.target_name]
+        rng.shuffle(distractors)
+        speed = self.base_speed * self.speed_multiplier
+        area = self.spawn_area
+        targets.clear()
+
+        if self.swarm:
+            # Çeldiriciler önce, hedefler en üstte; renkler arasında eşit dağıtılır
+            per_color = SWARM_DISTRACTOR_COUNT // len(distractors)
+            for name in distractors:
+                targets.spawn(per_color, name, area, SWARM_RADIUS, speed)
+            targets.spawn(SWARM_TARGET_COUNT, self.target_name, area, SWARM_RADIUS, speed)
+        else:
+            targets.spawn(1, self.target_name, area, MOUSE_TARGET_RADIUS, speed)
+            for name in distractors[:rng.randint(2, 3)]:
+                targets.spawn(1, name, area, MOUSE_TARGET_RADIUS, speed)
+
+    def update(self, dt):
+        """Sabit fizik adımı"""
+        self.targets.step(dt * self.update_rate)
+
+    def click(self, x, y):
+        """Tıklamayı değerlendir; hedefe değmediyse None"""
+        index = self.targets.hit_test(x, y)
+        if index < 0:
+            return None
+        clicked = self.targets.name_of(index)
+        result = ClickResult(self.round, clicked == self.target_name, self.target_name, clicked)
+        if result.correct:
+            self.correct += 1
+        else:
+            self.wrong += 1
+            self.speed_multiplier += self.speed_penalty
+        return result
+
+    def advance(self):
+        """Sonuçlanan turdan sonra: oyunu bitir veya yeni tur oluştur"""
+        if self.round >= self.rounds:
+            self.game_over = True
+        else:
+            self.new_round()
+
+
+# ============================================
+# STAGE 2 - KLAVYE
+# ============================================
+
+class KeyboardRules:
+    """Yön komutu oyunu: sürekli hareket eden oyuncu, komut seçimi, tuş sonucu.
+
+    `update(dt)` oyuncuyu bir sabit adım ilerletir ve duvarda yönünü
+    çevirir; (`prev_x`, `prev_y`) çizim ara konumu için önceki adımdır.
+    `press(command)` MoveResult döndürür ve yeni komutu seçer.
+    """
+
+    def __init__(self, width, height, max_moves=KEYBOARD_MAX_MOVES, base_speed=KEYBOARD_BASE_SPEED,
+                 speed_increase=KEYBOARD_SPEED_INCREASE, update_rate=KEYBOARD_UPDATE_RATE,
+                 player_radius=KEYBOARD_PLAYER_RADIUS, top=KEYBOARD_TOP, rng=None, seed=None):
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.width = width
+        self.height = height
+        self.top = top
+        self.max_moves = max_moves
+        self.speed_increase = speed_increase
+        self.update_rate = update_rate
+        self.player_radius = player_radius
+
+        self.x, self.y = width // 2, height // 2
+        self.prev_x, self.prev_y = self.x, self.y
+        self.speed = base_speed
+        self.direction = self.rng.choice(COMMANDS)
+        self.moves = 0
+        self.correct = 0
+        self.wall_hits = 0
+        self.command = self.next_command()
+
+    @property
+    def game_over(self):
+        return self.moves >= self.max_moves
+
+    def next_command(self):
+        """Duvara doğru olmayan ve mevcut yönden farklı rastgele komut"""
+        x, y, r = self.x, self.y, self.player_radius
+        available = list(COMMANDS)
+        if y - r <= self.top + 20:
+            available.remove("YUKARI")
+        if y + r >= self.height - 20:
+            available.remove("ASAGI")
+        if x - r <= 20:
+            available.remove("SOL")
+        if x + r >= self.width - 20:
+            available.remove("SAG")
+        if self.direction in available:
+            available.remove(self.direction)
+        if not available:
+            return OPPOSITE_COMMAND.get(self.direction, self.rng.choice(COMMANDS))
+        return self.rng.choice(available)
+
+    def update(self, dt):
+        """Sabit adım: oyuncuyu hareket ettir, duvarda yön değiştir"""
+        self.prev_x, self.prev_y = self.x, self.y
+        step = self.speed * dt * self.update_rate
+        direction = self.direction
+        if direction == "YUKARI":
+            self.y -= step
+        elif direction == "ASAGI":
+            self.y += step
+        elif direction == "SOL":
+            self.x -= step
+        elif direction == "SAG":
+            self.x += step
+
+        # Sınır kontrolü
+        r = self.player_radius
+        if self.x - r <= 0:
+            self.x, self.direction = r, "SAG"
+        elif self.x + r >= self.width:
+            self.x, self.direction = self.width - r, "SOL"
+        if self.y - r <= self.top:
+            self.y, self.direction = self.top + r, "ASAGI"
+        elif self.y + r >= self.height:
+            self.y, self.direction = self.height - r, "YUKARI"
+        if self.direction != direction:
+            self.wall_hits += 1
+
+    def press(self, command):
+        """Basılan yön komutunu değerlendir, yönü/hızı güncelle ve yeni komut seç"""
+        result = MoveResult(command == self.command, self.command, command)
+        self.moves += 1
+        if result.correct:
+            self.correct += 1
+            self.speed += self.speed_increase
+        self.direction = command
+        self.command = self.next_command()
+        return result
+
+
+# ============================================
+# STAGE 3 - ODAK
+# ============================================
+
+class FocusRule:
+    """Topa bakış süresine göre odak puanlama (kayıp toleranslı).
+
+    Bakış top eşik mesafesi içindeyken süre birikir; `required_time`
+    dolunca FOCUS_SUCCESS döner. Dışarıda kalınca `loss_tolerance`
+    boyunca odak korunur (biriken süre azalır), sonra sıfırlanır; yeterince
+    uzun süren odak kaybı FOCUS_LOST döner. Olayın süresi `event_duration`.
+    """
+
+    def __init__(self, threshold=FOCUS_THRESHOLD, required_time=FOCUS_REQUIRED_TIME,
+                 loss_tolerance=FOCUS_LOSS_TOLERANCE, decay_rate=FOCUS_DECAY_RATE):
+        self.threshold = threshold
+        self.required_time = required_time
+        self.loss_tolerance = loss_tolerance
+        self.decay_rate = decay_rate
+        self.event_duration = 0.0
+        self.reset()
+
+    def reset(self):
+        """Odak durumunu sıfırla"""
+        self.is_focused = False
+        self.start_time = None
+        self.duration = 0.0
+        self.loss_start = None  # Odak kaybının başladığı zaman
+        self.accumulated = 0.0  # Biriken odak süresi (toleranslı)
+
+    def lose_eyes(self, now):
+        """Göz bulunamadı: tolerans süresi kadar odağı koru"""
+        if self.is_focused and self.loss_start is None:
+            self.loss_start = now
+        if self.loss_start and now - self.loss_start > self.loss_tolerance:
+            self.reset()
+
+    def update(self, distance, now, dt):
+        """Bakış-top mesafesiyle durumu ilerlet; FOCUS_SUCCESS / FOCUS_LOST / None"""
+        if distance < self.threshold:
+            self.loss_start = None
+            if not self.is_focused:
+                self.is_focused = True
+                self.start_time = now
+                self.accumulated = 0.0
+                return None
+            self.duration = now - self.start_time
+            self.accumulated = self.duration
+            if self.accumulated >= self.required_time:
+                self.event_duration = self.duration
+                self.reset()
+                return FOCUS_SUCCESS
+            return None
+
+        if not self.is_focused:
+            return None
+        if self.loss_start is None:
+            self.loss_start = now
+        elif now - self.loss_start > self.loss_tolerance:
+            accumulated = self.accumulated
+            self.reset()
+            if accumulated > FOCUS_MIN_ATTEMPT:
+                self.event_duration = accumulated
+                return FOCUS_LOST
+        elif self.accumulated > 0:
+            self.accumulated -= self.decay_rate * dt
+        return None
+
+
+def move_ball(x, y, vx, vy, radius, width, height, step):
+    """Topu `step` kare ilerlet, duvarda sektir; (x, y, vx, vy, sekti_mi)"""
+    x += vx * step
+    y += vy * step
+    bounced = False
+    if x <= radius or x >= width - radius:
+        vx = -vx
+        bounced = True
+    if y <= radius or y >= height - radius:
+        vy = -vy
+        bounced = True
+    x = max(radius, min(width - radius, x))
+    y = max(radius, min(height - radius, y))
+    return x, y, vx, vy, bounced
@@ -0,0 +1,137 @@
+"""
+Regresyon Tabanlı Bakış Kalibrasyonu
+- 5, 9 ve 16 noktalı kalibrasyon ızgaraları
+- Kalibrasyon sonunda iris -> ekran eşlemesi en küçük kareler ile bir kez uydurulur
+- Her karede sadece önceden hesaplanmış katsayı matrisi ile tek çarpım yapılır
+- Çok oyunculu modda tüm oyuncuların eşlemeleri yığın halinde tek çarpımla uygulanır
+"""
+
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+CALIBRATION_MARGIN_X = 200  # Ekran kenarından yatay uzaklık (piksel)
+CALIBRATION_MARGIN_Y = 150  # Ekran kenarından dikey uzaklık (piksel)
+SUPPORTED_GRIDS = (5, 9, 16)
+
+# 5 noktalı klasik yerleşim ve ekrandaki isimleri
+LEGACY_POINT_LABELS = {
+    'center': 'MERKEZ', 'left': 'SOL', 'right': 'SAG',
+    'top': 'YUKARI', 'bottom': 'ASAGI',
+}
+
+
+# ============================================
+# IZGARA OLUŞTURMA
+# ============================================
+
+def make_calibration_grid(n_points, width, height,
+                          margin_x=CALIBRATION_MARGIN_X, margin_y=CALIBRATION_MARGIN_Y):
+    """Kalibrasyon noktalarını sırasıyla döndür: [(isim, etiket, (x, y)), ...]"""
+    if n_points not in SUPPORTED_GRIDS:
+        raise ValueError(f"Desteklenmeyen kalibrasyon izgarasi: {n_points} (secenekler: {SUPPORTED_GRIDS})")
+
+    if n_points == 5:
+        cx, cy = width // 2, height // 2
+        layout = [
+            ('center', (cx, cy)),
+            ('left', (margin_x, cy)),
+            ('right', (width - margin_x, cy)),
+            ('top', (cx, margin_y)),
+            ('bottom', (cx, height - margin_y)),
+        ]
+        return [(name, LEGACY_POINT_LABELS[name], pos) for name, pos in layout]
+
+    side = int(round(np.sqrt(n_points)))
+    xs = np.linspace(margin_x, width - margin_x, side).astype(int)
+    ys = np.linspace(margin_y, height - margin_y, side).astype(int)
+
+    points = []
+    for row, y in enumerate(ys):
+        # Yılan sırası: göz her satırda en yakın noktaya geçer
+        row_xs = xs if row % 2 == 0 else xs[::-1]
+        for x in row_xs:
+            index = len(points) + 1
+            points.append((f'p{index}', f'{index}', (int(x), int(y))))
+    return points
+
+
+# ============================================
+# EŞLEME MODELİ
+# ============================================
+
+def _quadratic_features(iris_x, iris_y):
+    """İkinci derece polinom öznitelikleri: [1, x, y, xy, x^2, y^2]"""
+    return np.stack([
+        np.ones_like(iris_x), iris_x, iris_y,
+        iris_x * iris_y, iris_x ** 2, iris_y ** 2,
+    ], axis=-1)
+
+
+def _affine_features(iris_x, iris_y):
+    """Doğrusal öznitelikler: [1, x, y]"""
+    return np.stack([np.ones_like(iris_x), iris_x, iris_y], axis=-1)
+
+
+class GazeMapping:
+    """İris (0-1) -> ekran (piksel) eşlemesi; katsayılar bir kez hesaplanır"""
+
+    def __init__(self, coeffs):
+        self.coeffs = np.asarray(coeffs, dtype=np.float64)  # (F, 2)
+        self.degree = 2 if self.coeffs.shape[0] == 6 else 1
+        self._features = np.ones(self.coeffs.shape[0], dtype=np.float64)
+        self.residual_px = 0.0  # Kalibrasyon noktalarındaki ortalama hata
+
+    @classmethod
+    def fit(cls, iris_points, screen_points):
+        """Kalibrasyon örneklerinden en küçük kareler uydurması yap
+
+        9 ve üzeri noktada ikinci derece polinom, daha azında doğrusal
+        (afin) model kullanılır. Yetersiz veri varsa None döner.
+        """
+        iris_points = np.asarray(iris_points, dtype=np.float64)
+        screen_points = np.asarray(screen_points, dtype=np.float64)
+        if len(iris_points) < 3:
+            return None
+
+        feature_fn = _quadratic_features if len(iris_points) >= 9 else _affine_features
+        design = feature_fn(iris_points[:, 0], iris_points[:, 1])
+        coeffs, _, rank, _ = np.linalg.lstsq(design, screen_points, rcond=None)
+        if rank < design.shape[1]:
+            # Noktalar aynı yere bakılarak toplanmış - eşleme belirsiz
+            return None
+
+        mapping = cls(coeffs)
+        errors = np.linalg.norm(design @ coeffs - screen_points, axis=1)
+        mapping.residual_px = float(errors.mean())
+        return mapping
+
+    def apply(self, iris_x, iris_y):
+        """Tek örnek için ekran koordinatı: (x, y)"""
+        f = self._features
+        f[1] = iris_x
+        f[2] = iris_y
+        if self.degree == 2:
+            f[3] = iris_x * iris_y
+            f[4] = iris_x * iris_x
+            f[5] = iris_y * iris_y
+        x, y = f @ self.coeffs
+        return x, y
+
+    def apply_batch(self, iris_points):
+        """(K, 2) iris dizisi için (K, 2) ekran koordinatları"""
+        iris_points = np.asarray(iris_points, dtype=np.float64)
+        feature_fn = _quadratic_features if self.degree == 2 else _affine_features
+        return feature_fn(iris_points[..., 0], iris_points[..., 1]) @ self.coeffs
+
+
+def apply_mappings(coeffs, iris_points):
+    """Oyuncu başına katsayı yığını ((P, F, 2)) ile (P, 2) iris için (P, 2) ekran koordinatı"""
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    iris_points = np.asarray(iris_points, dtype=np.float64)
+    feature_fn = _quadratic_features if coeffs.shape[-2] == 6 else _affine_features
+    features = feature_fn(iris_points[..., 0], iris_points[..., 1])
+    return np.einsum('pf,pfd->pd', features, coeffs)
@@ -0,0 +1,247 @@
+"""
+Bakış Noktası Filtreleri
+- Ortak arayüz: reset() ve update(x, y, t) -> (x, y)
+- Durum önceden ayrılmış skalerlerde tutulur; kare başına bellek ayırma yapılmaz
+- Seçenekler: 'legacy' (eski ağırlıklı ortalama), 'one_euro', 'kalman'
+"""
+
+import math
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+# Eski zincir (ağırlıklı ortalama + sıçrama sınırı + üstel yumuşatma)
+LEGACY_HISTORY_SIZE = 6
+LEGACY_SMOOTHING_FACTOR = 0.22
+LEGACY_MAX_JUMP = 150  # Piksel
+
+# One-Euro filtresi (Casiez vd., 2012)
+ONE_EURO_MIN_CUTOFF = 0.3  # Hz - yavaş harekette titreme bastırma
+ONE_EURO_BETA = 0.002  # Hız arttıkça kesim frekansının artış katsayısı
+ONE_EURO_D_CUTOFF = 1.0  # Hz - hız tahmini için kesim
+
+# Sabit hızlı Kalman filtresi
+KALMAN_PROCESS_NOISE = 1.0e5  # (piksel/s^2)^2 - ivme gürültüsü yoğunluğu
+KALMAN_MEASUREMENT_NOISE = 900.0  # piksel^2 - ölçüm gürültüsü varyansı
+
+DEFAULT_DT = 1 / 30.0  # İlk örnekte veya zaman atlamasında kullanılan adım
+MAX_DT = 0.25  # Saniye - daha uzun boşluklarda filtre sıfırlanır
+
+
+# ============================================
+# TEMEL SINIF
+# ============================================
+
+class GazeFilter:
+    """Tüm bakış filtrelerinin ortak arayüzü"""
+
+    name = 'base'
+
+    def __init__(self):
+        self._last_t = None
+
+    def reset(self):
+        """Filtre durumunu temizle"""
+        self._last_t = None
+
+    def _step(self, t):
+        """Önceki örnekten bu yana geçen süre; ilk örnekte None"""
+        if self._last_t is None or t is None:
+            self._last_t = t
+            return None
+        dt = t - self._last_t
+        self._last_t = t
+        if dt <= 0:
+            return DEFAULT_DT
+        if dt > MAX_DT:
+            return None
+        return dt
+
+    def update(self, x, y, t):
+        raise NotImplementedError
+
+
+# ============================================
+# FİLTRELER
+# ============================================
+
+class LegacyGazeFilter(GazeFilter):
+    """Eski zincir: ağırlıklı kayan ortalama -> sıçrama sınırı -> üstel yumuşatma"""
+
+    name = 'legacy'
+
+    def __init__(self, history_size=LEGACY_HISTORY_SIZE,
+                 smoothing=LEGACY_SMOOTHING_FACTOR, max_jump=LEGACY_MAX_JUMP):
+        super().__init__()
+        self.size = history_size
+        self.smoothing = smoothing
+        self.max_jump = max_jump
+        self._hx = [0.0] * history_size
+        self._hy = [0.0] * history_size
+        # np.linspace(0.5, 1.0, n) ağırlıkları, her dolu uzunluk için bir kez
+        self._weights = {
+            n: [0.5 + 0.5 * i / (n - 1) for i in range(n)] if n > 1 else [1.0]
+            for n in range(1, history_size + 1)
+        }
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._count = 0
+        self._head = 0
+        self._px = None
+        self._py = None
+
+    def update(self, x, y, t=None):
+        self._hx[self._head] = x
+        self._hy[self._head] = y
+        self._head = (self._head + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+        if self._px is None:
+            self._px, self._py = float(x), float(y)
+            return self._px, self._py
+
+        if self._count >= 3:
+            weights = self._weights[self._count]
+            start = (self._head - self._count) % self.size
+            sx = sy = total = 0.0
+            for i, w in enumerate(weights):
+                j = (start + i) % self.size
+                sx += self._hx[j] * w
+                sy += self._hy[j] * w
+                total += w
+            avg_x, avg_y = sx / total, sy / total
+        else:
+            avg_x, avg_y = x, y
+
+        # Ani büyük sıçramaları sınırla
+        dx = avg_x - self._px
+        dy = avg_y - self._py
+        if abs(dx) > self.max_jump:
+            avg_x = self._px + math.copysign(self.max_jump, dx)
+        if abs(dy) > self.max_jump:
+            avg_y = self._py + math.copysign(self.max_jump, dy)
+
+        self._px += (avg_x - self._px) * self.smoothing
+        self._py += (avg_y - self._py) * self.smoothing
+        return self._px, self._py
+
+
+def _smoothing_alpha(cutoff, dt):
+    """Birinci derece alçak geçiren filtre katsayısı"""
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroGazeFilter(GazeFilter):
+    """Hıza uyarlanan kesim frekanslı One-Euro filtresi (iki eksen)"""
+
+    name = 'one_euro'
+
+    def __init__(self, min_cutoff=ONE_EURO_MIN_CUTOFF, beta=ONE_EURO_BETA, d_cutoff=ONE_EURO_D_CUTOFF):
+        super().__init__()
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._x = self._y = None
+        self._dx = self._dy = 0.0
+
+    def update(self, x, y, t):
+        dt = self._step(t)
+        if self._x is None or dt is None:
+            self._x, self._y = float(x), float(y)
+            self._dx = self._dy = 0.0
+            return self._x, self._y
+
+        # Hız tahmini (kendisi de filtrelenir)
+        a_d = _smoothing_alpha(self.d_cutoff, dt)
+        self._dx += a_d * ((x - self._x) / dt - self._dx)
+        self._dy += a_d * ((y - self._y) / dt - self._dy)
+
+        # Hıza göre kesim frekansı: yavaşken pürüzsüz, hızlıyken gecikmesiz
+        a_x = _smoothing_alpha(self.min_cutoff + self.beta * abs(self._dx), dt)
+        a_y = _smoothing_alpha(self.min_cutoff + self.beta * abs(self._dy), dt)
+        self._x += a_x * (x - self._x)
+        self._y += a_y * (y - self._y)
+        return self._x, self._y
+
+
+class KalmanGazeFilter(GazeFilter):
+    """Sabit hız modelli Kalman filtresi; her eksen için 2x2 kovaryans skalerlerle tutulur"""
+
+    name = 'kalman'
+
+    def __init__(self, process_noise=KALMAN_PROCESS_NOISE, measurement_noise=KALMAN_MEASUREMENT_NOISE):
+        super().__init__()
+        self.q = process_noise
+        self.r = measurement_noise
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        # Eksen başına durum: [konum, hız, P00, P01, P11]
+        self._sx = None
+        self._sy = None
+
+    def _init_axis(self, z):
+        return [float(z), 0.0, self.r, 0.0, self.r * 100.0]
+
+    def _update_axis(self, s, z, dt):
+        p, v, p00, p01, p11 = s
+
+        # Tahmin
+        p += v * dt
+        dt2 = dt * dt
+        q = self.q
+        p00 += dt * (2.0 * p01 + dt * p11) + q * dt2 * dt2 / 4.0
+        p01 += dt * p11 + q * dt2 * dt / 2.0
+        p11 += q * dt2
+
+        # Düzeltme
+        innovation = z - p
+        s_inv = 1.0 / (p00 + self.r)
+        k0 = p00 * s_inv
+        k1 = p01 * s_inv
+        p += k0 * innovation
+        v += k1 * innovation
+        p11 -= k1 * p01
+        p01 -= k0 * p01
+        p00 -= k0 * p00
+
+        s[0], s[1], s[2], s[3], s[4] = p, v, p00, p01, p11
+        return p
+
+    def update(self, x, y, t):
+        dt = self._step(t)
+        if self._sx is None or dt is None:
+            self._sx = self._init_axis(x)
+            self._sy = self._init_axis(y)
+            return self._sx[0], self._sy[0]
+        return self._update_axis(self._sx, x, dt), self._update_axis(self._sy, y, dt)
+
+
+# ============================================
+# FABRİKA
+# ============================================
+
+GAZE_FILTERS = {
+    LegacyGazeFilter.name: LegacyGazeFilter,
+    OneEuroGazeFilter.name: OneEuroGazeFilter,
+    KalmanGazeFilter.name: KalmanGazeFilter,
+}
+
+
+def make_gaze_filter(name, **params):
+    """İsimden filtre oluştur"""
+    try:
+        filter_cls = GAZE_FILTERS[name]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen bakis filtresi: {name} (secenekler: {', '.join(GAZE_FILTERS)})")
+    return filter_cls(**params)
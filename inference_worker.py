@@ -0,0 +1,176 @@
+"""
+Boru Hattı (Pipeline) FaceMesh Çıkarımı
+- FaceMesh.process çağrısını ayrı bir worker thread'inde çalıştırır
+- Ana döngü N. kareyi çizerken worker N+1. kare üzerinde çalışır
+- Her sonuç, geldiği karenin yakalama zamanını taşır
+- Çıkarım girdileri sabit sayıda yeniden kullanılan tampona yazılır
+"""
+
+import threading
+import time
+
+from face_roi import to_inference_rgb
+from frame_buffers import FrameBuffer
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+# İşlenen + bekleyen + yazılan kare; yazılan tampon hiçbir zaman worker'da olmaz
+INFERENCE_BUFFER_COUNT = 3
+
+
+# ============================================
+# SONUÇ YAPISI
+# ============================================
+
+class InferenceResult:
+    """Tek bir karenin çıkarım sonucu"""
+
+    __slots__ = ('seq', 'timestamp', 'multi_face_landmarks', 'frame_shape', 'latency', 'process_time')
+
+    def __init__(self, seq, timestamp, multi_face_landmarks, frame_shape, latency, process_time=0.0):
+        self.seq = seq  # Gönderilen karenin sıra numarası
+        self.timestamp = timestamp  # Karenin yakalama zamanı (perf_counter)
+        self.multi_face_landmarks = multi_face_landmarks
+        self.frame_shape = frame_shape
+        self.latency = latency  # Yakalama -> sonuç süresi (saniye)
+        self.process_time = process_time  # Sadece face_mesh.process süresi (saniye)
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class FaceMeshWorker:
+    """FaceMesh'i arka planda çalıştıran tek-slotlu worker.
+
+    Worker meşgulken gönderilen kareler kuyruğa alınmaz; bekleyen slot en
+    yeni kare ile değiştirilir, böylece sonuçlar hiçbir zaman birikmez.
+    """
+
+    def __init__(self, face_mesh, roi_tracker=None, profiler=None):
+        self.face_mesh = face_mesh  # Bu nesneyi artık sadece worker kullanır
+        self.roi_tracker = roi_tracker  # Opsiyonel FaceROITracker (roi'si sadece _cond altında okunur/yazılır)
+        self.profiler = profiler  # Opsiyonel LatencyProfiler ('preprocess', 'face_mesh')
+        self.max_width = None  # ROI takibi yokken tam kare çıkarım genişliği
+
+        self._cond = threading.Condition()
+        self._pending = None  # (seq, timestamp, rgb_input, roi, frame_shape, buffer_index)
+        self._buffers = [FrameBuffer() for _ in range(INFERENCE_BUFFER_COUNT)]
+        self._scratch = FrameBuffer()  # Küçültme ara tamponu (sadece submit kullanır)
+        self._processing_index = None  # Worker'ın okuduğu tampon
+        self._result = None
+        self._running = False
+        self._thread = None
+        self._seq = 0
+
+        # Sayaçlar
+        self.submitted_frames = 0
+        self.processed_frames = 0
+        self.skipped_frames = 0  # İşlenmeden üzerine yazılan kareler
+
+    def start(self):
+        """Worker thread'ini başlat"""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._worker_loop, name="FaceMeshWorker", daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, frame, timestamp=None):
+        """BGR kareyi çıkarım için gönder (RGB kopyası worker tamponuna alınır)"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        # Worker'ın okumadığı ve beklemede olmayan tampon seçilir; ana döngü
+        # orijinal kare üzerine güvenle çizebilir. ROI, worker'daki finish ile
+        # aynı kilit altında kopyalanır; kırpma bu kopyayla yapılır
+        with self._cond:
+            busy = (self._processing_index, self._pending[5] if self._pending is not None else None)
+            roi = self.roi_tracker.roi if self.roi_tracker is not None else None
+        index = next(i for i in range(len(self._buffers)) if i not in busy)
+        out = self._buffers[index]
+
+        start_ns = time.perf_counter_ns()
+        if self.roi_tracker is not None:
+            rgb_input, roi = self.roi_tracker.prepare_roi(frame, roi, out)
+        else:
+            rgb_input, roi = to_inference_rgb(frame, self.max_width, out, self._scratch), None
+        if self.profiler is not None:
+            self.profiler.record('preprocess', time.perf_counter_ns() - start_ns)
+
+        with self._cond:
+            self._seq += 1
+            if self._pending is not None:
+                self.skipped_frames += 1
+            self._pending = (self._seq, timestamp, rgb_input, roi, frame.shape, index)
+            self.submitted_frames += 1
+            self._cond.notify_all()
+        return self._seq
+
+    def _worker_loop(self):
+        """Bekleyen en yeni kareyi işle"""
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                seq, timestamp, rgb_input, roi, frame_shape, index = self._pending
+                self._pending = None
+                self._processing_index = index
+
+            start_ns = time.perf_counter_ns()
+            results = self.face_mesh.process(rgb_input)
+            process_ns = time.perf_counter_ns() - start_ns
+            if self.profiler is not None:
+                self.profiler.record('face_mesh', process_ns)
+            multi_face_landmarks = results.multi_face_landmarks
+
+            with self._cond:
+                # finish ROI'yi değiştirir; submit aynı kilit altında okur
+                if self.roi_tracker is not None:
+                    multi_face_landmarks = self.roi_tracker.finish(multi_face_landmarks, roi, frame_shape)
+                result = InferenceResult(
+                    seq, timestamp, multi_face_landmarks,
+                    frame_shape, time.perf_counter() - timestamp, process_ns / 1e9
+                )
+                self._result = result
+                self._processing_index = None
+                self.processed_frames += 1
+                self._cond.notify_all()
+
+    def latest(self):
+        """Son tamamlanan sonucu döndür (henüz yoksa None)"""
+        with self._cond:
+            return self._result
+
+    def wait_for(self, seq, timeout=1.0):
+        """Belirtilen sıra numarasına kadar olan sonucu bekle"""
+        deadline = time.perf_counter() + timeout
+        with self._cond:
+            while self._result is None or self._result.seq < seq:
+                remaining = deadline - time.perf_counter()
+                if not self._running or remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._result
+
+    def get_stats(self):
+        """Worker istatistiklerini döndür"""
+        return {
+            'submitted': self.submitted_frames,
+            'processed': self.processed_frames,
+            'skipped': self.skipped_frames,
+        }
+
+    def stop(self):
+        """Worker'ı durdur"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
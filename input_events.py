@@ -0,0 +1,151 @@
+"""
+Yüksek Çözünürlüklü Girdi Zaman Damgası
+- Fare ve klavye olayları `perf_counter_ns` ile, teslim edildikleri ana en yakın
+  noktada damgalanır ve oyun mantığının boşalttığı bir kuyrukta tutulur
+- OpenCV olayları sadece `waitKey` içinde teslim eder; çizim sırasında gelen
+  olay bir sonraki beklemenin başında görülür. Bu durumda olayın gerçek anı
+  [önceki bekleme sonu, görüldüğü an] aralığındadır: damga aralığın ortası,
+  ölçüm hatası yarı genişliğidir
+- Bekleme süresince gelen olaylar anında damgalanır (hata ~0)
+- Oturum sonunda olay başına ölçüm hatası ve döngü dışı süre raporlanır
+- `imshow` ile verilen kare ekrana ilk `waitKey` içinde çizilir; pompa bunu
+  1 ms'lik ilk beklemeyle yapar ve ardından gösterim anını (`presented_ns`)
+  kaydeder. Uyaran başlangıcı bu andan ölçülür
+"""
+
+import time
+from collections import deque, namedtuple
+
+import cv2
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+INPUT_PENDING_SLACK_NS = 1_000_000  # Beklemenin ilk 1 ms'inde görülen olay önceden birikmiş sayılır
+INPUT_STATS_WINDOW = 1000  # Yüzdelikler için son N olay / bekleme
+PRESENT_WAIT_MS = 1  # Pencerenin yeniden çizildiği ilk bekleme
+
+
+InputEvent = namedtuple('InputEvent', ['kind', 'code', 'x', 'y', 't_ns', 'error_ns'])
+InputEvent.__doc__ = """Damgalı girdi olayı: kind 'key' / 'mouse', t_ns tahmini an, error_ns en fazla hata"""
+
+
+def _percentile(values, q):
+    """Sıralı olmayan listenin q yüzdeliği (en yakın sıra)"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class InputQueue:
+    """Bir OpenCV penceresinin girdi olaylarını damgalayıp kuyruklayan pompa.
+
+    `pump(wait_ms)` eski `cv2.waitKey(wait_ms)` çağrısının yerini alır: süre
+    dolana kadar bekler, erken gelen tuşta dönmez ve bu arada gelen tüm
+    olayları kuyruğa ekler. Oyun mantığı `drain()` ile olayları sırayla alır.
+    Fare olaylarından sadece `mouse_events` içindekiler kuyruğa girer.
+    Her pompanın ilk beklemesi son `imshow` karesini ekrana çizer; bu
+    beklemenin dönüş anı `presented_ns` olarak saklanır.
+    """
+
+    def __init__(self, window_name, mouse_events=(cv2.EVENT_LBUTTONDOWN,)):
+        self.events = deque()
+        self.mouse_events = frozenset(mouse_events)
+        now = time.perf_counter_ns()
+        self._last_return = now  # Son waitKey dönüşü: sonraki olayın en erken anı
+        self._call_start = now
+        self.presented_ns = None  # Son pompada karenin ekrana çizildiği an
+        if self.mouse_events:
+            cv2.setMouseCallback(window_name, self._on_mouse)
+
+        # Sayaçlar
+        self.live_events = 0  # Bekleme sırasında gelen (anında damgalanan) olaylar
+        self.pending_events = 0  # Çizim sırasında birikip beklemenin başında görülen olaylar
+        self.errors_ns = deque(maxlen=INPUT_STATS_WINDOW)
+        self.gaps_ns = deque(maxlen=INPUT_STATS_WINDOW)  # Bekleme dışında geçen süre (kare başına)
+        self.max_error_ns = 0
+
+    # ============================================
+    # POMPA
+    # ============================================
+
+    def pump(self, wait_ms):
+        """`wait_ms` boyunca olayları teslim al; kuyruğa eklenen olay sayısını döndür"""
+        before = len(self.events)
+        start = time.perf_counter_ns()
+        self.gaps_ns.append(start - self._last_return)
+        deadline = start + wait_ms * 1_000_000
+        wait = min(PRESENT_WAIT_MS, wait_ms)
+        self.presented_ns = None
+        while True:
+            self._call_start = time.perf_counter_ns()
+            key = cv2.waitKey(max(1, wait))
+            now = time.perf_counter_ns()
+            if self.presented_ns is None:
+                self.presented_ns = now
+            if key != -1:
+                self._push('key', key & 0xFF, -1, -1, now)
+            self._last_return = now
+            if now >= deadline:
+                break
+            wait = (deadline - now) // 1_000_000
+        return len(self.events) - before
+
+    def _on_mouse(self, event, x, y, flags, param):
+        # waitKey içinden çağrılır; damga mümkün olan en erken anda alınır
+        now = time.perf_counter_ns()
+        if event in self.mouse_events:
+            self._push('mouse', event, x, y, now)
+
+    def _push(self, kind, code, x, y, seen_ns):
+        """Olayı damgala: beklemenin başında görüldüyse önceki bekleme sonuna kadar belirsizdir"""
+        if seen_ns - self._call_start < INPUT_PENDING_SLACK_NS:
+            earliest = self._last_return
+            t_ns = (earliest + seen_ns) // 2
+            error_ns = (seen_ns - earliest) // 2
+            self.pending_events += 1
+        else:
+            t_ns, error_ns = seen_ns, 0
+            self.live_events += 1
+        self.errors_ns.append(error_ns)
+        if error_ns > self.max_error_ns:
+            self.max_error_ns = error_ns
+        self.events.append(InputEvent(kind, code, x, y, t_ns, error_ns))
+
+    def drain(self):
+        """Kuyruktaki olayları geliş sırasıyla döndür ve kuyruğu boşalt"""
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+    # ============================================
+    # RAPOR
+    # ============================================
+
+    def get_stats(self):
+        """Ölçüm hatası istatistikleri (milisaniye)"""
+        errors = list(self.errors_ns)
+        gaps = list(self.gaps_ns)
+        return {
+            'events': self.live_events + self.pending_events,
+            'live_events': self.live_events,
+            'pending_events': self.pending_events,
+            'mean_error_ms': sum(errors) / len(errors) / 1e6 if errors else 0.0,
+            'p95_error_ms': _percentile(errors, 95) / 1e6,
+            'max_error_ms': self.max_error_ns / 1e6,
+            'p95_gap_ms': _percentile(gaps, 95) / 1e6,
+        }
+
+    def describe(self):
+        """Tek satırlık ölçüm hatası özeti"""
+        stats = self.get_stats()
+        return (f"{stats['events']} olay ({stats['live_events']} anlik, {stats['pending_events']} birikmis), "
+                f"olcum hatasi ort {stats['mean_error_ms']:.2f} / p95 {stats['p95_error_ms']:.2f} / "
+                f"en fazla {stats['max_error_ms']:.2f} ms, bekleme disi sure p95 {stats['p95_gap_ms']:.1f} ms")
@@ -0,0 +1,221 @@
+"""
+Anahtar Kare Arası Optik Akış ile İris Takibi
+- FaceMesh her N. karede (anahtar kare) çalışır; aradaki karelerde iris ve göz
+  köşesi noktaları piramidal Lucas-Kanade optik akışıyla taşınır
+- Akış sadece iki gözü kapsayan küçük gri ROI üzerinde hesaplanır
+- İleri-geri tutarlılık ve ROI sınırı kontrolü kayma algılarsa anahtar kare
+  erkene çekilir
+- Planlı anahtar karelerde akış tahmini FaceMesh sonucuyla karşılaştırılarak
+  doğruluk kaybı ölçülür
+"""
+
+import cv2
+import numpy as np
+
+from frame_buffers import FrameBuffer
+from landmark_adapter import iris_position
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+KEYFRAME_INTERVAL = 3  # Her N karede bir FaceMesh (1 = her kare, akış kapalı)
+EYE_ROI_PADDING = 0.35  # Göz kutusu genişliğine göre her yöne eklenen pay
+EYE_ROI_MIN_SIZE = 24  # Bundan küçük göz bölgesinde akış güvenilmez (piksel)
+
+# Lucas-Kanade parametreleri
+LK_WIN_SIZE = (15, 15)
+LK_MAX_LEVEL = 2  # Piramit seviyesi (0 = tek ölçek)
+LK_CRITERIA = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03)
+
+# Kayma kontrolü
+FLOW_FB_THRESHOLD = 1.0  # İleri-geri hata sınırı (piksel); aşılırsa anahtar kare zorlanır
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class IrisFlowTracker:
+    """Anahtar kare noktalarını sonraki karelere optik akışla taşıyan takipçi.
+
+    Kullanım: `needs_keyframe()` True ise FaceMesh çalıştırılıp sonuç
+    `set_keyframe()` ile verilir; değilse `track()` yeni noktaları döndürür
+    veya kayma varsa None döner (çağıran hemen anahtar kare almalıdır).
+    Noktalar normalize (N, 3) dizilerdir; z anahtar kareden korunur.
+    """
+
+    def __init__(self, interval=KEYFRAME_INTERVAL, padding=EYE_ROI_PADDING):
+        self.interval = interval
+        self.padding = padding
+        self.roi = None  # (x0, y0, w, h) piksel; None = takip yok
+        self._prev_gray = None
+        self._prev_pixels = None  # (N, 1, 2) float32, ROI koordinatları
+        self._points = None  # Son noktalar (N, 3), yeniden kullanılır
+        self._gray_buffers = (FrameBuffer(), FrameBuffer())  # Önceki / yeni gri ROI
+        self._prev_slot = 0
+        self._since_keyframe = 0
+
+        # Sayaçlar
+        self.keyframes = 0
+        self.forced_keyframes = 0  # Kayma nedeniyle erkene çekilenler
+        self.flow_frames = 0
+        self.error_samples = 0
+        self.iris_error_total = 0.0  # İris pozisyonu farkı (0-1 birim)
+        self.point_error_total = 0.0  # Nokta başına ortalama fark (piksel)
+
+    def reset(self):
+        """Takibi bırak; sonraki kare anahtar kare olur"""
+        self.roi = None
+        self._prev_gray = None
+        self._prev_pixels = None
+
+    def needs_keyframe(self):
+        """Bu karede FaceMesh çalıştırılmalı mı?"""
+        return self.roi is None or self._since_keyframe + 1 >= self.interval
+
+    # ============================================
+    # ANAHTAR KARE
+    # ============================================
+
+    def set_keyframe(self, frame, points):
+        """FaceMesh noktalarını ((N, 3) veya None) yeni referans olarak al"""
+        self.keyframes += 1
+        self._since_keyframe = 0
+        if points is None or self.interval <= 1:
+            self.reset()
+            return
+
+        # Planlı anahtar karede akış tahminini ölç (zorlanan karelerde takip zaten kopmuştur)
+        if self.roi is not None:
+            predicted = self._flow(frame)
+            if predicted is not None:
+                self._measure_error(predicted, points, frame.shape)
+
+        frame_h, frame_w = frame.shape[:2]
+        pixels = points[:, :2] * (frame_w, frame_h)
+        self.roi = self._compute_roi(pixels, frame_w, frame_h)
+        if self.roi is None:
+            self.reset()
+            return
+
+        x0, y0, _, _ = self.roi
+        self._prev_gray = self._crop_gray(frame, self.roi, self._gray_buffers[self._prev_slot])
+        self._prev_pixels = (pixels - (x0, y0)).astype(np.float32).reshape(-1, 1, 2)
+        if self._points is None or self._points.shape != points.shape:
+            self._points = np.empty_like(points)
+        np.copyto(self._points, points)
+
+    def mark_forced(self):
+        """Kayma nedeniyle alınan anahtar kareyi say"""
+        self.forced_keyframes += 1
+
+    # ============================================
+    # AKIŞ
+    # ============================================
+
+    def track(self, frame):
+        """Noktaları bu kareye taşı: (N, 3) dizi veya kaymada None"""
+        next_pixels = self._flow(frame, keep=True)
+        if next_pixels is None:
+            self.reset()
+            return None
+
+        self.flow_frames += 1
+        self._since_keyframe += 1
+        frame_h, frame_w = frame.shape[:2]
+        x0, y0, _, _ = self.roi
+        points = self._points
+        points[:, 0] = (next_pixels[:, 0, 0] + x0) / frame_w
+        points[:, 1] = (next_pixels[:, 0, 1] + y0) / frame_h
+        return points  # Takipçiye ait; bir sonraki track/set_keyframe çağrısına kadar geçerli
+
+    def _flow(self, frame, keep=False):
+        """ROI içinde ileri-geri LK akışı; güvenilir değilse None
+
+        `keep=True` ise sonuç bir sonraki karenin referansı olur.
+        """
+        if self.roi is None:
+            return None
+        gray = self._crop_gray(frame, self.roi, self._gray_buffers[1 - self._prev_slot])
+        next_pixels, status, _ = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray, gray, self._prev_pixels, None,
+            winSize=LK_WIN_SIZE, maxLevel=LK_MAX_LEVEL, criteria=LK_CRITERIA
+        )
+        if next_pixels is None or not status.all():
+            return None
+
+        # Geri akış başlangıç noktalarına dönmüyorsa takip kaymıştır
+        back_pixels, back_status, _ = cv2.calcOpticalFlowPyrLK(
+            gray, self._prev_gray, next_pixels, None,
+            winSize=LK_WIN_SIZE, maxLevel=LK_MAX_LEVEL, criteria=LK_CRITERIA
+        )
+        if back_pixels is None or not back_status.all():
+            return None
+        fb_error = np.abs(back_pixels - self._prev_pixels).max()
+        if fb_error > FLOW_FB_THRESHOLD:
+            return None
+
+        _, _, w, h = self.roi
+        xs, ys = next_pixels[:, 0, 0], next_pixels[:, 0, 1]
+        if xs.min() < 0 or ys.min() < 0 or xs.max() >= w or ys.max() >= h:
+            return None  # Gözler ROI dışına çıktı
+
+        if keep:
+            self._prev_gray = gray
+            self._prev_pixels = next_pixels
+            self._prev_slot = 1 - self._prev_slot
+        return next_pixels
+
+    # ============================================
+    # YARDIMCILAR
+    # ============================================
+
+    @staticmethod
+    def _crop_gray(frame, roi, buffer):
+        x0, y0, w, h = roi
+        return cv2.cvtColor(frame[y0:y0 + h, x0:x0 + w], cv2.COLOR_BGR2GRAY, dst=buffer.view((h, w)))
+
+    def _compute_roi(self, pixels, frame_w, frame_h):
+        """İki gözü kapsayan, pay eklenmiş piksel kutusu"""
+        min_x, min_y = pixels.min(axis=0)
+        max_x, max_y = pixels.max(axis=0)
+        pad = (max_x - min_x) * self.padding
+        x0 = int(max(0, min_x - pad))
+        y0 = int(max(0, min_y - pad))
+        x1 = int(min(frame_w, max_x + pad))
+        y1 = int(min(frame_h, max_y + pad))
+        if x1 - x0 < EYE_ROI_MIN_SIZE or y1 - y0 < EYE_ROI_MIN_SIZE:
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    def _measure_error(self, predicted_pixels, points, frame_shape):
+        """Akış tahmini ile FaceMesh noktaları arasındaki farkı biriktir"""
+        frame_h, frame_w = frame_shape[:2]
+        x0, y0, _, _ = self.roi
+        predicted = points.copy()
+        predicted[:, 0] = (predicted_pixels[:, 0, 0] + x0) / frame_w
+        predicted[:, 1] = (predicted_pixels[:, 0, 1] + y0) / frame_h
+
+        pred_x, pred_y, pred_valid = iris_position(predicted)
+        true_x, true_y, true_valid = iris_position(points)
+        if not (pred_valid and true_valid):
+            return
+        pixel_diff = (predicted[:, :2] - points[:, :2]) * (frame_w, frame_h)
+        self.error_samples += 1
+        self.iris_error_total += float(np.hypot(pred_x - true_x, pred_y - true_y))
+        self.point_error_total += float(np.hypot(pixel_diff[:, 0], pixel_diff[:, 1]).mean())
+
+    def get_stats(self):
+        """Takip istatistiklerini döndür"""
+        total = self.keyframes + self.flow_frames
+        samples = self.error_samples
+        return {
+            'keyframes': self.keyframes,
+            'forced_keyframes': self.forced_keyframes,
+            'flow_frames': self.flow_frames,
+            'flow_rate': (self.flow_frames / total * 100) if total > 0 else 0,
+            'iris_error': (self.iris_error_total / samples) if samples > 0 else 0.0,
+            'point_error_px': (self.point_error_total / samples) if samples > 0 else 0.0,
+        }
@@ -0,0 +1,118 @@
+"""
+Landmark Adaptörü
+- MediaPipe landmark listesini kare başına bir kez NumPy (N, 3) dizisine çevirir
+- İki gözün iris pozisyonunu tek vektörel ifadeyle hesaplar
+- Aynı fonksiyonlar çevrimdışı işleme için (F, N, 3) kare yığınlarını da kabul eder
+- Yatay aynalama görüntü yerine landmark koordinatlarına uygulanabilir
+"""
+
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+# Dizideki satır sırası: her çiftte önce sol göz, sonra sağ göz
+EYE_LANDMARK_ORDER = (
+    'left_iris_center', 'right_iris_center',
+    'left_eye_left', 'right_eye_left',
+    'left_eye_right', 'right_eye_right',
+    'left_eye_top', 'right_eye_top',
+    'left_eye_bottom', 'right_eye_bottom',
+)
+
+IRIS_ROWS = slice(0, 2)
+CORNER_LEFT_ROWS = slice(2, 4)
+CORNER_RIGHT_ROWS = slice(4, 6)
+LID_TOP_ROWS = slice(6, 8)
+LID_BOTTOM_ROWS = slice(8, 10)
+
+# Yatay aynalamada sol/sağ göz rolleri yer değiştirir: aynalanmış dizinin r. satırı
+# orijinal MIRROR_ROW_ORDER[r] satırının landmark'ından gelir (x -> 1 - x)
+MIRROR_ROW_ORDER = (1, 0, 5, 4, 3, 2, 7, 6, 9, 8)
+
+MIN_EYE_WIDTH = 0.005  # Normalize göz genişliği alt sınırı
+MIN_EYE_HEIGHT = 0.002  # Normalize göz yüksekliği alt sınırı
+IRIS_VALID_RANGE = (0.1, 0.9)  # Bu aralık dışı = muhtemelen hatalı tespit
+
+
+# ============================================
+# ADAPTÖR
+# ============================================
+
+class LandmarkAdapter:
+    """Landmark nesnelerini EYE_LANDMARK_ORDER sırasında diziye çevirir.
+
+    `mirror=True` ise noktalar yatay aynalanmış görüntüdeki karşılıklarına
+    çevrilir; aynalanmış kare üzerinde çıkarım yapmakla aynı geometriyi verir.
+    """
+
+    def __init__(self, landmark_indices, mirror=False):
+        # Satır rolleri (aynalamadan bağımsız; iz dosyası başlığı bunu kullanır)
+        self.landmark_indices = tuple(landmark_indices[name] for name in EYE_LANDMARK_ORDER)
+        indices = self.landmark_indices
+        if mirror:
+            indices = tuple(indices[row] for row in MIRROR_ROW_ORDER)
+        self.indices = indices  # Her satırın okunduğu landmark
+        self.mirror = mirror
+
+    def to_array(self, landmarks, out=None):
+        """`landmarks[i].x/y/z` erişimli listeden (N, 3) float dizi üret"""
+        if out is None:
+            out = np.empty((len(self.indices), 3), dtype=np.float64)
+        if self.mirror:
+            for row, i in enumerate(self.indices):
+                lm = landmarks[i]
+                out[row, 0] = 1.0 - lm.x
+                out[row, 1] = lm.y
+                out[row, 2] = lm.z
+        else:
+            for row, i in enumerate(self.indices):
+                lm = landmarks[i]
+                out[row, 0] = lm.x
+                out[row, 1] = lm.y
+                out[row, 2] = lm.z
+        return out
+
+    def from_full_array(self, points):
+        """Tam landmark dizisinden ((..., 478, 3)) kullanılan alt kümeyi seç"""
+        subset = np.asarray(points)[..., self.indices, :]
+        if self.mirror:
+            subset[..., 0] = 1.0 - subset[..., 0]
+        return subset
+
+
+# ============================================
+# VEKTÖREL HESAPLAMA
+# ============================================
+
+def iris_position(points):
+    """Göz içindeki ortalama iris pozisyonu (0-1 arası).
+
+    `points` (N, 3) veya (F, N, 3) olabilir. Dönüş: (iris_x, iris_y, valid);
+    tek kare için skaler, yığın için (F,) diziler.
+    """
+    points = np.asarray(points, dtype=np.float64)
+
+    iris = points[..., IRIS_ROWS, :2]
+    eye_left_x = points[..., CORNER_LEFT_ROWS, 0]
+    eye_right_x = points[..., CORNER_RIGHT_ROWS, 0]
+    eye_top_y = points[..., LID_TOP_ROWS, 1]
+    eye_bottom_y = points[..., LID_BOTTOM_ROWS, 1]
+
+    widths = eye_right_x - eye_left_x
+    heights = eye_bottom_y - eye_top_y
+    geometry_ok = np.all((widths > MIN_EYE_WIDTH) & (heights > MIN_EYE_HEIGHT), axis=-1)
+
+    # Geçersiz gözlerde sıfıra bölmeyi önle; sonuç zaten maskelenir
+    safe_widths = np.where(widths > MIN_EYE_WIDTH, widths, 1.0)
+    safe_heights = np.where(heights > MIN_EYE_HEIGHT, heights, 1.0)
+
+    # İki gözün ortalaması
+    iris_x = ((iris[..., 0] - eye_left_x) / safe_widths).mean(axis=-1)
+    iris_y = ((iris[..., 1] - eye_top_y) / safe_heights).mean(axis=-1)
+
+    low, high = IRIS_VALID_RANGE
+    valid = geometry_ok & (iris_x > low) & (iris_x < high) & (iris_y > low) & (iris_y < high)
+    return iris_x, iris_y, valid
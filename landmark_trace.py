@@ -0,0 +1,176 @@
+"""
+Landmark İz Kaydı
+- Canlı göz oturumunu kompakt ikili dosyaya yazar: kare zamanı, örnek zamanı,
+  LANDMARK_INDICES alt kümesi, yüz bayrağı ve top durumu
+- Kalibrasyon sonucu (eşleme katsayıları) ve sıfırlamalar ayrı kayıt olarak tutulur
+- Okunan iz, kamera ve MediaPipe olmadan bakış mantığına yeniden oynatılabilir
+
+Dosya düzeni (little-endian):
+    başlık : 'GZTR', sürüm (u2), nokta sayısı N (u2), ekran genişliği/yüksekliği (u2),
+             N adet landmark indeksi (u2)
+    kare   : 'F', t (f8), örnek zamanı (f8), bayraklar (u1), top x/y/vx/vy (4 x f4),
+             N x 3 nokta (f4)
+    eşleme : 'M', katsayı satırı F (u1; 0 = kalibrasyon sıfırlandı), F x 2 katsayı (f8)
+"""
+
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+TRACE_MAGIC = b'GZTR'
+TRACE_VERSION = 1
+
+RECORD_FRAME = b'F'
+RECORD_MAPPING = b'M'
+
+# Kare bayrakları
+FLAG_NEW_SAMPLE = 0x01  # Bu karede yeni çıkarım sonucu uygulandı
+FLAG_FACE = 0x02  # Yüz bulundu (noktalar geçerli)
+
+_HEADER = struct.Struct('<4sHHHH')
+_FRAME_PREFIX = struct.Struct('<ddB4f')
+_MAPPING_PREFIX = struct.Struct('<B')
+
+
+# ============================================
+# KAYIT YAPILARI
+# ============================================
+
+TraceHeader = namedtuple('TraceHeader', 'version landmark_indices screen_width screen_height')
+TraceFrame = namedtuple('TraceFrame', 't sample_time new_sample face_detected points ball')
+TraceMapping = namedtuple('TraceMapping', 'coeffs')  # coeffs None = kalibrasyon sıfırlandı
+
+
+# ============================================
+# YAZICI
+# ============================================
+
+class TraceWriter:
+    """Kareleri sabit boyutlu kayıtlar olarak tamponlu dosyaya yazar"""
+
+    def __init__(self, path, landmark_indices, screen_width, screen_height):
+        self.landmark_indices = tuple(int(i) for i in landmark_indices)
+        self.n_points = len(self.landmark_indices)
+        self._frame = struct.Struct(f'<c{_FRAME_PREFIX.format[1:]}{self.n_points * 3}f')
+        self._zeros = (0.0,) * (self.n_points * 3)
+        self.frames_written = 0
+
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, self.n_points, screen_width, screen_height))
+        self._file.write(struct.pack(f'<{self.n_points}H', *self.landmark_indices))
+
+    def write_frame(self, t, sample_time, new_sample, points, ball):
+        """Tek kare kaydı; `points` (N, 3) dizi veya yüz yoksa None"""
+        flags = FLAG_NEW_SAMPLE if new_sample else 0
+        if points is not None:
+            flags |= FLAG_FACE
+            values = points.ravel().tolist()
+        else:
+            values = self._zeros
+        self._file.write(self._frame.pack(RECORD_FRAME, t, sample_time, flags, *ball, *values))
+        self.frames_written += 1
+
+    def write_mapping(self, coeffs):
+        """Kalibrasyon eşlemesi kaydı; None = kalibrasyon sıfırlandı"""
+        if coeffs is None:
+            self._file.write(RECORD_MAPPING + _MAPPING_PREFIX.pack(0))
+            return
+        coeffs = np.asarray(coeffs, dtype='<f8')
+        self._file.write(RECORD_MAPPING + _MAPPING_PREFIX.pack(coeffs.shape[0]))
+        self._file.write(coeffs.tobytes())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================
+# OKUYUCU
+# ============================================
+
+def read_trace(path):
+    """İz dosyasını oku: (TraceHeader, [TraceFrame | TraceMapping, ...])
+
+    Dosya bir kez belleğe alınır; ardışık kareler tek seferde yapılandırılmış
+    diziye çevrilir, böylece yeniden oynatma döngüsü ayrıştırma maliyeti taşımaz.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    magic, version, n_points, screen_width, screen_height = _HEADER.unpack_from(data, 0)
+    if magic != TRACE_MAGIC:
+        raise ValueError(f"Gecersiz iz dosyasi: {path}")
+    if version != TRACE_VERSION:
+        raise ValueError(f"Desteklenmeyen iz surumu: {version}")
+    offset = _HEADER.size
+    indices = struct.unpack_from(f'<{n_points}H', data, offset)
+    offset += 2 * n_points
+    header = TraceHeader(version, indices, screen_width, screen_height)
+
+    frame_dtype = np.dtype([
+        ('tag', 'S1'), ('t', '<f8'), ('sample_time', '<f8'), ('flags', 'u1'),
+        ('ball', '<f4', 4), ('points', '<f4', (n_points, 3)),
+    ])
+    frame_size = frame_dtype.itemsize
+
+    # Kayıt sınırlarını bul; ardışık kare blokları tek np.frombuffer ile okunur
+    entries = []
+    runs = []  # [başlangıç, kare sayısı]
+    end = len(data)
+    while offset < end:
+        tag = data[offset:offset + 1]
+        if tag == RECORD_FRAME:
+            if offset + frame_size > end:
+                break  # Yarım kalan son kayıt (oturum kesilmiş)
+            entries.append(None)
+            if runs and runs[-1][0] + runs[-1][1] * frame_size == offset:
+                runs[-1][1] += 1
+            else:
+                runs.append([offset, 1])
+            offset += frame_size
+        elif tag == RECORD_MAPPING:
+            (rows,) = _MAPPING_PREFIX.unpack_from(data, offset + 1)
+            offset += 1 + _MAPPING_PREFIX.size
+            coeffs = None
+            if rows:
+                coeffs = np.frombuffer(data, dtype='<f8', count=rows * 2, offset=offset).reshape(rows, 2).copy()
+                offset += rows * 2 * 8
+            entries.append(TraceMapping(coeffs))
+        else:
+            raise ValueError(f"Bozuk iz kaydi (konum {offset})")
+
+    blocks = [np.frombuffer(data, dtype=frame_dtype, count=count, offset=start) for start, count in runs]
+    frames = np.concatenate(blocks) if blocks else np.empty(0, dtype=frame_dtype)
+
+    points = frames['points'].astype(np.float64)
+    balls = frames['ball'].astype(np.float64).tolist()
+    times = frames['t'].tolist()
+    sample_times = frames['sample_time'].tolist()
+    flags = frames['flags'].tolist()
+
+    records = []
+    k = 0
+    for entry in entries:
+        if entry is not None:
+            records.append(entry)
+            continue
+        face = bool(flags[k] & FLAG_FACE)
+        records.append(TraceFrame(
+            times[k], sample_times[k], bool(flags[k] & FLAG_NEW_SAMPLE), face,
+            points[k] if face else None, tuple(balls[k]),
+        ))
+        k += 1
+    return header, records
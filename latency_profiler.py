@@ -0,0 +1,270 @@
+"""
+Aşama Gecikme Ölçümü
+- İsimli zaman aralıkları (span) nanosaniye çözünürlüklü saatle ölçülür
+- Her span için kayan pencerede p50 / p95 / p99 (milisaniye)
+- İsteğe bağlı ekran üstü panel (HUD) ve oturum sonunda histogram dosyası
+"""
+
+import csv
+import math
+import os
+import threading
+import time
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+PROFILE_WINDOW = 300  # Yüzdelikler için son N ölçüm (~10 sn @ 30 FPS)
+HUD_REFRESH_FRAMES = 15  # Panel yüzdeliklerinin yeniden hesaplanma aralığı (kare)
+HUD_TOGGLE_KEY = 'p'
+
+# Histogram: 1 µs'den başlayan, oktav başına 4 kutulu logaritmik ölçek
+HISTOGRAM_MIN_NS = 1_000
+HISTOGRAM_BINS_PER_OCTAVE = 4
+HISTOGRAM_BINS = 96  # 1 µs ... ~16 dk
+LATENCY_EXPORT_DIR = "results/latency"
+
+
+# ============================================
+# SPAN İSTATİSTİĞİ
+# ============================================
+
+class _SpanStats:
+    """Tek span için kayan pencere ve oturum histogramı"""
+
+    __slots__ = ('window', 'head', 'count', 'total_ns', 'max_ns', 'histogram')
+
+    def __init__(self, window):
+        self.window = np.zeros(window, dtype=np.int64)
+        self.head = 0
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BINS
+
+    def add(self, duration_ns):
+        self.window[self.head] = duration_ns
+        self.head = (self.head + 1) % len(self.window)
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.histogram[_histogram_bin(duration_ns)] += 1
+
+    def recent(self):
+        """Penceredeki ölçümler (ns)"""
+        return self.window[:min(self.count, len(self.window))]
+
+
+def _histogram_bin(duration_ns):
+    """Süreyi logaritmik histogram kutusuna çevir"""
+    if duration_ns <= HISTOGRAM_MIN_NS:
+        return 0
+    index = int(math.log2(duration_ns / HISTOGRAM_MIN_NS) * HISTOGRAM_BINS_PER_OCTAVE) + 1
+    return min(index, HISTOGRAM_BINS - 1)
+
+
+def _bin_edges_ms(index):
+    """Histogram kutusunun (alt, üst) sınırları, milisaniye"""
+    if index == 0:
+        return 0.0, HISTOGRAM_MIN_NS / 1e6
+    low = HISTOGRAM_MIN_NS * 2 ** ((index - 1) / HISTOGRAM_BINS_PER_OCTAVE)
+    high = HISTOGRAM_MIN_NS * 2 ** (index / HISTOGRAM_BINS_PER_OCTAVE)
+    return low / 1e6, high / 1e6
+
+
+class _Span:
+    """`with profiler.span(name):` bağlam nesnesi; her isim için bir kez oluşturulur"""
+
+    __slots__ = ('profiler', 'name', '_start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter_ns() - self._start)
+        return False
+
+
+class _NullSpan:
+    """Ölçüm kapalıyken kullanılan boş bağlam"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class LatencyProfiler:
+    """İsimli span'leri toplayan, HUD çizen ve histogram yazan ölçer.
+
+    Ölçümler worker thread'lerinden de kaydedilebilir. Span nesneleri isim
+    başına önbelleklenir; aynı isim iç içe veya iki thread'den aynı anda
+    açılmamalıdır (bunun için `record` kullanılır).
+    """
+
+    def __init__(self, window=PROFILE_WINDOW, enabled=True):
+        self.window = window
+        self.enabled = enabled
+        self.show_hud = False
+        self._stats = {}  # İsim -> _SpanStats (ekleme sırası korunur)
+        self._spans = {}
+        self._lock = threading.Lock()
+        self._hud_rows = []
+        self._hud_age = HUD_REFRESH_FRAMES
+
+    # ============================================
+    # ÖLÇÜM
+    # ============================================
+
+    def span(self, name):
+        """Bağlam yöneticisi: `with profiler.span('draw_ui'): ...`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, name)
+        return span
+
+    def record(self, name, duration_ns):
+        """Dışarıda ölçülmüş süreyi (ns) ekle"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _SpanStats(self.window)
+            stats.add(duration_ns)
+
+    # ============================================
+    # RAPORLAMA
+    # ============================================
+
+    def percentiles(self, name):
+        """Kayan penceredeki (p50, p95, p99), milisaniye; ölçüm yoksa None"""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None or stats.count == 0:
+                return None
+            recent = stats.recent().copy()
+        p50, p95, p99 = np.percentile(recent, (50, 95, 99)) / 1e6
+        return float(p50), float(p95), float(p99)
+
+    def summary(self):
+        """Tüm span'ler: {isim: {'count', 'mean_ms', 'max_ms', 'p50', 'p95', 'p99'}}"""
+        with self._lock:
+            names = list(self._stats)
+        result = {}
+        for name in names:
+            stats = self._stats[name]
+            p50, p95, p99 = self.percentiles(name)
+            result[name] = {
+                'count': stats.count,
+                'mean_ms': stats.total_ns / stats.count / 1e6,
+                'max_ms': stats.max_ns / 1e6,
+                'p50': p50, 'p95': p95, 'p99': p99,
+            }
+        return result
+
+    def print_summary(self, title="Gecikme"):
+        """Özet tabloyu konsola yazdır"""
+        summary = self.summary()
+        if not summary:
+            return
+        print(f"\n{title} (ms, son {self.window} olcum):")
+        print(f"  {'Span':<16} {'Adet':>7} {'Ort':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'Maks':>8}")
+        for name, s in summary.items():
+            print(f"  {name:<16} {s['count']:>7} {s['mean_ms']:>8.2f} {s['p50']:>8.2f} "
+                  f"{s['p95']:>8.2f} {s['p99']:>8.2f} {s['max_ms']:>8.2f}")
+
+    def export_histogram(self, stage_name, directory=LATENCY_EXPORT_DIR):
+        """Oturum histogramını CSV olarak yaz; dosya yolunu döndür
+
+        Kolonlar: Span, AltSinirMs, UstSinirMs, Adet (boş kutular yazılmaz)
+        """
+        if not self._stats:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{stage_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+        with self._lock:
+            rows = []
+            for name, stats in self._stats.items():
+                for index, count in enumerate(stats.histogram):
+                    if count:
+                        low, high = _bin_edges_ms(index)
+                        rows.append([name, f"{low:.4f}", f"{high:.4f}", count])
+        try:
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(["Span", "AltSinirMs", "UstSinirMs", "Adet"])
+                writer.writerows(rows)
+        except PermissionError:
+            print(f"  UYARI: {path} kaydedilemedi!")
+            return None
+        return path
+
+    # ============================================
+    # HUD
+    # ============================================
+
+    def handle_key(self, key):
+        """HUD açma/kapama tuşunu işle; tuş kullanıldıysa True"""
+        if key == ord(HUD_TOGGLE_KEY):
+            self.show_hud = not self.show_hud
+            self._hud_age = HUD_REFRESH_FRAMES
+            return True
+        return False
+
+    def draw_hud(self, frame, x=10, y=100):
+        """Span yüzdeliklerini kare üzerine çiz (show_hud kapalıysa hiçbir şey yapmaz)"""
+        if not self.show_hud:
+            return frame
+
+        # Yüzdelikler her karede değil, birkaç karede bir hesaplanır
+        self._hud_age += 1
+        if self._hud_age >= HUD_REFRESH_FRAMES:
+            self._hud_age = 0
+            self._hud_rows = []
+            with self._lock:
+                names = list(self._stats)
+            for name in names:
+                values = self.percentiles(name)
+                if values is not None:
+                    self._hud_rows.append((name,) + tuple(f"{v:.2f}" for v in values))
+
+        line_h = 20
+        columns = (x + 8, x + 170, x + 240, x + 310)
+        height = line_h * (len(self._hud_rows) + 1) + 10
+        x1, y1 = min(x + 380, frame.shape[1]), min(y + height, frame.shape[0])
+        region = frame[y:y1, x:x1]
+        cv2.convertScaleAbs(region, dst=region, alpha=0.35)
+
+        font = cv2.FONT_HERSHEY_PLAIN
+        rows = [(('span (ms)', 'p50', 'p95', 'p99'), (0, 255, 255))]
+        rows += [(row, (255, 255, 255)) for row in self._hud_rows]
+        for i, (cells, color) in enumerate(rows):
+            for col_x, text in zip(columns, cells):
+                cv2.putText(frame, text, (col_x, y + line_h * (i + 1)), font, 1.0, color, 1)
+        return frame
@@ -0,0 +1,63 @@
+"""
+Ertelenmiş Ağır İçe Aktarmalar
+- Modülün kurulu olup olmadığı içe aktarmadan (importlib.util.find_spec) kontrol edilir
+- LazyModule gerçek içe aktarmayı ilk öznitelik erişimine veya `load()` çağrısına erteler
+- Arka plan hazırlığı `load()` ile maliyeti ana thread dışına taşıyabilir
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+
+
+# ============================================
+# YARDIMCI FONKSİYONLAR
+# ============================================
+
+def module_available(name):
+    """Modül kurulu mu? (modül çalıştırılmaz, sadece bulunur)"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class LazyModule:
+    """İlk kullanımda içe aktarılan modül vekili.
+
+    `mp = LazyModule('mediapipe')` sonrası `mp.solutions...` erişimi modülü
+    yükler; mevcut kod değişmeden çalışır. Yükleme thread güvenlidir.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+        self.load_time = None  # İçe aktarma süresi (saniye)
+
+    def load(self):
+        """Modülü içe aktar (yüklüyse mevcut modülü döndür)"""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    self.load_time = time.perf_counter() - start
+                    self._module = module
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = "yuklu" if self.loaded else "ertelenmis"
+        return f"<LazyModule {self._name} ({state})>"
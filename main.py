@@ -10,23 +10,54 @@ import cv2
 import numpy as np
 import time
 import random
-import csv
 import os
 from datetime import datetime
-from collections import deque
-
-# MediaPipe sadece göz takibi için gerekli
-try:
-    import mediapipe as mp
-    MEDIAPIPE_AVAILABLE = True
-except ImportError:
-    MEDIAPIPE_AVAILABLE = False
+
+from eye_resources import EyeTrackingResources
+from inference_worker import FaceMeshWorker
+from face_roi import FaceROITracker, to_inference_rgb
+from landmark_adapter import LandmarkAdapter, iris_position
+from frame_clock import FrameClock, REFERENCE_FPS
+from gaze_calibration import GazeMapping, make_calibration_grid
+from gaze_filters import make_gaze_filter
+from ui_layers import LayerCache
+from landmark_trace import TraceWriter
+from latency_profiler import LatencyProfiler
+from quality_governor import FrameBudgetGovernor
+from iris_flow import IrisFlowTracker
+from face_presence import FacePresenceMonitor
+from lazy_imports import LazyModule, module_available
+from frame_buffers import FrameBuffer
+from game_rules import MouseRules, KeyboardRules, FocusRule, FOCUS_SUCCESS, FOCUS_LOST, move_ball
+from results_store import (ResultsStore, import_csv_results, STAGE_MOUSE, STAGE_SWARM, STAGE_KEYBOARD,
+                           STAGE_EYE)
+from input_events import InputQueue
+from game_loop import GameLoop
+
+# MediaPipe sadece göz takibi için gerekli; menü açılışını geciktirmemesi için
+# gerçek içe aktarma 3. aşama seçildiğinde veya arka plan hazırlığı başladığında yapılır
+MEDIAPIPE_AVAILABLE = module_available('mediapipe')
+mp = LazyModule('mediapipe')
+if not MEDIAPIPE_AVAILABLE:
     print("UYARI: MediaPipe kurulu değil. Göz takibi özelliği devre dışı.")
     print("Kurmak için: pip install mediapipe==0.10.9")
 
+# Göz aşaması kamera/FaceMesh ayarları (kaynaklar aşama 1-2 sırasında arka planda hazırlanır)
+EYE_FRAME_SOURCE = 0  # Kamera indeksi, video dosyası, resim klasörü veya 'synthetic[:fps]'
+EYE_SCREEN_WIDTH = 1280
+EYE_SCREEN_HEIGHT = 720
+EYE_DETECTION_CONFIDENCE = 0.7
+EYE_TRACKING_CONFIDENCE = 0.7
+
+# Menü ve sonuç ekranları statik: GameLoop boşta modunda bu hızlarda yenilenir
+MENU_FPS = 10
+NAME_INPUT_FPS = 20  # Yazarken harfler gecikmeden görünsün
+
 # Global oyuncu bilgileri
 player_name = ""
 all_stage_results = []  # Her aşamanın sonuçlarını tutar
+eye_resources = None  # Göz oturumları arasında paylaşılan kamera + FaceMesh
+results_store = None  # Tüm aşamaların sonuçlarını arka planda SQLite'a yazan depo
 
 
 def get_player_name():
@@ -34,8 +65,11 @@ def get_player_name():
     global player_name
     WIDTH, HEIGHT = 800, 600
     name = ""
+    loop = GameLoop(idle_fps=NAME_INPUT_FPS)
+    loop.idle = True
     
     while True:
+        loop.tick()
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
         
         cv2.putText(screen, "GAMER REFLEX TRAINER", (150, 100),
@@ -53,7 +87,7 @@ def get_player_name():
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, (150, 150, 150), 2)
         
         cv2.imshow("Gamer Reflex Trainer", screen)
-        key = cv2.waitKey(50) & 0xFF
+        key = cv2.waitKey(loop.wait_ms()) & 0xFF
         
         if key == 13 and len(name) > 0:  # ENTER
             player_name = name
@@ -79,7 +113,11 @@ def show_stage_stats(stage_name, correct, total, avg_reaction, next_stage=None):
         'accuracy': accuracy, 'avg_reaction': avg_reaction
     })
     
+    loop = GameLoop(idle_fps=MENU_FPS)
+    loop.idle = True
+
     while True:
+        loop.tick()
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
         
         cv2.putText(screen, f"{stage_name}", (300, 80),
@@ -103,7 +141,7 @@ def show_stage_stats(stage_name, correct, total, avg_reaction, next_stage=None):
                     cv2.FONT_HERSHEY_SIMPLEX, 0.8, (150, 150, 150), 2)
         
         cv2.imshow("Sonuclar", screen)
-        key = cv2.waitKey(100) & 0xFF
+        key = cv2.waitKey(loop.wait_ms()) & 0xFF
         
         if key == 13:  # ENTER
             cv2.destroyAllWindows()
@@ -141,7 +179,11 @@ def show_final_evaluation():
         rating = "Pratik yap!"
         rating_color = (0, 0, 255)
     
+    loop = GameLoop(idle_fps=MENU_FPS)
+    loop.idle = True
+
     while True:
+        loop.tick()
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
         
         cv2.putText(screen, "FINAL DEGERLENDIRMESI", (220, 70),
@@ -173,7 +215,7 @@ def show_final_evaluation():
                     cv2.FONT_HERSHEY_SIMPLEX, 0.8, (150, 150, 150), 2)
         
         cv2.imshow("Final", screen)
-        if cv2.waitKey(100) & 0xFF == 27:
+        if cv2.waitKey(loop.wait_ms()) & 0xFF == 27:
             cv2.destroyAllWindows()
             all_stage_results = []
             return
@@ -197,34 +239,23 @@ def stage_1_mouse_test():
         "yesil": (106, 187, 106)
     }
 
-    # OYUN DURUMU
+    # OYUN DURUMU (tur, tıklama sonucu ve adaptif hız kuralları game_rules.MouseRules'ta)
     game_started = False
-    game_over = False
-    targets = []
-    target_color_name = None
-    start_time = None
-
-    # PERFORMANS
-    total_rounds = 0
-    correct_clicks = 0
-    wrong_clicks = 0
+    rules = MouseRules(COLORS, (0, 100, WIDTH, HEIGHT))
+    round_start_ns = None  # Tur oluşturulduğu an (eski ölçüm başlangıcı)
+    onset_ns = None  # Turun ilk karesinin ekrana çizildiği an
+    early_clicks = 0  # Tur ekrana gelmeden yapılan (yok sayılan) tıklamalar
     reaction_times = []
+    FPS_CAP = 60
 
-    # HIZ KONTROLÜ
-    base_speed = 3
-    speed_multiplier = 1.0
+    # GECİKME ÖLÇÜMÜ (P = panel)
+    profiler = LatencyProfiler()
 
-    # CSV
-    os.makedirs("results", exist_ok=True)
-    csv_path = "results/performance_log.csv"
-
-    if not os.path.exists(csv_path):
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "Asama", "Tur", "DogruMu", "TepkiSuresi",
-                "HedefRenk", "TiklananRenk", "Zaman"
-            ])
+    # SONUÇ KAYDI (denemeler arka plan yazıcısına gider; tıklama yolunda veritabanı işlemi yok)
+    # reaction eski ölçümle (tur oluşturma anından) karşılaştırılabilir kalır;
+    # corrected_reaction uyaranın ekrana geldiği andan ölçülür
+    results = get_results_store()
+    session = None
 
     def draw_start_screen():
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
@@ -235,21 +266,24 @@ def stage_1_mouse_test():
         cv2.putText(screen, "BASLA", (430, 400),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255, 255, 255), 3)
         cv2.rectangle(screen, (380, 330), (620, 450), (255, 0, 0), 3)
+        cv2.putText(screen, "SURU MODU", (405, 540),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        cv2.rectangle(screen, (380, 490), (620, 570), (0, 165, 255), 3)
         return screen
 
     def draw_end_screen():
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
         avg_reaction = np.mean(reaction_times) if reaction_times else 0
-        total_clicks = correct_clicks + wrong_clicks
-        error_rate = (wrong_clicks / total_clicks * 100) if total_clicks > 0 else 0
+        total_clicks = rules.correct + rules.wrong
+        error_rate = (rules.wrong / total_clicks * 100) if total_clicks > 0 else 0
 
         cv2.putText(screen, "TEST TAMAMLANDI", (300, 150),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.6, (0, 255, 255), 3)
-        cv2.putText(screen, f"Toplam Tur: {total_rounds}", (300, 250),
+        cv2.putText(screen, f"Toplam Tur: {rules.round}", (300, 250),
                     cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-        cv2.putText(screen, f"Dogru Tiklama: {correct_clicks}", (300, 300),
+        cv2.putText(screen, f"Dogru Tiklama: {rules.correct}", (300, 300),
                     cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-        cv2.putText(screen, f"Yanlis Tiklama: {wrong_clicks}", (300, 350),
+        cv2.putText(screen, f"Yanlis Tiklama: {rules.wrong}", (300, 350),
                     cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
         cv2.putText(screen, f"Ortalama Tepki Suresi: {avg_reaction:.3f} sn", (300, 400),
                     cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
@@ -259,95 +293,106 @@ def stage_1_mouse_test():
                     cv2.FONT_HERSHEY_SIMPLEX, 0.9, (200, 200, 200), 1)
         return screen
 
-    def generate_round():
-        nonlocal targets, target_color_name, start_time, total_rounds
-        total_rounds += 1
-        target_color_name = random.choice(list(COLORS.keys()))
-        distractors = [c for c in COLORS.keys() if c != target_color_name]
-        random.shuffle(distractors)
-        targets = []
-
-        def create_target(color_name):
-            x = random.randint(100, WIDTH - 100)
-            y = random.randint(150, HEIGHT - 100)
-            r = random.randint(30, 60)
-            dx = random.choice([-1, 1]) * base_speed * speed_multiplier
-            dy = random.choice([-1, 1]) * base_speed * speed_multiplier
-            return [x, y, r, color_name, COLORS[color_name], dx, dy]
-
-        targets.append(create_target(target_color_name))
-        for i in range(random.randint(2, 3)):
-            targets.append(create_target(distractors[i]))
-        start_time = time.time()
-
-    def draw_game():
+    def mark_round_start():
+        """Yeni tur oluşturuldu: tepki ölçümü bu andan / ilk karesinden başlar"""
+        nonlocal round_start_ns, onset_ns
+        round_start_ns = time.perf_counter_ns()
+        onset_ns = None
+
+    def draw_game(alpha):
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
-        cv2.putText(screen, f"Hedef renk: {target_color_name.upper()}",
+        cv2.putText(screen, f"Hedef renk: {rules.target_name.upper()}",
                     (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.2,
-                    COLORS[target_color_name], 3)
-
-        for t in targets:
-            t[0] += t[5]
-            t[1] += t[6]
-            if t[0] - t[2] <= 0 or t[0] + t[2] >= WIDTH:
-                t[5] *= -1
-            if t[1] - t[2] <= 100 or t[1] + t[2] >= HEIGHT:
-                t[6] *= -1
-            cv2.circle(screen, (int(t[0]), int(t[1])), t[2], t[4], -1)
-        return screen
+                    COLORS[rules.target_name], 3)
 
-    def mouse_callback(event, x, y, flags, param):
-        nonlocal game_started, game_over
-        nonlocal correct_clicks, wrong_clicks, speed_multiplier
+        rules.targets.draw(screen, alpha)
+        return screen
 
-        if not game_started and not game_over:
-            if event == cv2.EVENT_LBUTTONDOWN and 380 <= x <= 620 and 350 <= y <= 450:
-                game_started = True
-                generate_round()
+    def handle_click(x, y, t_ns):
+        """Kuyruktan alınan tıklamayı işle; t_ns tıklamanın damgasıdır"""
+        nonlocal game_started, session, early_clicks
+
+        if not game_started and not rules.game_over:
+            if 380 <= x <= 620:
+                if 350 <= y <= 450:
+                    game_started = True
+                elif 490 <= y <= 570:
+                    game_started = rules.swarm = True
+                if game_started:
+                    session = results.start_session(player_name, STAGE_SWARM if rules.swarm else STAGE_MOUSE)
+                    rules.new_round()
+                    mark_round_start()
             return
 
-        if event == cv2.EVENT_LBUTTONDOWN and game_started:
-            for t in targets:
-                if (x - t[0]) ** 2 + (y - t[1]) ** 2 <= t[2] ** 2:
-                    rt = time.time() - start_time
-                    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                    if t[3] == target_color_name:
-                        correct_clicks += 1
-                        reaction_times.append(rt)
-                        row = ["Mouse", total_rounds, 1, rt, target_color_name, t[3], now]
-                    else:
-                        wrong_clicks += 1
-                        speed_multiplier += 0.2
-                        row = ["Mouse", total_rounds, 0, rt, target_color_name, t[3], now]
-
-                    with open(csv_path, "a", newline="", encoding="utf-8") as f:
-                        csv.writer(f).writerow(row)
-
-                    if total_rounds >= 10:
-                        game_over = True
-                    else:
-                        generate_round()
-                    break
+        if game_started and not rules.game_over:
+            # Aynı pompada önceki tura ait tıklamalar yeni tura puanlanmaz
+            if t_ns < (onset_ns if onset_ns is not None else round_start_ns):
+                early_clicks += 1
+                return
+            with profiler.span('hit_test'):
+                result = rules.click(x, y)
+            if result is None:
+                return
+            raw_rt = (t_ns - round_start_ns) / 1e9
+            rt = (t_ns - (onset_ns if onset_ns is not None else round_start_ns)) / 1e9
+            if result.correct:
+                reaction_times.append(rt)
 
-    cv2.namedWindow("Stage 1 - Mouse Test")
-    cv2.setMouseCallback("Stage 1 - Mouse Test", mouse_callback)
+            with profiler.span('result_queue'):
+                results.add_trial(session, result.round, result.target, result.clicked, result.correct, raw_rt, rt)
 
-    while True:
-        if not game_started and not game_over:
+            rules.advance()
+            if not rules.game_over:
+                mark_round_start()
+
+    cv2.namedWindow("Stage 1 - Mouse Test")
+    inputs = InputQueue("Stage 1 - Mouse Test")
+    loop = GameLoop(rules.update_rate, FPS_CAP)
+
+    running = True
+    while running:
+        loop_start_ns = time.perf_counter_ns()
+        # Başlangıç ve sonuç ekranları statik: düşük kare hızı, fizik durur
+        loop.idle = not game_started or rules.game_over
+        alpha = loop.tick(rules.update)
+        if not game_started and not rules.game_over:
             frame = draw_start_screen()
-        elif game_over:
+        elif rules.game_over:
             frame = draw_end_screen()
         else:
-            frame = draw_game()
-
-        cv2.imshow("Stage 1 - Mouse Test", frame)
-        if cv2.waitKey(10) & 0xFF == 27:
-            break
+            with profiler.span('draw_game'):
+                frame = draw_game(alpha)
+
+        profiler.draw_hud(frame)
+        with profiler.span('imshow'):
+            cv2.imshow("Stage 1 - Mouse Test", frame)
+        with profiler.span('waitKey'):
+            inputs.pump(loop.wait_ms())
+        profiler.record('frame', time.perf_counter_ns() - loop_start_ns)
+        if onset_ns is None and round_start_ns is not None:
+            # Yeni turun ilk karesi bu pompada çizildi
+            onset_ns = inputs.presented_ns
+            profiler.record('onset_lag', onset_ns - round_start_ns)
+        for event in inputs.drain():
+            profiler.record('input_error', event.error_ns)
+            if event.kind == 'mouse':
+                handle_click(event.x, event.y, event.t_ns)
+            elif event.code == 27:
+                running = False
+                break
+            else:
+                profiler.handle_key(event.code)
 
     cv2.destroyAllWindows()
     avg_reaction = np.mean(reaction_times) if reaction_times else 0
-    return correct_clicks, total_rounds, avg_reaction
+    if session is not None:
+        results.end_session(session, rules.correct, rules.correct + rules.wrong, float(avg_reaction))
+    flush_results("Stage 1")
+    print(f"Stage 1 girdi zamanlamasi: {inputs.describe()}, {early_clicks} erken tiklama yok sayildi")
+    print(f"Stage 1 dongu: {loop.describe()}")
+    profiler.print_summary("Stage 1 gecikme")
+    profiler.export_histogram("stage1_mouse")
+    return rules.correct, rules.round, avg_reaction
 
 
 # =====================================================================
@@ -364,12 +409,8 @@ def stage_2_keyboard_test():
     SUCCESS_COLOR = (0, 255, 0)
     ERROR_COLOR = (0, 0, 255)
 
-    PLAYER_RADIUS = 18
-    BASE_SPEED = 4.0
-    SPEED_INCREASE = 0.2
-    MAX_MOVES = 20
+    FPS_CAP = 60
 
-    COMMANDS = ["YUKARI", "ASAGI", "SOL", "SAG"]
     COMMAND_DISPLAY = {
         "YUKARI": "YUKARI (W)",
         "ASAGI": "ASAGI (S)",
@@ -383,118 +424,43 @@ def stage_2_keyboard_test():
         "SAG": [ord("d"), ord("D")]
     }
 
-    def get_new_command(direction, player_x, player_y, player_radius):
-        available = COMMANDS.copy()
-        if player_y - player_radius <= 140 and "YUKARI" in available:
-            available.remove("YUKARI")
-        if player_y + player_radius >= HEIGHT - 20 and "ASAGI" in available:
-            available.remove("ASAGI")
-        if player_x - player_radius <= 20 and "SOL" in available:
-            available.remove("SOL")
-        if player_x + player_radius >= WIDTH - 20 and "SAG" in available:
-            available.remove("SAG")
-        if direction in available:
-            available.remove(direction)
-        if not available:
-            opposite = {"YUKARI": "ASAGI", "ASAGI": "YUKARI", "SOL": "SAG", "SAG": "SOL"}
-            return opposite.get(direction, random.choice(COMMANDS))
-        return random.choice(available)
-
-    player_x, player_y = WIDTH // 2, HEIGHT // 2
-    player_radius = PLAYER_RADIUS
-    direction = random.choice(COMMANDS)
-    speed = BASE_SPEED
-    current_command = get_new_command(direction, player_x, player_y, player_radius)
-    
-    total_moves = 0
-    correct_moves = 0
+    # Hareket, komut seçimi ve tuş sonucu kuralları game_rules.KeyboardRules'ta
+    rules = KeyboardRules(WIDTH, HEIGHT)
+
     feedback_time = 0
     feedback_type = None
     
     game_start_time = time.time()
-    command_start_time = time.time()
+    command_start_ns = time.perf_counter_ns()  # Komut seçildiği an (eski ölçüm başlangıcı)
+    onset_ns = None  # Komutun ekrana ilk çizildiği an
+    early_presses = 0  # Komut ekrana gelmeden basılan (yok sayılan) tuşlar
     reaction_times = []
-    move_log = []
+
+    # SONUÇ KAYDI (her hamle arka plan yazıcısına gider; oyun döngüsünde veritabanı işlemi yok)
+    # reaction eski ölçümle (komut seçim anından) karşılaştırılabilir kalır;
+    # corrected_reaction komutun ekrana geldiği andan ölçülür
+    onset_lags = []
+    results = get_results_store()
+    session = results.start_session(player_name, STAGE_KEYBOARD)
 
     cv2.namedWindow("Stage 2 - Keyboard Reflex")
+    inputs = InputQueue("Stage 2 - Keyboard Reflex", mouse_events=())
 
-    while total_moves < MAX_MOVES:
+    loop = GameLoop(rules.update_rate, FPS_CAP)
+    running = True
+    while running and not rules.game_over:
+        alpha = loop.tick(rules.update)
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
 
-        # Otomatik hareket
-        if direction == "YUKARI":
-            player_y -= speed
-        elif direction == "ASAGI":
-            player_y += speed
-        elif direction == "SOL":
-            player_x -= speed
-        elif direction == "SAG":
-            player_x += speed
-
-        # Sınır kontrolü
-        if player_x - player_radius <= 0:
-            player_x = player_radius
-            direction = "SAG"
-        elif player_x + player_radius >= WIDTH:
-            player_x = WIDTH - player_radius
-            direction = "SOL"
-        if player_y - player_radius <= 120:
-            player_y = 120 + player_radius
-            direction = "ASAGI"
-        elif player_y + player_radius >= HEIGHT:
-            player_y = HEIGHT - player_radius
-            direction = "YUKARI"
-
-        key = cv2.waitKey(20) & 0xFF
-        if key == 27:
-            break
-
-        pressed_command = None
-        for cmd, key_codes in KEY_MAP.items():
-            if key in key_codes:
-                pressed_command = cmd
-                break
-
-        if pressed_command:
-            total_moves += 1
-            reaction_time = time.time() - command_start_time
-
-            if pressed_command == current_command:
-                reaction_times.append(reaction_time)
-                direction = current_command
-                speed += SPEED_INCREASE
-                correct_moves += 1
-                feedback_type = "success"
-            else:
-                direction = pressed_command
-                feedback_type = "error"
-            
-            feedback_time = time.time()
-            
-            current_accuracy = (correct_moves / total_moves) * 100
-            avg_reaction_so_far = sum(reaction_times) / len(reaction_times) if reaction_times else 0
-            
-            move_log.append({
-                "saat": datetime.now().strftime("%H:%M"),
-                "tur": total_moves,
-                "hedef_tus": current_command,
-                "basilan_tus": pressed_command,
-                "dogru_mu": 1 if pressed_command == current_command else 0,
-                "reaksiyon_suresi": reaction_time,
-                "dogruluk_orani": current_accuracy,
-                "ort_reaksiyon": avg_reaction_so_far
-            })
-            
-            current_command = get_new_command(direction, player_x, player_y, player_radius)
-            command_start_time = time.time()
-
         # Çizimler
-        cv2.circle(screen, (int(player_x), int(player_y)), int(player_radius), PLAYER_COLOR, -1)
-        cv2.putText(screen, f"KOMUT: {COMMAND_DISPLAY[current_command]}", (280, 70),
+        draw_x = rules.prev_x + (rules.x - rules.prev_x) * alpha
+        draw_y = rules.prev_y + (rules.y - rules.prev_y) * alpha
+        cv2.circle(screen, (int(draw_x), int(draw_y)), int(rules.player_radius), PLAYER_COLOR, -1)
+        cv2.putText(screen, f"KOMUT: {COMMAND_DISPLAY[rules.command]}", (280, 70),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.4, TEXT_COLOR, 3)
-        cv2.putText(screen, f"{correct_moves}/{total_moves}", (WIDTH - 150, 50),
+        cv2.putText(screen, f"{rules.correct}/{rules.moves}", (WIDTH - 150, 50),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.2, TEXT_COLOR, 3)
-        cv2.putText(screen, f"Hiz: {speed:.1f}", (30, 50),
+        cv2.putText(screen, f"Hiz: {rules.speed:.1f}", (30, 50),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.9, (200, 200, 200), 2)
 
         if feedback_type and time.time() - feedback_time < 0.3:
@@ -510,31 +476,64 @@ def stage_2_keyboard_test():
 
         cv2.imshow("Stage 2 - Keyboard Reflex", screen)
 
+        inputs.pump(loop.wait_ms())
+        if onset_ns is None:
+            # Komutun ilk karesi bu pompada çizildi
+            onset_ns = inputs.presented_ns
+            onset_lags.append(onset_ns - command_start_ns)
+        for event in inputs.drain():
+            if event.code == 27:
+                running = False
+                break
+            if rules.game_over:
+                break
+
+            pressed_command = None
+            for cmd, key_codes in KEY_MAP.items():
+                if event.code in key_codes:
+                    pressed_command = cmd
+                    break
+
+            if not pressed_command:
+                continue
+            # Aynı pompada önceki komuta ait basışlar henüz çizilmemiş komuta puanlanmaz
+            if event.t_ns < (onset_ns if onset_ns is not None else command_start_ns):
+                early_presses += 1
+                continue
+
+            raw_reaction_time = (event.t_ns - command_start_ns) / 1e9
+            reaction_time = (event.t_ns - (onset_ns if onset_ns is not None else command_start_ns)) / 1e9
+            move = rules.press(pressed_command)
+
+            if move.correct:
+                reaction_times.append(reaction_time)
+                feedback_type = "success"
+            else:
+                feedback_type = "error"
+        
+            feedback_time = time.time()
+            results.add_trial(session, rules.moves, move.target, move.pressed, move.correct,
+                              raw_reaction_time, reaction_time)
+        
+            command_start_ns = time.perf_counter_ns()
+            onset_ns = None
+
     # Sonuç
     total_time = time.time() - game_start_time
-    accuracy = (correct_moves / total_moves * 100) if total_moves > 0 else 0
+    accuracy = (rules.correct / rules.moves * 100) if rules.moves > 0 else 0
     avg_reaction = sum(reaction_times) / len(reaction_times) if reaction_times else 0
 
-    # CSV kaydet
-    os.makedirs("results", exist_ok=True)
-    csv_file = "results/performance_log_keyboard.csv"
-    
-    file_exists = os.path.isfile(csv_file)
-    with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["Saat", "Tur", "HedefTus", "BasilanTus", "DogruMu",
-                           "ReaksiyonSuresi", "DogrulukOrani", "OrtReaksiyon"])
-        for move in move_log:
-            writer.writerow([
-                move['saat'], move['tur'], move['hedef_tus'], move['basilan_tus'],
-                move['dogru_mu'], f"{move['reaksiyon_suresi']:.3f}",
-                f"{move['dogruluk_orani']:.1f}", f"{move['ort_reaksiyon']:.3f}"
-            ])
+    results.end_session(session, rules.correct, rules.moves, avg_reaction, duration=total_time)
+    flush_results("Stage 2")
+    print(f"Stage 2 girdi zamanlamasi: {inputs.describe()}, {early_presses} erken basis yok sayildi")
+    print(f"Stage 2 dongu: {loop.describe()}")
+    if onset_lags:
+        print(f"Stage 2 uyaran gecikmesi (komut secimi -> ekran): ort {np.mean(onset_lags) / 1e6:.1f} ms, "
+              f"en fazla {max(onset_lags) / 1e6:.1f} ms")
 
     print(f"\nOYUN BİTTİ! Doğruluk: {accuracy:.1f}%, Ort. Reaksiyon: {avg_reaction:.3f}s")
     cv2.destroyAllWindows()
-    return correct_moves, total_moves, avg_reaction
+    return rules.correct, rules.moves, avg_reaction
 
 
 # =====================================================================
@@ -550,21 +549,31 @@ def stage_3_eye_tracking():
         return
 
     # Sabitler
-    SCREEN_WIDTH = 1280
-    SCREEN_HEIGHT = 720
+    SCREEN_WIDTH = EYE_SCREEN_WIDTH
+    SCREEN_HEIGHT = EYE_SCREEN_HEIGHT
     BALL_RADIUS = 45
     BALL_SPEED_OPTIONS = [-5, -4, -3, 3, 4, 5]
+    BALL_UPDATE_RATE = 60  # Hz - topun sabit fizik adımı (hızlar REFERENCE_FPS'te piksel/kare)
     FOCUS_THRESHOLD = 100
     FOCUS_REQUIRED_TIME = 1.0
     POINT_REWARD = 5
-    SMOOTHING_FACTOR = 0.22
-    GAZE_HISTORY_SIZE = 6
+    GAZE_FILTER = 'one_euro'
     FOCUS_LOSS_TOLERANCE = 0.5
     FOCUS_DECAY_RATE = 0.3
-    DETECTION_CONFIDENCE = 0.7
-    TRACKING_CONFIDENCE = 0.7
+    INFERENCE_MODE = 'pipelined'  # 'pipelined', 'keyframe' (senkron + arada optik akış) veya 'sync'
+    ROI_TRACKING = True
+    KEYFRAME_INTERVAL = 3  # 'keyframe' modunda her N karede FaceMesh, arada optik akış
+    FACE_ABSENT_POWER_SAVE = True  # Yüz yokken düşük hızlı, küçük karede algılama
+    CALIBRATION_GRID = 9
     CALIBRATION_HOLD_TIME = 2.0
     CALIBRATION_STABILITY_THRESHOLD = 0.04
+    CALIBRATION_UNSTABLE_DECAY = 1.5
+    CALIBRATION_LOST_DECAY = 3.0
+    CALIBRATION_DIM_ALPHA = 0.4
+    CALIBRATION_DIM_COLOR = 20
+    ADAPTIVE_QUALITY = True  # Kare süresi bütçesine göre FaceMesh çözünürlüğü
+    FRAME_BUDGET_MS = 33.0
+    RECORD_LANDMARK_TRACE = False  # True: oturum results/traces altına iz olarak kaydedilir
 
     COLORS = {
         'yellow': (0, 255, 255), 'magenta': (255, 0, 255),
@@ -594,53 +603,81 @@ def stage_3_eye_tracking():
         return max(min_val, min(max_val, value))
 
     class EyeFocusTrainer:
-        def __init__(self):
-            self._init_camera()
+        def __init__(self, cap, face_mesh):
+            self.clock = FrameClock()
+            self.loop = GameLoop(BALL_UPDATE_RATE)  # Kamera hızında döner; FPS sınırı yok
+            self.profiler = LatencyProfiler()
+            self.cap = cap  # Paylaşılan kaynaklar: oturum sonunda kapatılmaz
+            self.face_mesh = face_mesh
+            self.source_failed = False
+            self.screen_width = SCREEN_WIDTH
+            self.screen_height = SCREEN_HEIGHT
+            self.ui_layers = LayerCache(self.screen_width, self.screen_height)
             self._init_mediapipe()
             self._init_ball()
             self._init_game_state()
             self._init_eye_tracking()
             self._init_calibration()
-
-        def _init_camera(self):
-            self.cap = cv2.VideoCapture(0)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, SCREEN_WIDTH)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, SCREEN_HEIGHT)
-            self.screen_width = SCREEN_WIDTH
-            self.screen_height = SCREEN_HEIGHT
+            self.recorder = None
+            if RECORD_LANDMARK_TRACE:
+                os.makedirs("results/traces", exist_ok=True)
+                trace_name = f"{player_name or 'oyuncu'}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.gztr"
+                self.recorder = TraceWriter(os.path.join("results/traces", trace_name),
+                                            self.landmark_adapter.landmark_indices, self.screen_width, self.screen_height)
 
         def _init_mediapipe(self):
-            self.mp_face_mesh = mp.solutions.face_mesh
-            self.face_mesh = self.mp_face_mesh.FaceMesh(
-                max_num_faces=1,
-                refine_landmarks=True,
-                min_detection_confidence=DETECTION_CONFIDENCE,
-                min_tracking_confidence=TRACKING_CONFIDENCE
-            )
+            self.roi_tracker = FaceROITracker(LANDMARK_INDICES.values()) if ROI_TRACKING else None
+            self.inference = None
+            if INFERENCE_MODE == 'pipelined':
+                self.inference = FaceMeshWorker(self.face_mesh, self.roi_tracker, self.profiler).start()
+            self.flow_tracker = None
+            if INFERENCE_MODE == 'keyframe':
+                self.flow_tracker = IrisFlowTracker(KEYFRAME_INTERVAL)
+            self.presence = FacePresenceMonitor() if FACE_ABSENT_POWER_SAVE else None
+            self.governor = None
+            self.inference_width = None
+            self.inference_ms = None
+            # Kare başına ön işleme tamponları (ayna görüntü, senkron yol RGB girdisi, küçültme)
+            self._display_buffer = FrameBuffer()
+            self._rgb_buffer = FrameBuffer()
+            self._scratch_buffer = FrameBuffer()
+            if ADAPTIVE_QUALITY:
+                self.governor = FrameBudgetGovernor(FRAME_BUDGET_MS)
+                self._apply_quality_level()
+
+        def _apply_quality_level(self):
+            full_width = self.governor.full_width if self.governor is not None else None
+            if self.presence is not None and self.presence.idle:
+                full_width = self.presence.idle_width
+            self.inference_width = full_width
+            if self.roi_tracker is not None:
+                self.roi_tracker.full_width = full_width
+                if self.governor is not None:
+                    self.roi_tracker.inference_width = self.governor.roi_width
+            if self.inference is not None:
+                self.inference.max_width = full_width
 
         def _init_ball(self):
             self.ball_radius = BALL_RADIUS
             self.ball_x = self.screen_width // 2
             self.ball_y = self.screen_height // 2
+            self.ball_prev = (self.ball_x, self.ball_y)  # Önceki fizik adımındaki konum
             self.ball_speed_x = random.choice(BALL_SPEED_OPTIONS)
             self.ball_speed_y = random.choice(BALL_SPEED_OPTIONS)
             self.ball_color = get_random_bright_color()
 
         def _init_game_state(self):
             self.score = 0
-            self.focus_start_time = None
-            self.focus_duration = 0.0
-            self.is_focused = False
+            self.focus = FocusRule(FOCUS_THRESHOLD, FOCUS_REQUIRED_TIME, FOCUS_LOSS_TOLERANCE, FOCUS_DECAY_RATE)
             self.warning_message = ""
             self.warning_time = 0
             self.success_message = ""
             self.success_time = 0
-            self.focus_loss_start = None
-            self.accumulated_focus = 0.0
             
-            # CSV logging for eye tracking
-            self.focus_events = []  # List to store all focus events
-            self.game_start_time = time.time()
+            # Sonuç kaydı (oturum ve odak olayları SQLite deposuna)
+            self.session = get_results_store().start_session(player_name, STAGE_EYE)
+            self.focus_event_count = 0  # Sonuç deposuna gönderilen odak olayları
+            self.game_start_time = self.clock.start
             self.total_focus_attempts = 0
             self.successful_focuses = 0
             self.focus_durations = []  # List to store successful focus durations
@@ -650,113 +687,134 @@ def stage_3_eye_tracking():
             self.iris_y = 0.5
             self.face_detected = False
             self.eyes_valid = False
+            # Çıkarım aynalanmamış karede yapılır; noktalar ekrandaki ayna görüntüye çevrilir
+            self.landmark_adapter = LandmarkAdapter(LANDMARK_INDICES, mirror=True)
+            self._points_buffer = np.empty((len(self.landmark_adapter.indices), 3))
+            self.sample_points = None
+            self.sample_seq = 0
+            self.sample_time = self.clock.now
+            self.has_new_sample = False
             self.gaze_x = self.screen_width // 2
             self.gaze_y = self.screen_height // 2
-            self.gaze_history_x = deque(maxlen=GAZE_HISTORY_SIZE)
-            self.gaze_history_y = deque(maxlen=GAZE_HISTORY_SIZE)
-            self.prev_gaze_x = self.screen_width // 2
-            self.prev_gaze_y = self.screen_height // 2
+            self.gaze_filter = make_gaze_filter(GAZE_FILTER)
 
         def _init_calibration(self):
+            grid = make_calibration_grid(CALIBRATION_GRID, self.screen_width, self.screen_height)
             self.calibration_points = {
-                'center': {'screen': (self.screen_width // 2, self.screen_height // 2), 'iris': None},
-                'left': {'screen': (200, self.screen_height // 2), 'iris': None},
-                'right': {'screen': (self.screen_width - 200, self.screen_height // 2), 'iris': None},
-                'top': {'screen': (self.screen_width // 2, 150), 'iris': None},
-                'bottom': {'screen': (self.screen_width // 2, self.screen_height - 150), 'iris': None},
+                name: {'screen': pos, 'label': label, 'iris': None} for name, label, pos in grid
             }
-            self.calibration_order = ['center', 'left', 'right', 'top', 'bottom']
+            self.calibration_order = [name for name, _, _ in grid]
             self.current_calibration_index = 0
             self.is_calibrated = False
             self.calibration_hold_time = 0
-            self.iris_center = (0.5, 0.5)
-            self.iris_left = None
-            self.iris_right = None
-            self.iris_top = None
-            self.iris_bottom = None
+            self.gaze_mapping = None
             self.calibration_iris_history = []
 
-        def update_ball(self):
-            self.ball_x += self.ball_speed_x
-            self.ball_y += self.ball_speed_y
-            if self.ball_x <= self.ball_radius or self.ball_x >= self.screen_width - self.ball_radius:
-                self.ball_speed_x = -self.ball_speed_x
-                self.ball_color = get_random_bright_color()
-            if self.ball_y <= self.ball_radius or self.ball_y >= self.screen_height - self.ball_radius:
-                self.ball_speed_y = -self.ball_speed_y
+        def update_ball(self, dt):
+            # Hızlar REFERENCE_FPS'te piksel/kare olarak tanımlı
+            step = dt * REFERENCE_FPS
+            self.ball_prev = (self.ball_x, self.ball_y)
+            self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y, bounced = move_ball(
+                self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y,
+                self.ball_radius, self.screen_width, self.screen_height, step)
+            if bounced:
                 self.ball_color = get_random_bright_color()
-            self.ball_x = clamp(self.ball_x, self.ball_radius, self.screen_width - self.ball_radius)
-            self.ball_y = clamp(self.ball_y, self.ball_radius, self.screen_height - self.ball_radius)
 
         def reset_ball(self):
             margin = 150
             self.ball_x = random.randint(self.ball_radius + margin, self.screen_width - self.ball_radius - margin)
             self.ball_y = random.randint(self.ball_radius + margin, self.screen_height - self.ball_radius - margin)
+            self.ball_prev = (self.ball_x, self.ball_y)
             self.ball_speed_x = random.choice(BALL_SPEED_OPTIONS)
             self.ball_speed_y = random.choice(BALL_SPEED_OPTIONS)
             self.ball_color = get_random_bright_color()
 
         def get_iris_position(self, landmarks):
-            idx = LANDMARK_INDICES
-            left_iris = landmarks[idx['left_iris_center']]
-            left_eye_left = landmarks[idx['left_eye_left']]
-            left_eye_right = landmarks[idx['left_eye_right']]
-            left_eye_top = landmarks[idx['left_eye_top']]
-            left_eye_bottom = landmarks[idx['left_eye_bottom']]
-            right_iris = landmarks[idx['right_iris_center']]
-            right_eye_left = landmarks[idx['right_eye_left']]
-            right_eye_right = landmarks[idx['right_eye_right']]
-            right_eye_top = landmarks[idx['right_eye_top']]
-            right_eye_bottom = landmarks[idx['right_eye_bottom']]
-
-            left_eye_width = left_eye_right.x - left_eye_left.x
-            if left_eye_width > 0.005:
-                left_iris_x = (left_iris.x - left_eye_left.x) / left_eye_width
-            else:
+            points = landmarks if isinstance(landmarks, np.ndarray) else self.landmark_adapter.to_array(landmarks)
+            iris_x, iris_y, valid = iris_position(points)
+            if not valid:
                 return None, None
-
-            left_eye_height = left_eye_bottom.y - left_eye_top.y
-            if left_eye_height > 0.002:
-                left_iris_y = (left_iris.y - left_eye_top.y) / left_eye_height
-            else:
-                return None, None
-
-            right_eye_width = right_eye_right.x - right_eye_left.x
-            if right_eye_width > 0.005:
-                right_iris_x = (right_iris.x - right_eye_left.x) / right_eye_width
-            else:
-                return None, None
-
-            right_eye_height = right_eye_bottom.y - right_eye_top.y
-            if right_eye_height > 0.002:
-                right_iris_y = (right_iris.y - right_eye_top.y) / right_eye_height
+            return float(iris_x), float(iris_y)
+
+        def detect_face(self, frame, frame_time=None, display=None):
+            if frame_time is None:
+                frame_time = self.clock.now
+            if display is None:
+                display = frame
+            self.has_new_sample = False
+            self.inference_ms = None
+
+            detect = True
+            if self.presence is not None:
+                self.presence.sample_cpu()
+                detect = self.presence.should_detect(self.clock.now)
+
+            if self.inference is not None:
+                # Pipeline: bu kare worker'a gider, son tamamlanan sonuç kullanılır
+                if detect:
+                    self.inference.submit(frame, frame_time)
+                result = self.inference.latest()
+                if result is not None and result.seq != self.sample_seq:
+                    self.inference_ms = result.process_time * 1000
+                    self._apply_face_result(result.multi_face_landmarks, result.seq, result.timestamp)
+            elif not detect:
+                pass  # Yüz yok: bu kare algılanmadan geçer
+            elif self.flow_tracker is not None and not self.flow_tracker.needs_keyframe():
+                # Anahtar kare arası: optik akış, kayma varsa hemen FaceMesh
+                with self.profiler.span('optical_flow'):
+                    points = self.flow_tracker.track(display)
+                if points is not None:
+                    self._apply_eye_points(points, self.sample_seq + 1, frame_time)
+                else:
+                    self.flow_tracker.mark_forced()
+                    self._process_keyframe(frame, frame_time, display)
             else:
-                return None, None
-
-            avg_iris_x = (left_iris_x + right_iris_x) / 2
-            avg_iris_y = (left_iris_y + right_iris_y) / 2
-
-            if not (0.1 < avg_iris_x < 0.9 and 0.1 < avg_iris_y < 0.9):
-                return None, None
-
-            return avg_iris_x, avg_iris_y
-
-        def detect_face(self, frame):
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.face_mesh.process(rgb_frame)
+                self._process_keyframe(frame, frame_time, display)
+
+            if self.presence is not None and self.has_new_sample:
+                if self.presence.update(self.face_detected, self.clock.now):
+                    self._apply_quality_level()
+                    print(f"Algilama modu: {self.presence.describe()}")
+            return display
+
+        def _process_keyframe(self, frame, frame_time, display):
+            with self.profiler.span('preprocess'):
+                if self.roi_tracker is not None:
+                    rgb_input, roi = self.roi_tracker.prepare(frame, self._rgb_buffer)
+                else:
+                    rgb_input = to_inference_rgb(frame, self.inference_width, self._rgb_buffer, self._scratch_buffer)
+                    roi = None
+            start_ns = time.perf_counter_ns()
+            results = self.face_mesh.process(rgb_input)
+            self.profiler.record('face_mesh', time.perf_counter_ns() - start_ns)
+            multi_face_landmarks = results.multi_face_landmarks
+            if self.roi_tracker is not None:
+                multi_face_landmarks = self.roi_tracker.finish(multi_face_landmarks, roi, frame.shape)
+            self._apply_face_result(multi_face_landmarks, self.sample_seq + 1, frame_time)
+            if self.flow_tracker is not None:
+                self.flow_tracker.set_keyframe(display, self.sample_points if self.eyes_valid else None)
+
+        def _apply_face_result(self, multi_face_landmarks, seq, timestamp):
+            points = None
+            if multi_face_landmarks:
+                points = self.landmark_adapter.to_array(multi_face_landmarks[0].landmark, self._points_buffer)
+            self._apply_eye_points(points, seq, timestamp)
+
+        def _apply_eye_points(self, points, seq, timestamp):
+            self.sample_seq = seq
+            self.sample_time = timestamp
+            self.sample_points = points
+            self.has_new_sample = True
             self.face_detected = False
             self.eyes_valid = False
 
-            if results.multi_face_landmarks:
-                face_landmarks = results.multi_face_landmarks[0]
+            if points is not None:
                 self.face_detected = True
-                landmarks = face_landmarks.landmark
-                iris_x, iris_y = self.get_iris_position(landmarks)
+                iris_x, iris_y = self.get_iris_position(points)
                 if iris_x is not None and iris_y is not None:
                     self.iris_x = iris_x
                     self.iris_y = iris_y
                     self.eyes_valid = True
-            return frame
 
         def run_calibration(self, frame):
             if self.current_calibration_index >= len(self.calibration_order):
@@ -767,29 +825,25 @@ def stage_3_eye_tracking():
             current_point = self.calibration_points[current_point_name]
             screen_x, screen_y = current_point['screen']
 
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (self.screen_width, self.screen_height), (20, 20, 20), -1)
-            frame = cv2.addWeighted(overlay, 0.6, frame, 0.4, 0)
+            frame = self.ui_layers.dim(frame, CALIBRATION_DIM_ALPHA,
+                                       CALIBRATION_DIM_COLOR * (1 - CALIBRATION_DIM_ALPHA))
 
-            pulse = int(20 * np.sin(time.time() * 4) + 60)
+            pulse = int(20 * np.sin(self.clock.now * 4) + 60)
             cv2.circle(frame, (screen_x, screen_y), pulse, (0, 80, 200), -1)
             cv2.circle(frame, (screen_x, screen_y), 45, COLORS['red'], -1)
             cv2.circle(frame, (screen_x, screen_y), 45, COLORS['white'], 4)
             cv2.circle(frame, (screen_x, screen_y), 15, COLORS['white'], -1)
 
-            cv2.putText(frame, "KALIBRASYON", (self.screen_width // 2 - 150, 50),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1.5, COLORS['cyan'], 3)
-            cv2.putText(frame, "Sadece GOZLERINIZLE kirmizi noktaya bakin!",
-                        (self.screen_width // 2 - 300, 100),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.9, COLORS['white'], 2)
+            self.ui_layers.composite(frame, 'calibration_header', self._render_calibration_header)
 
-            point_names = {'center': 'MERKEZ', 'left': 'SOL', 'right': 'SAG', 'top': 'YUKARI', 'bottom': 'ASAGI'}
-            progress_text = f"Nokta: {point_names[current_point_name]} ({self.current_calibration_index + 1}/5)"
+            progress_text = (f"Nokta: {current_point['label']} "
+                             f"({self.current_calibration_index + 1}/{len(self.calibration_order)})")
             cv2.putText(frame, progress_text, (20, self.screen_height - 60),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.9, COLORS['cyan'], 2)
 
             if self.face_detected and self.eyes_valid:
-                self.calibration_iris_history.append((self.iris_x, self.iris_y))
+                if self.has_new_sample:
+                    self.calibration_iris_history.append((self.iris_x, self.iris_y))
                 if len(self.calibration_iris_history) > 15:
                     self.calibration_iris_history.pop(0)
 
@@ -804,7 +858,7 @@ def stage_3_eye_tracking():
                         is_stable = False
 
                 if is_stable:
-                    self.calibration_hold_time += 1 / 30.0
+                    self.calibration_hold_time += self.clock.dt
                     progress = min(self.calibration_hold_time / CALIBRATION_HOLD_TIME, 1.0)
                     bar_width = 400
                     bar_x = self.screen_width // 2 - bar_width // 2
@@ -821,189 +875,96 @@ def stage_3_eye_tracking():
                         self.calibration_hold_time = 0
                         self.calibration_iris_history.clear()
                 else:
-                    self.calibration_hold_time = max(0, self.calibration_hold_time - 0.05)
+                    self.calibration_hold_time = max(0, self.calibration_hold_time - CALIBRATION_UNSTABLE_DECAY * self.clock.dt)
                     cv2.putText(frame, "SABIT BAKIN!", (self.screen_width // 2 - 100, self.screen_height // 2 + 80),
                                 cv2.FONT_HERSHEY_SIMPLEX, 0.8, COLORS['orange'], 2)
             else:
-                self.calibration_hold_time = max(0, self.calibration_hold_time - 0.1)
+                self.calibration_hold_time = max(0, self.calibration_hold_time - CALIBRATION_LOST_DECAY * self.clock.dt)
                 status = "YUZ TESPIT EDILEMIYOR!" if not self.face_detected else "GOZ TESPIT EDILEMIYOR!"
                 cv2.putText(frame, status, (self.screen_width // 2 - 200, self.screen_height // 2 + 50),
                             cv2.FONT_HERSHEY_SIMPLEX, 1, COLORS['red'], 3)
 
             return frame
 
+        def _render_calibration_header(self, canvas):
+            cv2.putText(canvas, "KALIBRASYON", (self.screen_width // 2 - 150, 50),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1.5, COLORS['cyan'], 3)
+            cv2.putText(canvas, "Sadece GOZLERINIZLE kirmizi noktaya bakin!",
+                        (self.screen_width // 2 - 300, 100),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.9, COLORS['white'], 2)
+
+        def _render_top_bar(self, canvas):
+            cv2.rectangle(canvas, (0, 0), (self.screen_width, 80), (30, 30, 30), -1)
+
+        def _render_footer(self, canvas):
+            cv2.putText(canvas, "R = Yeniden Kalibrasyon | Q = Cikis", (self.screen_width // 2 - 250, self.screen_height - 15),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, COLORS['gray'], 2)
+
         def _finish_calibration(self):
-            self.iris_center = self.calibration_points['center']['iris']
-            self.iris_left = self.calibration_points['left']['iris']
-            self.iris_right = self.calibration_points['right']['iris']
-            self.iris_top = self.calibration_points['top']['iris']
-            self.iris_bottom = self.calibration_points['bottom']['iris']
+            names = [name for name in self.calibration_order if self.calibration_points[name]['iris'] is not None]
+            iris_points = [self.calibration_points[name]['iris'] for name in names]
+            screen_points = [self.calibration_points[name]['screen'] for name in names]
+            self.gaze_mapping = GazeMapping.fit(iris_points, screen_points)
+            if self.gaze_mapping is None:
+                print("Kalibrasyon verisi yetersiz, tekrar deneniyor...")
+                self.reset_calibration()
+                return
             self.is_calibrated = True
-            print("Kalibrasyon tamamlandi!")
+            if self.recorder is not None:
+                self.recorder.write_mapping(self.gaze_mapping.coeffs)
+            print(f"Kalibrasyon tamamlandi! (ortalama hata: {self.gaze_mapping.residual_px:.1f} px)")
 
         def calculate_gaze(self):
-            if not self.is_calibrated or not self.eyes_valid:
-                return
-            if not all([self.iris_center, self.iris_left, self.iris_right, self.iris_top, self.iris_bottom]):
+            if not self.is_calibrated or not self.eyes_valid or self.gaze_mapping is None:
                 return
 
-            # Get calibration ranges
-            center_x = self.iris_center[0]
-            center_y = self.iris_center[1]
-            
-            # Calculate X position relative to center
-            # Note: When looking LEFT, iris moves RIGHT in the eye (towards nose)
-            # When looking RIGHT, iris moves LEFT in the eye (towards ear)
-            # So we need to INVERT the X direction
-            
-            diff_x = self.iris_x - center_x
-            diff_y = self.iris_y - center_y
-            
-            # Get the range from calibration
-            left_range = abs(center_x - self.iris_left[0]) if self.iris_left[0] != center_x else 0.05
-            right_range = abs(self.iris_right[0] - center_x) if self.iris_right[0] != center_x else 0.05
-            top_range = abs(center_y - self.iris_top[1]) if self.iris_top[1] != center_y else 0.05
-            bottom_range = abs(self.iris_bottom[1] - center_y) if self.iris_bottom[1] != center_y else 0.05
-            
-            # Normalize based on direction
-            if diff_x < 0:
-                # Looking towards left side of calibration
-                norm_x = diff_x / left_range if left_range > 0.001 else 0
-            else:
-                # Looking towards right side of calibration  
-                norm_x = diff_x / right_range if right_range > 0.001 else 0
-                
-            if diff_y < 0:
-                norm_y = diff_y / top_range if top_range > 0.001 else 0
-            else:
-                norm_y = diff_y / bottom_range if bottom_range > 0.001 else 0
+            # Regresyon modeli doğrudan ekran koordinatı verir (amplifikasyon gerekmez)
+            target_x, target_y = self.gaze_mapping.apply(self.iris_x, self.iris_y)
+            target_x = clamp(target_x, 0, self.screen_width)
+            target_y = clamp(target_y, 0, self.screen_height)
 
-            # Clamp values
-            norm_x = clamp(norm_x, -1.5, 1.5)
-            norm_y = clamp(norm_y, -1.5, 1.5)
-            
-            # Amplification factors - makes gaze tracking more responsive
-            X_AMPLIFICATION = 1.8  # Horizontal sensitivity boost
-            Y_AMPLIFICATION = 1.8  # Vertical sensitivity boost
-            
-            norm_x = norm_x * X_AMPLIFICATION
-            norm_y = norm_y * Y_AMPLIFICATION
-            
-            # Re-clamp after amplification
-            norm_x = clamp(norm_x, -1.5, 1.5)
-            norm_y = clamp(norm_y, -1.5, 1.5)
-            
-            # Use consistent margins for both axes
-            EDGE_MARGIN = 60  # Reduced margin = more range
-            target_x = int(self.screen_width / 2 + norm_x * (self.screen_width / 2 - EDGE_MARGIN))
-            target_y = int(self.screen_height / 2 + norm_y * (self.screen_height / 2 - EDGE_MARGIN))
-
-            self.gaze_history_x.append(target_x)
-            self.gaze_history_y.append(target_y)
-
-            if len(self.gaze_history_x) >= 3:
-                weights = np.linspace(0.5, 1.0, len(self.gaze_history_x))
-                weights = weights / weights.sum()
-                avg_x = np.average(list(self.gaze_history_x), weights=weights)
-                avg_y = np.average(list(self.gaze_history_y), weights=weights)
-            else:
-                avg_x = target_x
-                avg_y = target_y
-
-            max_jump = 150
-            delta_x = avg_x - self.prev_gaze_x
-            delta_y = avg_y - self.prev_gaze_y
-            if abs(delta_x) > max_jump:
-                avg_x = self.prev_gaze_x + (max_jump if delta_x > 0 else -max_jump)
-            if abs(delta_y) > max_jump:
-                avg_y = self.prev_gaze_y + (max_jump if delta_y > 0 else -max_jump)
-
-            self.gaze_x = int(self.prev_gaze_x + (avg_x - self.prev_gaze_x) * SMOOTHING_FACTOR)
-            self.gaze_y = int(self.prev_gaze_y + (avg_y - self.prev_gaze_y) * SMOOTHING_FACTOR)
-
-            self.gaze_x = clamp(self.gaze_x, 50, self.screen_width - 50)
-            self.gaze_y = clamp(self.gaze_y, 50, self.screen_height - 50)
-            self.prev_gaze_x = self.gaze_x
-            self.prev_gaze_y = self.gaze_y
+            filtered_x, filtered_y = self.gaze_filter.update(target_x, target_y, self.sample_time)
+            self.gaze_x = int(clamp(filtered_x, 50, self.screen_width - 50))
+            self.gaze_y = int(clamp(filtered_y, 50, self.screen_height - 50))
 
         def check_focus(self):
             if not self.eyes_valid or not self.is_calibrated:
-                if self.is_focused and self.focus_loss_start is None:
-                    self.focus_loss_start = time.time()
-                if self.focus_loss_start:
-                    loss_duration = time.time() - self.focus_loss_start
-                    if loss_duration > FOCUS_LOSS_TOLERANCE:
-                        self._reset_focus()
+                self.focus.lose_eyes(self.clock.now)
                 return
 
-            self.calculate_gaze()
+            # Zamanlama, iris verisinin geldiği karenin zamanına göre yapılır
+            if self.has_new_sample:
+                with self.profiler.span('calculate_gaze'):
+                    self.calculate_gaze()
             distance = calculate_distance(self.gaze_x, self.gaze_y, self.ball_x, self.ball_y)
-
-            if distance < FOCUS_THRESHOLD:
-                self.focus_loss_start = None
-                if not self.is_focused:
-                    self.is_focused = True
-                    self.focus_start_time = time.time()
-                    self.accumulated_focus = 0.0
-                else:
-                    self.focus_duration = time.time() - self.focus_start_time
-                    self.accumulated_focus = self.focus_duration
-                    if self.accumulated_focus >= FOCUS_REQUIRED_TIME:
-                        self.score += POINT_REWARD
-                        self.success_message = f"+{POINT_REWARD} PUAN!"
-                        self.success_time = time.time()
-                        
-                        # Log successful focus event to CSV data
-                        self.successful_focuses += 1
-                        self.focus_durations.append(self.focus_duration)
-                        self.focus_events.append({
-                            'zaman': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            'olay_turu': 'BASARILI_ODAK',
-                            'odak_suresi': round(self.focus_duration, 3),
-                            'goz_x': self.gaze_x,
-                            'goz_y': self.gaze_y,
-                            'top_x': self.ball_x,
-                            'top_y': self.ball_y,
-                            'mesafe': round(calculate_distance(self.gaze_x, self.gaze_y, self.ball_x, self.ball_y), 1),
-                            'skor': self.score
-                        })
-                        
-                        self._reset_focus()
-                        self.reset_ball()
-            else:
-                if self.is_focused:
-                    if self.focus_loss_start is None:
-                        self.focus_loss_start = time.time()
-                    else:
-                        loss_duration = time.time() - self.focus_loss_start
-                        if loss_duration > FOCUS_LOSS_TOLERANCE:
-                            if self.accumulated_focus > 0.3:
-                                self.warning_message = "Odak kaybedildi!"
-                                self.warning_time = time.time()
-                                
-                                # Log failed focus event
-                                self.total_focus_attempts += 1
-                                self.focus_events.append({
-                                    'zaman': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                    'olay_turu': 'ODAK_KAYBI',
-                                    'odak_suresi': round(self.accumulated_focus, 3),
-                                    'goz_x': self.gaze_x,
-                                    'goz_y': self.gaze_y,
-                                    'top_x': self.ball_x,
-                                    'top_y': self.ball_y,
-                                    'mesafe': round(calculate_distance(self.gaze_x, self.gaze_y, self.ball_x, self.ball_y), 1),
-                                    'skor': self.score
-                                })
-                            self._reset_focus()
-                        elif self.accumulated_focus > 0:
-                            self.accumulated_focus -= FOCUS_DECAY_RATE * (1/30)
-
-        def _reset_focus(self):
-            self.is_focused = False
-            self.focus_start_time = None
-            self.focus_duration = 0.0
-            self.focus_loss_start = None
-            self.accumulated_focus = 0.0
+            event = self.focus.update(distance, self.sample_time, self.clock.dt)
+
+            if event == FOCUS_SUCCESS:
+                self.score += POINT_REWARD
+                self.success_message = f"+{POINT_REWARD} PUAN!"
+                self.success_time = self.clock.now
+
+                # Log successful focus event to CSV data
+                self.successful_focuses += 1
+                self.focus_durations.append(self.focus.event_duration)
+                self._log_focus_event(event, self.focus.event_duration)
+                self.reset_ball()
+            elif event == FOCUS_LOST:
+                self.warning_message = "Odak kaybedildi!"
+                self.warning_time = self.clock.now
+
+                # Log failed focus event
+                self.total_focus_attempts += 1
+                self._log_focus_event(event, self.focus.event_duration)
+
+        def _log_focus_event(self, event_type, duration):
+            """Odak olayını sonuç yazıcısına gönder (dosya işlemi arka planda)"""
+            self.focus_event_count += 1
+            get_results_store().add_event(
+                self.session, event_type, round(duration, 3),
+                (self.gaze_x, self.gaze_y), (self.ball_x, self.ball_y),
+                round(calculate_distance(self.gaze_x, self.gaze_y, self.ball_x, self.ball_y), 1),
+                self.score)
 
         def draw_ui(self, frame):
             # Bakış hedefi
@@ -1014,20 +975,22 @@ def stage_3_eye_tracking():
                 cv2.line(frame, (x - 50, y), (x + 50, y), COLORS['magenta'], 2)
                 cv2.line(frame, (x, y - 50), (x, y + 50), COLORS['magenta'], 2)
 
-            # Top
-            x, y = int(self.ball_x), int(self.ball_y)
+            # Top (son iki fizik adımı arasında)
+            alpha = self.loop.alpha
+            x = int(self.ball_prev[0] + (self.ball_x - self.ball_prev[0]) * alpha)
+            y = int(self.ball_prev[1] + (self.ball_y - self.ball_prev[1]) * alpha)
             cv2.circle(frame, (x, y), self.ball_radius, self.ball_color, -1)
             cv2.circle(frame, (x, y), self.ball_radius, COLORS['white'], 3)
-            if self.is_focused:
+            if self.focus.is_focused:
                 cv2.circle(frame, (x, y), self.ball_radius + 20, COLORS['green'], 4)
 
             # Üst bar
-            cv2.rectangle(frame, (0, 0), (self.screen_width, 80), (30, 30, 30), -1)
+            self.ui_layers.composite(frame, 'top_bar', self._render_top_bar)
             cv2.putText(frame, f"SKOR: {self.score}", (20, 55),
                         cv2.FONT_HERSHEY_SIMPLEX, 1.5, COLORS['green'], 3)
 
-            if self.is_focused:
-                progress = min(self.focus_duration / FOCUS_REQUIRED_TIME, 1.0)
+            if self.focus.is_focused:
+                progress = min(self.focus.duration / FOCUS_REQUIRED_TIME, 1.0)
                 bar_x = self.screen_width // 2 - 150
                 cv2.rectangle(frame, (bar_x, 28), (bar_x + 300, 53), (60, 60, 60), -1)
                 cv2.rectangle(frame, (bar_x, 28), (bar_x + int(300 * progress), 53), COLORS['green'], -1)
@@ -1043,25 +1006,27 @@ def stage_3_eye_tracking():
                         cv2.FONT_HERSHEY_SIMPLEX, 0.9, status_color, 2)
 
             # Mesajlar
-            if self.warning_message and time.time() - self.warning_time < 1.5:
+            if self.warning_message and self.clock.now - self.warning_time < 1.5:
                 cv2.putText(frame, self.warning_message, (self.screen_width // 2 - 150, self.screen_height // 2),
                             cv2.FONT_HERSHEY_SIMPLEX, 1.2, COLORS['red'], 3)
-            if self.success_message and time.time() - self.success_time < 1.5:
+            if self.success_message and self.clock.now - self.success_time < 1.5:
                 cv2.putText(frame, self.success_message, (self.screen_width // 2 - 100, self.screen_height // 2),
                             cv2.FONT_HERSHEY_SIMPLEX, 2, COLORS['green'], 4)
 
-            cv2.putText(frame, "R = Yeniden Kalibrasyon | Q = Cikis", (self.screen_width // 2 - 250, self.screen_height - 15),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, COLORS['gray'], 2)
+            self.ui_layers.composite(frame, 'footer', self._render_footer)
             return frame
 
         def reset_calibration(self):
             self.is_calibrated = False
+            self.gaze_mapping = None
             self.current_calibration_index = 0
             self.calibration_hold_time = 0
-            self.gaze_history_x.clear()
-            self.gaze_history_y.clear()
+            self.calibration_iris_history.clear()
+            self.gaze_filter.reset()
             for point in self.calibration_points.values():
                 point['iris'] = None
+            if self.recorder is not None:
+                self.recorder.write_mapping(None)
             print("Yeniden kalibrasyon baslatiliyor...")
 
         def run(self):
@@ -1069,114 +1034,186 @@ def stage_3_eye_tracking():
             print("GOZ ODAK TAKIP OYUNU - MediaPipe Edition")
             print("=" * 60)
             
+            profiler = self.profiler
             while True:
-                ret, frame = self.cap.read()
+                loop_start_ns = time.perf_counter_ns()
+                # Canlı kaynakta saat duvar saatidir; kayıtlı kaynakta kare zamanı ile ilerler
+                if self.cap.live:
+                    self.clock.tick()
+                capture_start_ns = time.perf_counter_ns()
+                ret, frame, frame_time = self.cap.read_with_timestamp()
+                capture_ns = time.perf_counter_ns() - capture_start_ns
+                profiler.record('capture', capture_ns)
                 if not ret:
-                    print("Kamera okunamadi!")
+                    print("Kamera okunamadi!" if self.cap.live else "Kaynak sona erdi.")
+                    self.source_failed = True
                     break
-
-                frame = cv2.flip(frame, 1)
-                frame = self.detect_face(frame)
-
+                if not self.cap.live:
+                    self.clock.tick(frame_time)
+
+                # Ayna görüntü sadece ekran için tampona yazılır; çıkarım kamera yönündeki karede
+                display_frame = cv2.flip(frame, 1, dst=self._display_buffer.view(frame.shape))
+                frame = self.detect_face(frame, frame_time, display_frame)
+                if self.recorder is not None:
+                    self.recorder.write_frame(
+                        self.clock.now, self.sample_time, self.has_new_sample, self.sample_points,
+                        (self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y),
+                    )
+
+                # Top sadece kalibrasyondan sonra hareket eder
+                self.loop.tick(self.update_ball if self.is_calibrated else None, self.clock.now)
                 if not self.is_calibrated:
-                    frame = self.run_calibration(frame)
+                    with profiler.span('calibration'):
+                        frame = self.run_calibration(frame)
                 else:
-                    self.update_ball()
                     self.check_focus()
-                    frame = self.draw_ui(frame)
-
-                cv2.imshow('Goz Odak Takip Oyunu', frame)
-
-                key = cv2.waitKey(1) & 0xFF
+                    with profiler.span('draw_ui'):
+                        frame = self.draw_ui(frame)
+
+                profiler.draw_hud(frame)
+                with profiler.span('imshow'):
+                    cv2.imshow('Goz Odak Takip Oyunu', frame)
+
+                with profiler.span('waitKey'):
+                    key = cv2.waitKey(self.loop.wait_ms()) & 0xFF
+                loop_ns = time.perf_counter_ns() - loop_start_ns
+                profiler.record('frame', loop_ns)
+                if self.governor is not None and self.governor.update((loop_ns - capture_ns) / 1e6, self.inference_ms):
+                    self._apply_quality_level()
+                    print(f"Cikarim kalitesi: {self.governor.describe()}")
                 if key == ord('q'):
                     break
                 elif key == ord('r'):
                     self.reset_calibration()
+                else:
+                    profiler.handle_key(key)
 
-            self.cap.release()
+            capture_stats = self.cap.get_stats()
             cv2.destroyAllWindows()
-            self.face_mesh.close()
+            if self.inference is not None:
+                self.inference.stop()
+            print(f"Kamera: {capture_stats['captured']} kare, "
+                  f"{capture_stats['dropped']} dusuruldu (%{capture_stats['drop_rate']:.1f})")
+            if self.recorder is not None:
+                print(f"Iz kaydi: {self.recorder.frames_written} kare")
+                self.recorder.close()
+            if self.flow_tracker is not None:
+                flow_stats = self.flow_tracker.get_stats()
+                print(f"Optik akis: {flow_stats['keyframes']} anahtar kare "
+                      f"({flow_stats['forced_keyframes']} kayma), {flow_stats['flow_frames']} akis karesi, "
+                      f"ort. iris hatasi {flow_stats['iris_error']:.4f}")
+            if self.presence is not None:
+                presence_stats = self.presence.get_stats()
+                print(f"CPU: takip %{presence_stats['cpu_active'] or 0:.0f}, "
+                      f"yuz yok %{presence_stats['cpu_idle'] or 0:.0f} ({presence_stats['idle_seconds']:.1f} sn)")
+            print(f"Dongu: {self.loop.describe()}")
+            profiler.print_summary("Stage 3 gecikme")
+            profiler.export_histogram("stage3_eye_tracking")
             
-            # Save results to CSV
-            self._save_csv_results()
+            # Sonuçları kaydet
+            self._save_results()
             
             print(f"\nOYUN BITTI! Toplam skor: {self.score}")
             return self.score
         
-        def _save_csv_results(self):
-            """Save eye tracking results to CSV file"""
-            os.makedirs("results", exist_ok=True)
-            csv_file = "results/performance_log_eye_tracking.csv"
-            
-            try:
-                file_exists = os.path.isfile(csv_file)
-                with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    if not file_exists:
-                        writer.writerow([
-                            "Oyuncu", "Zaman", "OlayTuru", "OdakSuresi", 
-                            "GozX", "GozY", "TopX", "TopY", "Mesafe", "Skor"
-                        ])
-                    
-                    for event in self.focus_events:
-                        writer.writerow([
-                            player_name if player_name else "Bilinmiyor",
-                            event['zaman'],
-                            event['olay_turu'],
-                            event['odak_suresi'],
-                            event['goz_x'],
-                            event['goz_y'],
-                            event['top_x'],
-                            event['top_y'],
-                            event['mesafe'],
-                            event['skor']
-                        ])
-                print(f"  - {csv_file} kaydedildi")
-            except PermissionError:
-                print(f"  UYARI: {csv_file} dosyasi acik oldugu icin kaydedilemedi!")
-                print(f"  Lutfen Excel veya baska bir programda aciksa kapatin.")
-            
-            # Also save a summary
-            summary_file = "results/eye_tracking_summary.csv"
-            summary_exists = os.path.isfile(summary_file)
-            
-            total_time = time.time() - self.game_start_time
+        def _save_results(self):
+            """Oturum özetini kuyruğa ekle ve bekleyen tüm satırların yazılmasını bekle"""
+            total_time = time.perf_counter() - self.game_start_time
             avg_focus_duration = sum(self.focus_durations) / len(self.focus_durations) if self.focus_durations else 0
             total_attempts = self.successful_focuses + self.total_focus_attempts
-            accuracy = (self.successful_focuses / total_attempts * 100) if total_attempts > 0 else 0
-            
-            try:
-                with open(summary_file, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    if not summary_exists:
-                        writer.writerow([
-                            "Oyuncu", "Tarih", "ToplamSure", "BasariliOdak", 
-                            "BasarisizOdak", "DogrulukOrani", "OrtOdakSuresi", "ToplamSkor"
-                        ])
-                    
-                    writer.writerow([
-                        player_name if player_name else "Bilinmiyor",
-                        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        f"{total_time:.1f}",
-                        self.successful_focuses,
-                        self.total_focus_attempts,
-                        f"{accuracy:.1f}",
-                        f"{avg_focus_duration:.3f}",
-                        self.score
-                    ])
-                print(f"  - {summary_file} kaydedildi")
-            except PermissionError:
-                print(f"  UYARI: {summary_file} dosyasi acik oldugu icin kaydedilemedi!")
-                print(f"  Lutfen Excel veya baska bir programda aciksa kapatin.")
+
+            results = get_results_store()
+            results.end_session(self.session, self.successful_focuses, total_attempts,
+                                avg_focus_duration, self.score, duration=total_time)
+            flush_results("Stage 3")
+            print(f"  - {results.path} ({self.focus_event_count} olay)")
             
             print(f"\nSonuclar islendi.")
 
-    trainer = EyeFocusTrainer()
-    score = trainer.run()
+    resources = start_eye_warmup()
+    if not resources.ready:
+        print("Kamera ve FaceMesh hazirlaniyor...")
+    session = resources.acquire()
+    if session is None:
+        print(f"HATA: Goz takibi baslatilamadi: {resources.error}")
+        release_eye_resources()
+        return
+    print(f"Goz takibi hazir (hazirlik {resources.warmup_time:.2f} sn, "
+          f"bekleme {resources.wait_time:.2f} sn, oturum {resources.sessions})")
+
+    trainer = EyeFocusTrainer(*session)
+    try:
+        score = trainer.run()
+    finally:
+        resources.finish_session(keep_source=not trainer.source_failed)
     # Eye tracking returns score as success count, 10 total rounds assumed
     return score if score else 0, 10, 0.0
 
 
+# =====================================================================
+# GÖZ TAKİBİ KAYNAKLARI
+# =====================================================================
+
+def _create_face_mesh():
+    """Göz aşamasının FaceMesh nesnesi (hazırlık thread'inde çağrılır)"""
+    return mp.solutions.face_mesh.FaceMesh(
+        max_num_faces=1,
+        refine_landmarks=True,
+        min_detection_confidence=EYE_DETECTION_CONFIDENCE,
+        min_tracking_confidence=EYE_TRACKING_CONFIDENCE
+    )
+
+
+def start_eye_warmup():
+    """Kamera ve FaceMesh'i arka planda hazırlamaya başla (zaten başladıysa aynı kaynaklar)"""
+    global eye_resources
+    if not MEDIAPIPE_AVAILABLE:
+        return None
+    if eye_resources is None:
+        eye_resources = EyeTrackingResources(EYE_FRAME_SOURCE, EYE_SCREEN_WIDTH, EYE_SCREEN_HEIGHT,
+                                             _create_face_mesh)
+    return eye_resources.start()
+
+
+def release_eye_resources():
+    """Paylaşılan kamera ve FaceMesh'i kapat"""
+    global eye_resources
+    if eye_resources is not None:
+        eye_resources.release()
+        eye_resources = None
+
+
+# =====================================================================
+# SONUÇ KAYDI
+# =====================================================================
+
+def get_results_store():
+    """Paylaşılan sonuç deposu (ilk kullanımda başlatılır, eski CSV'ler bir kez aktarılır)"""
+    global results_store
+    if results_store is None:
+        imported = import_csv_results()
+        for name, rows in imported.items():
+            print(f"  {name}: {rows} satir veritabanina aktarildi")
+        results_store = ResultsStore().start()
+    return results_store
+
+
+def flush_results(stage_label):
+    """Aşama sonu: bekleyen satırları yaz ve depo özetini göster"""
+    store = get_results_store()
+    if not store.flush():
+        print("  UYARI: Sonuclar zamaninda yazilamadi!")
+    print(f"{stage_label} sonuc kaydi: {store.describe()}")
+
+
+def close_results_store():
+    """Kalan satırları yaz ve depoyu kapat"""
+    global results_store
+    if results_store is not None:
+        results_store.close()
+        results_store = None
+
+
 # =====================================================================
 # ANA MENÜ
 # =====================================================================
@@ -1186,7 +1223,11 @@ def show_next_stage_screen(current_stage, next_stage_name):
     global player_name
     WIDTH, HEIGHT = 900, 650
     
+    loop = GameLoop(idle_fps=MENU_FPS)
+    loop.idle = True
+
     while True:
+        loop.tick()
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
         
         cv2.putText(screen, f"Tebrikler {player_name}!", (280, 100),
@@ -1204,7 +1245,7 @@ def show_next_stage_screen(current_stage, next_stage_name):
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, (150, 150, 150), 2)
         
         cv2.imshow("Sonraki Asama", screen)
-        key = cv2.waitKey(100) & 0xFF
+        key = cv2.waitKey(loop.wait_ms()) & 0xFF
         
         if key == 13:  # ENTER
             cv2.destroyAllWindows()
@@ -1225,6 +1266,9 @@ def run_all_stages():
     if not player_name:
         return
     
+    # Göz aşaması kaynakları aşama 1-2 oynanırken arka planda hazırlanır
+    start_eye_warmup()
+    
     # Stage 1
     cv2.destroyAllWindows()
     stats = stage_1_mouse_test()
@@ -1261,7 +1305,11 @@ def show_main_menu():
     """Ana menü ekranı"""
     WIDTH, HEIGHT = 800, 600
     
+    loop = GameLoop(idle_fps=MENU_FPS)
+    loop.idle = True
+
     while True:
+        loop.tick()
         screen = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
         
         cv2.putText(screen, "GAMER REFLEX TRAINER", (150, 80),
@@ -1287,7 +1335,7 @@ def show_main_menu():
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, (100, 100, 100), 2)
         
         cv2.imshow("Gamer Reflex Trainer", screen)
-        key = cv2.waitKey(100) & 0xFF
+        key = cv2.waitKey(loop.wait_ms()) & 0xFF
         
         if key == 13:  # ENTER - Tüm aşamalar
             cv2.destroyAllWindows()
@@ -1304,6 +1352,8 @@ def show_main_menu():
         elif key == 27:  # ESC
             break
     
+    release_eye_resources()
+    close_results_store()
     cv2.destroyAllWindows()
 
 
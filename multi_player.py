@@ -0,0 +1,138 @@
+"""
+Çok Oyunculu Göz Takibi İçin Yüz - Oyuncu Eşleme
+- Tek FaceMesh çağrısındaki tüm yüzler kareler arasında aynı oyuncu slotuna bağlanır
+- Eşleme yüz merkezlerinin (iki gözün landmark ortalaması) yakınlığına göre yapılır
+- Aynı anda beliren yeni yüzler ekranda soldan sağa oyuncu 1, 2, ... olur
+- Kısa süreli kayıpta yüz, son görüldüğü yere yakınsa kendi slotuna döner;
+  uzaktan giren kişi kayıp oyuncunun kalibrasyonunu ve skorunu devralmaz
+- Uzun süre görülmeyen oyuncunun yeri yeni gelen kişiye verilir
+"""
+
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+MULTI_PLAYER_MIN = 2
+MULTI_PLAYER_MAX = 4
+FACE_MATCH_DISTANCE = 0.15  # Normalize; bir karede yüz merkezinin kayabileceği en fazla mesafe
+FACE_REACQUIRE_DISTANCE = 0.25  # Normalize; kayıp slota dönebilmek için son görülen yere en fazla mesafe
+PLAYER_REASSIGN_TIMEOUT = 3.0  # Saniye; bu kadar görülmeyen oyuncunun yeri yeni yüze verilir
+
+
+# ============================================
+# YARDIMCI FONKSİYONLAR
+# ============================================
+
+def face_centers(points):
+    """(K, N, 3) göz landmark yığınından (K, 2) normalize yüz merkezleri"""
+    return points[..., :2].mean(axis=-2)
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class FaceAssigner:
+    """Yüzleri kareden kareye sabit oyuncu slotlarına bağlayan eşleyici.
+
+    `assign(centers, now)` her slot için yüz indeksini (yoksa -1) döndürür.
+    Önce bilinen slotlar en yakın yüzle eşleşir (en küçük mesafeden başlayarak,
+    FACE_MATCH_DISTANCE içinde). Kalan yüzler sırayla kısa süredir kayıp olan
+    en yakın slota (FACE_REACQUIRE_DISTANCE içindeyse), hiç kullanılmamış
+    slota veya süresi dolmuş slota yerleşir.
+    Son iki durumda slota yeni kişi gelmiştir; slot `claimed` listesine eklenir
+    (çağıran o oyuncunun kalibrasyonunu sıfırlamalıdır).
+    """
+
+    def __init__(self, slots, match_distance=FACE_MATCH_DISTANCE, reassign_timeout=PLAYER_REASSIGN_TIMEOUT,
+                 reacquire_distance=FACE_REACQUIRE_DISTANCE):
+        self.match_distance = match_distance
+        self.reacquire_distance = reacquire_distance
+        self.reassign_timeout = reassign_timeout
+        self.centers = np.full((slots, 2), np.nan)  # Son görülen yüz merkezi
+        self.last_seen = np.full(slots, -np.inf)
+        self.assignment = np.full(slots, -1, dtype=np.intp)  # Slot -> bu karedeki yüz indeksi
+        self.claimed = []  # Bu karede yeni kişi yerleşen slotlar
+
+        # Sayaçlar
+        self.claims = 0
+        self.reacquired = 0  # Eşik dışından kendi slotuna dönen yüzler
+        self.ignored_faces = 0  # Boş slot olmadığı için oyuna alınmayan yüzler
+
+    def assign(self, centers, now):
+        """Bu karenin yüz merkezlerini ((K, 2)) slotlara dağıt"""
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        assignment = self.assignment
+        assignment.fill(-1)
+        self.claimed = []
+        face_count = len(centers)
+        if face_count == 0:
+            return assignment
+
+        # Bilinen slotlar: en küçük mesafeden başlayarak açgözlü eşleme
+        known = ~np.isnan(self.centers[:, 0])
+        dist = np.linalg.norm(self.centers[:, None, :] - centers[None, :, :], axis=-1)
+        dist[~known] = np.inf
+        free_faces = np.ones(face_count, dtype=bool)
+        for flat in np.argsort(dist, axis=None):
+            slot, face = divmod(int(flat), face_count)
+            if dist[slot, face] > self.match_distance:
+                break
+            if assignment[slot] < 0 and free_faces[face]:
+                assignment[slot] = face
+                free_faces[face] = False
+
+        # Eşleşmeyen yüzler soldan sağa yerleştirilir
+        for face in sorted(np.flatnonzero(free_faces), key=lambda f: centers[f, 0]):
+            slot = self._recent_slot(centers[face], now)
+            if slot is not None:
+                self.reacquired += 1
+            else:
+                slot = self._free_slot(now)
+                if slot is None:
+                    self.ignored_faces += 1
+                    continue
+                self.claimed.append(slot)
+                self.claims += 1
+            assignment[slot] = face
+
+        seen = assignment >= 0
+        self.centers[seen] = centers[assignment[seen]]
+        self.last_seen[seen] = now
+        return assignment
+
+    def _recent_slot(self, center, now):
+        """Kısa süredir kayıp olan en yakın slot (hızlı hareket / anlık kayıp)
+
+        Son görülen yere `reacquire_distance`'tan uzak yüz başka biri sayılır
+        ve None döner; çağıran yeni slot açar.
+        """
+        recent = (self.assignment < 0) & (now - self.last_seen <= self.reassign_timeout)
+        if not recent.any():
+            return None
+        dist = np.where(recent, np.linalg.norm(self.centers - center, axis=1), np.inf)
+        slot = int(np.argmin(dist))
+        if dist[slot] > self.reacquire_distance:
+            return None
+        return slot
+
+    def _free_slot(self, now):
+        """Hiç kullanılmamış ilk slot; yoksa en uzun süredir görülmeyen, süresi dolmuş slot"""
+        unused = np.flatnonzero(np.isnan(self.centers[:, 0]) & (self.assignment < 0))
+        if len(unused):
+            return int(unused[0])
+        expired = (self.assignment < 0) & (now - self.last_seen > self.reassign_timeout)
+        if not expired.any():
+            return None
+        return int(np.argmin(np.where(expired, self.last_seen, np.inf)))
+
+    def get_stats(self):
+        """Eşleme istatistiklerini döndür"""
+        return {
+            'claims': self.claims,
+            'reacquired': self.reacquired,
+            'ignored_faces': self.ignored_faces,
+        }
@@ -0,0 +1,144 @@
+"""
+Kare Süresi Bütçesi ile Uyarlanır Çıkarım Kalitesi
+- Ölçülen çıkarım ve çizim sürelerini hedef kare süresiyle (ör. 33 ms) karşılaştırır
+- Bütçe aşılırsa FaceMesh'e giden çözünürlüğü düşürür, en alt seviyelerde
+  landmark çizimini kapatır
+- Yeterli pay oluştuğunda kaliteyi kademeli olarak geri yükseltir
+"""
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+FRAME_BUDGET_MS = 33.0  # Hedef kare süresi (~30 FPS)
+
+# Kalite seviyeleri (en yüksekten en düşüğe):
+# (tam kare çıkarım genişliği [None = doğal], ROI çıkarım genişliği, landmark çizimi)
+QUALITY_LEVELS = (
+    (None, 320, True),
+    (960, 288, True),
+    (640, 256, True),
+    (640, 224, False),
+    (480, 192, False),
+)
+
+GOVERNOR_SMOOTHING = 0.1  # Maliyet ortalaması için üstel katsayı
+DOWNGRADE_RATIO = 1.0  # Ortalama maliyet > bütçe * oran -> kaliteyi düşür
+UPGRADE_RATIO = 0.6  # Ortalama maliyet < bütçe * oran -> kaliteyi artırmayı düşün
+UPGRADE_HOLD_FRAMES = 90  # Yükseltmeden önce payın sürmesi gereken kare sayısı
+CHANGE_COOLDOWN_FRAMES = 30  # Her değişiklikten sonra ölçümün oturması için beklenen kare
+MAX_UPGRADE_BACKOFF = 8  # Geri alınan yükseltmelerde bekleme süresinin en fazla katı
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class FrameBudgetGovernor:
+    """Kare maliyetini izleyip kalite seviyesini seçen denetleyici.
+
+    Kare maliyeti max(ana döngü süresi, çıkarım süresi) olarak alınır:
+    pipeline modunda çıkarım paralel çalıştığı için darboğaz ikisinden
+    büyüğüdür, senkron modda döngü süresi çıkarımı zaten içerir.
+    """
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, levels=QUALITY_LEVELS):
+        self.budget_ms = budget_ms
+        self.levels = levels
+        self.level = 0
+        self.cost_ms = None  # Üstel ortalama kare maliyeti
+        self._inference_ms = 0.0
+        self._cooldown = 0
+        self._headroom_frames = 0
+        self._upgrade_hold = UPGRADE_HOLD_FRAMES
+        self._frames_since_upgrade = None
+
+        # Sayaçlar
+        self.frames = 0
+        self.frames_over_budget = 0
+        self.downgrades = 0
+        self.upgrades = 0
+
+    @property
+    def full_width(self):
+        return self.levels[self.level][0]
+
+    @property
+    def roi_width(self):
+        return self.levels[self.level][1]
+
+    @property
+    def draw_landmarks(self):
+        return self.levels[self.level][2]
+
+    def update(self, frame_ms, inference_ms=None):
+        """Kare ölçümünü ekle; seviye değiştiyse True döner
+
+        `frame_ms` kamera beklemesi hariç ana döngü süresidir. `inference_ms`
+        sadece yeni çıkarım sonucu geldiğinde verilir; aradaki karelerde son
+        değer kullanılır.
+        """
+        if inference_ms is not None:
+            self._inference_ms = inference_ms
+        cost = max(frame_ms, self._inference_ms)
+
+        self.frames += 1
+        if self._frames_since_upgrade is not None:
+            self._frames_since_upgrade += 1
+        if cost > self.budget_ms:
+            self.frames_over_budget += 1
+        if self.cost_ms is None:
+            self.cost_ms = cost
+        else:
+            self.cost_ms += GOVERNOR_SMOOTHING * (cost - self.cost_ms)
+
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return False
+
+        if self.cost_ms > self.budget_ms * DOWNGRADE_RATIO:
+            self._headroom_frames = 0
+            if self.level < len(self.levels) - 1:
+                self.downgrades += 1
+                # Yeni yapılan yükseltme tutmadıysa bir sonraki denemeyi geciktir (salınımı önler)
+                if self._frames_since_upgrade is not None and self._frames_since_upgrade < 2 * self._upgrade_hold:
+                    self._upgrade_hold = min(self._upgrade_hold * 2, UPGRADE_HOLD_FRAMES * MAX_UPGRADE_BACKOFF)
+                self._frames_since_upgrade = None
+                return self._set_level(self.level + 1)
+            return False
+
+        if self.cost_ms < self.budget_ms * UPGRADE_RATIO:
+            self._headroom_frames += 1
+            if self._headroom_frames >= self._upgrade_hold and self.level > 0:
+                self.upgrades += 1
+                self._frames_since_upgrade = 0
+                return self._set_level(self.level - 1)
+        else:
+            self._headroom_frames = 0
+        return False
+
+    def _set_level(self, level):
+        self.level = level
+        self._cooldown = CHANGE_COOLDOWN_FRAMES
+        self._headroom_frames = 0
+        return True
+
+    def describe(self):
+        """Seviyenin kısa açıklaması (konsol/ekran için)"""
+        full_width, roi_width, draw = self.levels[self.level]
+        full_text = "dogal" if full_width is None else f"{full_width}px"
+        overlay = "" if draw else ", cizim kapali"
+        return f"seviye {self.level} (tam kare {full_text}, ROI {roi_width}px{overlay})"
+
+    def get_stats(self):
+        """Denetleyici istatistiklerini döndür"""
+        over_rate = (self.frames_over_budget / self.frames * 100) if self.frames > 0 else 0
+        return {
+            'level': self.level,
+            'cost_ms': self.cost_ms or 0.0,
+            'frames': self.frames,
+            'over_budget_rate': over_rate,
+            'downgrades': self.downgrades,
+            'upgrades': self.upgrades,
+        }
@@ -0,0 +1,441 @@
+"""
+SQLite Sonuç Deposu
+- Tüm aşamaların sonuçları tek bir gömülü veritabanında tutulur (results/results.db):
+  `sessions` (oturum özeti), `trials` (tıklama / tuş denemeleri), `events` (göz odak olayları)
+- WAL modu: oyun yazarken başka bir süreç (analiz betiği, ikinci oyun penceresi)
+  okuyabilir ve yazabilir; kilitli anlarda yazma bekletilip tekrar denenir
+- Oyuncu / aşama / zaman indeksleri: oyuncu geçmişi ve liderlik tablosu milyonlarca
+  denemede de tablo taramadan indeksten okunur
+- Deneme ve olay satırları ResultsWriter kuyruğuyla arka planda, tablo başına tek
+  işlemde (transaction) toplu eklenir; oturum açma / kapama çağıranda anında yapılır
+- Eski CSV dosyaları bir kez içe aktarılır; aktarılan dosyalar `imports` tablosunda tutulur
+
+Kullanım:
+    python results_store.py import               # results/*.csv -> results/results.db (bir kez)
+    python results_store.py history Ahmet
+    python results_store.py leaderboard Mouse
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from results_writer import ResultsWriter
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+RESULTS_DB = "results/results.db"
+RESULTS_CSV_DIR = "results"
+STORE_BUSY_TIMEOUT = 5.0  # Saniye; başka yazıcı kilidi tutarken bekleme
+UNKNOWN_PLAYER = "Bilinmiyor"
+HISTORY_SIZE = 20
+LEADERBOARD_SIZE = 10
+LEADERBOARD_MIN_ACCURACY = 0.5  # Tepki süresi sıralamasına girmek için oturum doğruluğu
+IMPORT_SESSION_GAP = 600  # Saniye; içe aktarmada oturumu ayıran olay aralığı
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+STAGE_MOUSE = "Mouse"
+STAGE_SWARM = "Mouse-Suru"
+STAGE_KEYBOARD = "Klavye"
+STAGE_EYE = "Goz"
+SCORE_STAGES = (STAGE_EYE,)  # Liderlikte skora göre sıralanan aşamalar; diğerleri tepki süresine göre
+
+# Eski CSV'lerdeki `Asama` değerleri ve ortak logdaki klavye tuş harfleri
+LEGACY_STAGES = {"Mouse": STAGE_MOUSE, "Keyboard": STAGE_KEYBOARD}
+LEGACY_KEY_COMMANDS = {"W": "YUKARI", "S": "ASAGI", "A": "SOL", "D": "SAG"}
+
+TRIAL_COLUMNS = ("session_id", "player", "stage", "trial", "at", "target", "response",
+                 "correct", "reaction", "corrected_reaction")
+EVENT_COLUMNS = ("session_id", "player", "stage", "at", "kind", "duration",
+                 "gaze_x", "gaze_y", "ball_x", "ball_y", "distance", "score")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    started_at TEXT,
+    ended_at TEXT,
+    duration REAL,
+    correct INTEGER,
+    total INTEGER,
+    avg_reaction REAL,
+    score INTEGER,
+    source TEXT NOT NULL DEFAULT 'oyun'
+);
+CREATE TABLE IF NOT EXISTS trials (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    player TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    trial INTEGER,
+    at TEXT,
+    target TEXT,
+    response TEXT,
+    correct INTEGER NOT NULL,
+    reaction REAL,
+    corrected_reaction REAL
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    player TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    at TEXT,
+    kind TEXT NOT NULL,
+    duration REAL,
+    gaze_x REAL,
+    gaze_y REAL,
+    ball_x REAL,
+    ball_y REAL,
+    distance REAL,
+    score INTEGER
+);
+CREATE TABLE IF NOT EXISTS imports (
+    file TEXT PRIMARY KEY,
+    rows INTEGER NOT NULL,
+    imported_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_player ON sessions(player, stage, started_at);
+CREATE INDEX IF NOT EXISTS sessions_reaction ON sessions(stage, player, avg_reaction);
+CREATE INDEX IF NOT EXISTS sessions_score ON sessions(stage, player, score);
+CREATE INDEX IF NOT EXISTS trials_player ON trials(player, stage, at);
+CREATE INDEX IF NOT EXISTS trials_stage ON trials(stage, at);
+CREATE INDEX IF NOT EXISTS trials_session ON trials(session_id);
+CREATE INDEX IF NOT EXISTS events_player ON events(player, stage, at);
+CREATE INDEX IF NOT EXISTS events_session ON events(session_id);
+"""
+
+
+Session = namedtuple('Session', ['id', 'player', 'stage'])
+Session.__doc__ = """Açık oturum: deneme / olay satırları oyuncu ve aşamayı buradan alır"""
+
+
+def now_text():
+    return datetime.now().strftime(TIME_FORMAT)
+
+
+def connect(path=RESULTS_DB):
+    """WAL modunda bağlantı aç (şema yoksa oluştur)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=STORE_BUSY_TIMEOUT)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL'da her işlemde fsync yok; güç kesintisinde son işlemler kaybolabilir, dosya bozulmaz
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class ResultsStore(ResultsWriter):
+    """Aşama sonuçlarını SQLite'a yazan paylaşılan depo.
+
+    `start_session` / `end_session` çağıran thread'de hemen çalışır (aşama
+    başı ve sonu). `add_trial` / `add_event` satırı kuyruğa koyar ve hemen
+    döner; satırlar yazıcı thread'inde tablo başına toplu eklenir. Sorgular
+    da çağıran thread'in bağlantısını kullanır.
+    """
+
+    RETRY_ERRORS = (sqlite3.OperationalError,)
+    RETRY_WARNING = "  UYARI: {path} tablosu kilitli oldugu icin yazilamadi, tekrar denenecek!"
+
+    def __init__(self, path=RESULTS_DB, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._conn = connect(path)
+        self._worker_conn = None  # sqlite bağlantısı thread'ler arasında paylaşılmaz
+
+    def close(self, **kwargs):
+        """Kalan satırları yaz, thread'i durdur ve bağlantıyı kapat"""
+        super().close(**kwargs)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ============================================
+    # OTURUM / SATIR
+    # ============================================
+
+    def start_session(self, player, stage, started_at=None, source='oyun'):
+        """Yeni oturum satırı aç"""
+        player = player or UNKNOWN_PLAYER
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO sessions (player, stage, started_at, source) VALUES (?, ?, ?, ?)",
+                (player, stage, started_at or now_text(), source))
+        return Session(cursor.lastrowid, player, stage)
+
+    def end_session(self, session, correct, total, avg_reaction=None, score=None, duration=None):
+        """Oturum özetini yaz"""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE sessions SET ended_at = ?, duration = ?, correct = ?, total = ?, avg_reaction = ?, "
+                "score = ? WHERE id = ?",
+                (now_text(), duration, correct, total, avg_reaction, score, session.id))
+
+    def add_trial(self, session, trial, target, response, correct, reaction, corrected_reaction=None):
+        """Tıklama / tuş denemesini kuyruğa koy"""
+        self.write('trials', (session.id, session.player, session.stage, trial, now_text(), target, response,
+                              int(correct), reaction, corrected_reaction), TRIAL_COLUMNS)
+
+    def add_event(self, session, kind, duration, gaze, ball, distance, score):
+        """Göz odak olayını kuyruğa koy"""
+        self.write('events', (session.id, session.player, session.stage, now_text(), kind, duration,
+                              gaze[0], gaze[1], ball[0], ball[1], distance, score), EVENT_COLUMNS)
+
+    # ============================================
+    # WORKER
+    # ============================================
+
+    def _worker_loop(self):
+        try:
+            super()._worker_loop()
+        finally:
+            if self._worker_conn is not None:
+                self._worker_conn.close()
+                self._worker_conn = None
+
+    def _write_rows(self, table, columns, rows):
+        """Tablonun bekleyen satırlarını tek işlemde ekle"""
+        if self._worker_conn is None:
+            self._worker_conn = connect(self.path)
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        with self._worker_conn:
+            self._worker_conn.executemany(sql, rows)
+
+    # ============================================
+    # SORGULAR
+    # ============================================
+
+    def player_history(self, player, stage=None, limit=HISTORY_SIZE):
+        """Oyuncunun son oturumları (yeniden eskiye)"""
+        sql = ("SELECT stage, started_at, correct, total, avg_reaction, score FROM sessions "
+               "WHERE player = ?" + (" AND stage = ?" if stage else "") +
+               " ORDER BY started_at DESC, id DESC LIMIT ?")
+        params = (player, stage, limit) if stage else (player, limit)
+        return self._conn.execute(sql, params).fetchall()
+
+    def player_summary(self, player):
+        """Oyuncunun aşama başına deneme sayısı, doğruluk ve ortalama tepki süresi"""
+        return self._conn.execute(
+            "SELECT stage, COUNT(*), AVG(correct), "
+            "AVG(CASE WHEN correct THEN COALESCE(corrected_reaction, reaction) END) "
+            "FROM trials WHERE player = ? GROUP BY stage", (player,)).fetchall()
+
+    def leaderboard(self, stage, limit=LEADERBOARD_SIZE):
+        """Aşamanın en iyi oyuncuları: (oyuncu, en iyi değer, oturum sayısı)
+
+        Göz aşamasında en yüksek skor, diğerlerinde doğruluğu
+        LEADERBOARD_MIN_ACCURACY üstündeki oturumların en düşük ortalama
+        tepki süresi sıralanır.
+        """
+        if stage in SCORE_STAGES:
+            sql = ("SELECT player, MAX(score) AS best, COUNT(*) FROM sessions "
+                   "WHERE stage = ? AND score IS NOT NULL GROUP BY player ORDER BY best DESC LIMIT ?")
+        else:
+            sql = ("SELECT player, MIN(avg_reaction) AS best, COUNT(*) FROM sessions "
+                   f"WHERE stage = ? AND avg_reaction > 0 AND correct >= total * {LEADERBOARD_MIN_ACCURACY} "
+                   "GROUP BY player ORDER BY best LIMIT ?")
+        return self._conn.execute(sql, (stage, limit)).fetchall()
+
+
+# ============================================
+# CSV İÇE AKTARMA
+# ============================================
+
+def _float(value):
+    return float(value) if value not in (None, '') else None
+
+
+def _parse_time(text):
+    try:
+        return datetime.strptime(text, TIME_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def _insert_session(conn, player, stage, started_at, ended_at, trials=()):
+    """İçe aktarılan oturum; özet deneme satırlarından hesaplanır"""
+    correct = sum(row[7] for row in trials)
+    reactions = [row[9] if row[9] is not None else row[8] for row in trials if row[7]]
+    avg_reaction = sum(reactions) / len(reactions) if reactions else None
+    cursor = conn.execute(
+        "INSERT INTO sessions (player, stage, started_at, ended_at, correct, total, avg_reaction, source) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, 'csv')",
+        (player, stage, started_at, ended_at, correct, len(trials), avg_reaction))
+    return cursor.lastrowid
+
+
+def _import_trials(conn, rows, parse):
+    """Tur numarası başa dönünce veya aşama değişince yeni oturum başlar"""
+    count = 0
+    block = []
+
+    def flush():
+        if block:
+            session_id = _insert_session(conn, UNKNOWN_PLAYER, block[0][2], block[0][4], block[-1][4], block)
+            conn.executemany(f"INSERT INTO trials ({', '.join(TRIAL_COLUMNS)}) VALUES "
+                             f"({', '.join('?' * len(TRIAL_COLUMNS))})",
+                             [(session_id,) + row[1:] for row in block])
+            block.clear()
+
+    for row in rows:
+        trial = parse(row)
+        if block and (trial[3] <= block[-1][3] or trial[2] != block[-1][2]):
+            flush()
+        block.append(trial)
+        count += 1
+    flush()
+    return count
+
+
+def _legacy_stage(value):
+    """Eski `Asama` değerini aşama sabitine çevir (Mouse -> Mouse, Keyboard -> Klavye)"""
+    if not value:
+        return STAGE_MOUSE
+    return LEGACY_STAGES.get(value, value)
+
+
+def _mouse_trial(row):
+    """Asama kolonlu ortak log satırı; klavye satırları klavye deneme biçimine çevrilir"""
+    stage = _legacy_stage(row['Asama'])
+    target, response = row['HedefRenk'], row['TiklananRenk']
+    if stage == STAGE_KEYBOARD:
+        # Eski ortak logda klavye satırları renk kolonlarında tuş harfi taşır
+        target = LEGACY_KEY_COMMANDS.get(target.upper(), target)
+        response = LEGACY_KEY_COMMANDS.get(response.upper(), response)
+    return (None, UNKNOWN_PLAYER, stage, int(row['Tur']), row['Zaman'],
+            target, response, int(row['DogruMu']),
+            _float(row['TepkiSuresi']), _float(row.get('DuzeltilmisTepki')))
+
+
+def _keyboard_trial(row):
+    # Eski klavye kayıtlarında tarih yok (sadece SS:DD); zaman boş bırakılır
+    return (None, UNKNOWN_PLAYER, STAGE_KEYBOARD, int(row['Tur']), None,
+            row['HedefTus'], row['BasilanTus'], int(row['DogruMu']),
+            _float(row['ReaksiyonSuresi']), _float(row.get('DuzeltilmisReaksiyon')))
+
+
+def _import_eye_summary(conn, rows):
+    count = 0
+    for row in rows:
+        ended = _parse_time(row['Tarih'])
+        duration = _float(row['ToplamSure'])
+        started = ended - timedelta(seconds=duration) if ended and duration is not None else None
+        successes, failures = int(row['BasariliOdak']), int(row['BasarisizOdak'])
+        conn.execute(
+            "INSERT INTO sessions (player, stage, started_at, ended_at, duration, correct, total, "
+            "avg_reaction, score, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'csv')",
+            (row['Oyuncu'] or UNKNOWN_PLAYER, STAGE_EYE, started.strftime(TIME_FORMAT) if started else None,
+             row['Tarih'], duration, successes, successes + failures, _float(row['OrtOdakSuresi']),
+             int(row['ToplamSkor'])))
+        count += 1
+    return count
+
+
+def _import_eye_events(conn, rows):
+    """Olaylar, zamanı kapsayan özet oturumuna; yoksa aralıkla gruplanan yeni oturuma bağlanır"""
+    count = 0
+    open_sessions = {}  # oyuncu -> (oturum id, son olay zamanı)
+    for row in rows:
+        player = row['Oyuncu'] or UNKNOWN_PLAYER
+        at = row['Zaman']
+        match = conn.execute(
+            "SELECT id FROM sessions WHERE player = ? AND stage = ? AND started_at <= ? AND ended_at >= ? "
+            "LIMIT 1", (player, STAGE_EYE, at, at)).fetchone()
+        if match:
+            session_id = match[0]
+        else:
+            last = open_sessions.get(player)
+            at_time = _parse_time(at)
+            if last and at_time and last[1] and (at_time - last[1]).total_seconds() <= IMPORT_SESSION_GAP:
+                session_id = last[0]
+            else:
+                session_id = _insert_session(conn, player, STAGE_EYE, at, at)
+            open_sessions[player] = (session_id, at_time)
+        conn.execute(
+            f"INSERT INTO events ({', '.join(EVENT_COLUMNS)}) VALUES ({', '.join('?' * len(EVENT_COLUMNS))})",
+            (session_id, player, STAGE_EYE, at, row['OlayTuru'], _float(row['OdakSuresi']),
+             _float(row['GozX']), _float(row['GozY']), _float(row['TopX']), _float(row['TopY']),
+             _float(row['Mesafe']), int(row['Skor'])))
+        count += 1
+    return count
+
+
+# Dosya adı -> aktarıcı; özet, olaylardan önce aktarılır (olaylar özet oturumuna bağlanır)
+CSV_IMPORTERS = (
+    ("performance_log.csv", lambda conn, rows: _import_trials(conn, rows, _mouse_trial)),
+    ("performance_log_mouse.csv", lambda conn, rows: _import_trials(conn, rows, _mouse_trial)),
+    ("performance_log_keyboard.csv", lambda conn, rows: _import_trials(conn, rows, _keyboard_trial)),
+    ("eye_tracking_summary.csv", _import_eye_summary),
+    ("performance_log_eye_tracking.csv", _import_eye_events),
+)
+
+
+def import_csv_results(path=RESULTS_DB, csv_dir=RESULTS_CSV_DIR):
+    """Eski CSV sonuçlarını bir kez içe aktar; {dosya: satır sayısı} döndür
+
+    Her dosya tek işlemde aktarılır ve `imports` tablosuna yazılır; sonraki
+    çağrılarda atlanır. Boş veya olmayan dosyalar da atlanır.
+    """
+    imported = {}
+    conn = connect(path)
+    try:
+        done = {row[0] for row in conn.execute("SELECT file FROM imports")}
+        for name, importer in CSV_IMPORTERS:
+            csv_path = os.path.join(csv_dir, name)
+            if name in done or not os.path.isfile(csv_path) or os.path.getsize(csv_path) == 0:
+                continue
+            with open(csv_path, newline='', encoding='utf-8') as f, conn:
+                count = importer(conn, csv.DictReader(f))
+                conn.execute("INSERT INTO imports (file, rows, imported_at) VALUES (?, ?, ?)",
+                             (name, count, now_text()))
+            imported[name] = count
+    finally:
+        conn.close()
+    return imported
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite sonuc deposu: CSV aktarimi ve sorgular")
+    parser.add_argument('--db', default=RESULTS_DB, help="Veritabani yolu")
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_parser = commands.add_parser('import', help="Eski CSV sonuclarini bir kez ice aktar")
+    import_parser.add_argument('--csv-dir', default=RESULTS_CSV_DIR, help="CSV klasoru")
+    history_parser = commands.add_parser('history', help="Oyuncu gecmisi")
+    history_parser.add_argument('player')
+    history_parser.add_argument('--stage', help="Sadece bu asama")
+    leaderboard_parser = commands.add_parser('leaderboard', help="Asama liderlik tablosu")
+    leaderboard_parser.add_argument('stage', help=f"{STAGE_MOUSE}, {STAGE_SWARM}, {STAGE_KEYBOARD} veya {STAGE_EYE}")
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        imported = import_csv_results(args.db, args.csv_dir)
+        for name, count in imported.items():
+            print(f"{name}: {count} satir")
+        print(f"{len(imported)} dosya aktarildi" if imported else "Aktarilacak yeni CSV yok")
+    else:
+        store = ResultsStore(args.db)
+        if args.command == 'history':
+            for stage, trials, accuracy, avg_reaction in store.player_summary(args.player):
+                print(f"{stage:<12} {trials:>8} deneme, dogruluk %{accuracy * 100:.1f}, "
+                      f"ort. tepki {avg_reaction or 0:.3f} sn")
+            for stage, started_at, correct, total, avg_reaction, score in store.player_history(args.player, args.stage):
+                print(f"{started_at or '-':<20} {stage:<12} {correct or 0}/{total or 0}  "
+                      f"tepki {avg_reaction or 0:.3f}  skor {score if score is not None else '-'}")
+        else:
+            for rank, (player, best, sessions) in enumerate(store.leaderboard(args.stage), 1):
+                value = f"{best} puan" if args.stage in SCORE_STAGES else f"{best:.3f} sn"
+                print(f"{rank:>3}. {player:<20} {value}  ({sessions} oturum)")
+        store.close()
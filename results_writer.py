@@ -0,0 +1,234 @@
+"""
+Arka Plan Sonuç Yazıcısı
+- Aşamalar satırları kuyruğa bırakır; diske yazma ayrı bir thread'de yapılır,
+  böylece girdi ve kare yolunda dosya açma/yazma gecikmesi olmaz
+- Satırlar dosya başına biriktirilir; belirli sayıda satır birikince, belirli
+  süre geçince veya `flush()` çağrılınca (aşama sonu) toplu yazılır
+- Kuyruk dolarsa satır atılmaz: çağıran bekler ve bu bekleme geri basınç
+  metriği olarak sayılır
+- Sona yeni kolon eklenmiş bir başlıkla eski dosyaya yazılırsa dosya bir kez
+  yeni başlığa taşınır; eski satırların yeni kolonları boş kalır
+"""
+
+import csv
+import os
+import queue
+import threading
+import time
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+RESULTS_BATCH_SIZE = 64  # Bu kadar satır birikince yaz
+RESULTS_FLUSH_INTERVAL = 1.0  # Saniye; ilk bekleyen satırdan bu kadar sonra yaz
+RESULTS_QUEUE_SIZE = 4096  # Kuyruk sınırı; dolunca çağıran bekler (geri basınç)
+RESULTS_FLUSH_TIMEOUT = 5.0  # flush() için en uzun bekleme (saniye)
+
+
+# ============================================
+# YARDIMCI FONKSİYONLAR
+# ============================================
+
+def _upgrade_header(path, header):
+    """Eski başlık yeni başlığın öneki ise dosyayı yeni başlığa taşı"""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    if not rows:
+        return
+    old = rows[0]
+    if len(old) >= len(header) or old != list(header[:len(old)]):
+        return
+    padding = [''] * (len(header) - len(old))
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(row + padding for row in rows[1:])
+    os.replace(temp_path, path)
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class ResultsWriter:
+    """Birden fazla CSV dosyasına toplu yazan paylaşılan arka plan yazıcısı.
+
+    `write(path, row, header)` satırı kuyruğa koyar ve hemen döner. Dosya
+    yazma anında yoksa önce `header` yazılır. Dosya başka programda açık
+    olduğu için yazılamazsa satırlar bekletilir ve sonraki yazmada tekrar
+    denenir.
+
+    Alt sınıflar `_write_rows` ile başka bir hedefe (ör. SQLite tablosu)
+    yazabilir; `RETRY_ERRORS` içindeki hatalarda satırlar bekletilir.
+    """
+
+    RETRY_ERRORS = (PermissionError,)
+    RETRY_WARNING = "  UYARI: {path} dosyasi acik oldugu icin yazilamadi, tekrar denenecek!"
+
+    def __init__(self, batch_size=RESULTS_BATCH_SIZE, flush_interval=RESULTS_FLUSH_INTERVAL,
+                 max_queue=RESULTS_QUEUE_SIZE):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._pending = {}  # path -> (header, [satırlar]); sadece worker kullanır
+        self._pending_rows = 0
+        self._oldest_pending = None
+        self._thread = None
+        self._warned_paths = set()
+        self._checked_paths = set()  # Başlığı kontrol edilmiş dosyalar
+
+        # Sayaçlar (kuyruk tarafı çağıran thread'lerde güncellenir)
+        self.rows_queued = 0
+        self.blocked_writes = 0  # Kuyruk dolu olduğu için bekleyen write çağrıları
+        self.blocked_time = 0.0  # Geri basınç nedeniyle beklenen toplam süre (saniye)
+        self.max_queue_depth = 0
+        # Sayaçlar (worker tarafı)
+        self.rows_written = 0
+        self.batches = 0
+        self.write_errors = 0
+        self.max_batch_rows = 0
+        self.max_flush_time = 0.0  # En uzun tek toplu yazma süresi (saniye)
+
+    def start(self):
+        """Yazıcı thread'ini başlat (zincirleme kullanım için self döner)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker_loop, name="ResultsWriter", daemon=True)
+            self._thread.start()
+        return self
+
+    # ============================================
+    # ÇAĞIRAN TARAF
+    # ============================================
+
+    def write(self, path, row, header=None):
+        """Satırı yazılmak üzere kuyruğa koy"""
+        item = (path, header, list(row))
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            start = time.perf_counter()
+            self._queue.put(item)
+            self.blocked_writes += 1
+            self.blocked_time += time.perf_counter() - start
+        self.rows_queued += 1
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def flush(self, timeout=RESULTS_FLUSH_TIMEOUT):
+        """Şimdiye kadar kuyruğa giren tüm satırlar yazılana kadar bekle; başarılıysa True"""
+        if self._thread is None:
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=RESULTS_FLUSH_TIMEOUT):
+        """Kalan satırları yaz ve thread'i durdur"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    # ============================================
+    # WORKER
+    # ============================================
+
+    def _worker_loop(self):
+        while True:
+            timeout = None
+            if self._oldest_pending is not None:
+                timeout = max(0.0, self._oldest_pending + self.flush_interval - time.perf_counter())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write_pending()  # Süre doldu
+                continue
+
+            if item is None:
+                self._write_pending()
+                return
+            if isinstance(item, threading.Event):
+                self._write_pending()
+                item.set()
+                continue
+
+            path, header, row = item
+            entry = self._pending.get(path)
+            if entry is None:
+                entry = self._pending[path] = (header, [])
+            entry[1].append(row)
+            self._pending_rows += 1
+            if self._oldest_pending is None:
+                self._oldest_pending = time.perf_counter()
+            if self._pending_rows >= self.batch_size:
+                self._write_pending()
+
+    def _write_pending(self):
+        """Bekleyen satırları dosya başına tek açılışla yaz"""
+        if not self._pending_rows:
+            return
+        start = time.perf_counter()
+        written = 0
+        for path, (header, rows) in list(self._pending.items()):
+            try:
+                self._write_rows(path, header, rows)
+            except self.RETRY_ERRORS:
+                # Dosya başka programda açık: satırlar sonraki denemeye kalır
+                self.write_errors += 1
+                if path not in self._warned_paths:
+                    self._warned_paths.add(path)
+                    print(self.RETRY_WARNING.format(path=path))
+                continue
+            written += len(rows)
+            del self._pending[path]
+
+        self._pending_rows -= written
+        self.rows_written += written
+        if written:
+            self.batches += 1
+            self.max_batch_rows = max(self.max_batch_rows, written)
+        self._oldest_pending = time.perf_counter() if self._pending_rows else None
+        self.max_flush_time = max(self.max_flush_time, time.perf_counter() - start)
+
+    def _write_rows(self, path, header, rows):
+        """Bir dosyanın bekleyen satırlarını tek açılışla ekle"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_exists = os.path.isfile(path)
+        if file_exists and header and path not in self._checked_paths:
+            _upgrade_header(path, header)
+        self._checked_paths.add(path)
+        with open(path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if not file_exists and header:
+                writer.writerow(header)
+            writer.writerows(rows)
+
+    def get_stats(self):
+        """Yazıcı istatistiklerini döndür"""
+        return {
+            'queued': self.rows_queued,
+            'written': self.rows_written,
+            'pending': self.rows_queued - self.rows_written,
+            'batches': self.batches,
+            'max_batch_rows': self.max_batch_rows,
+            'max_queue_depth': self.max_queue_depth,
+            'blocked_writes': self.blocked_writes,
+            'blocked_ms': self.blocked_time * 1000,
+            'max_flush_ms': self.max_flush_time * 1000,
+            'write_errors': self.write_errors,
+        }
+
+    def describe(self):
+        """Tek satırlık özet"""
+        stats = self.get_stats()
+        return (f"{stats['written']}/{stats['queued']} satir, {stats['batches']} toplu yazma "
+                f"(en buyuk {stats['max_batch_rows']}, en uzun {stats['max_flush_ms']:.1f} ms), "
+                f"kuyruk en fazla {stats['max_queue_depth']}, "
+                f"geri basinc {stats['blocked_writes']} kez / {stats['blocked_ms']:.1f} ms")
@@ -0,0 +1,459 @@
+"""
+Ekransız Simülasyon ve Parametre Taraması
+- game_rules kuralları pencere olmadan, çizim yapmayan NullRenderer ve bot oyuncularla koşar
+- Zaman sanaldır: bekleme yoktur, GameLoop.tick(update, now) botun bir sonraki
+  eylemine kadar olan tüm fizik adımlarını atar; oyun gerçek zamandan çok hızlı ilerler
+- Botların tepki süresi dağılımı (lognormal veya alttan kırpılmış normal), isabet oranı
+  ve nişan / bakış sapması ayarlanabilir
+- Tarama: parametre ızgarasının her noktası için denemeler parçalara bölünür ve
+  ProcessPoolExecutor ile paralel koşar; sonuçlar results/simulation_<oyun>.csv'ye eklenir
+
+Kullanım:
+    python simulation.py keyboard --set SPEED_INCREASE=0.1,0.2,0.4 --trials 1000000
+    python simulation.py focus --set FOCUS_THRESHOLD=60,80,100 --set BOT_AIM=20,40
+    python simulation.py mouse --set SWARM=0,1 --set BOT_ACCURACY=0.8,0.95 --workers 4
+"""
+
+import argparse
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import numpy as np
+
+from frame_clock import REFERENCE_FPS
+from game_loop import GameLoop
+from game_rules import (
+    MouseRules, KeyboardRules, FocusRule, FOCUS_SUCCESS, FOCUS_LOST, COMMANDS, move_ball,
+    MOUSE_ROUNDS, MOUSE_BASE_SPEED, MOUSE_SPEED_PENALTY,
+    KEYBOARD_MAX_MOVES, KEYBOARD_BASE_SPEED, KEYBOARD_SPEED_INCREASE,
+    FOCUS_THRESHOLD, FOCUS_REQUIRED_TIME, FOCUS_LOSS_TOLERANCE, FOCUS_DECAY_RATE,
+)
+from results_writer import ResultsWriter
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+SIM_DEFAULT_TRIALS = 100_000  # Izgara noktası başına deneme
+SIM_CHUNK_TRIALS = 20_000  # Bir işçi görevindeki deneme sayısı
+SIM_MAX_UPDATES = 1_000_000  # Sanal zamanda tick başına adım sınırı yok sayılır
+SIM_RESULTS_DIR = "results"
+
+# Oyun alanları (main.py aşamalarıyla aynı)
+SIM_WIDTH, SIM_HEIGHT = 1000, 800
+SIM_COLORS = {
+    "pembe": (180, 105, 240),
+    "sari": (0, 255, 255),
+    "mavi": (255, 0, 0),
+    "yesil": (106, 187, 106),
+}
+EYE_WIDTH, EYE_HEIGHT = 1280, 720
+BALL_RADIUS = 45
+BALL_SPEED_OPTIONS = [-5, -4, -3, 3, 4, 5]
+BALL_UPDATE_RATE = 60
+BALL_RESET_MARGIN = 150
+GAZE_MARGIN = 50  # Bakış noktası ekran kenarından bu kadar içeride tutulur
+FOCUS_SAMPLE_FPS = 30  # Kamera örnek hızı
+FOCUS_TRIAL_TIMEOUT = 20.0  # Saniye; top bu sürede puanlanamazsa deneme başarısız
+FOCUS_LAPSE_SCALE = 2.0  # Dikkat dağılması: bakıp geri dönme = bu kadar tepki süresi
+
+# Bot varsayılanları
+BOT_RT = 0.45  # Ortalama tepki süresi (saniye)
+BOT_RT_SD = 0.12
+BOT_RT_MIN = 0.1  # Kırpılmış normal dağılımda alt sınır
+BOT_RT_DIST = 'lognormal'  # 'lognormal' veya 'normal'
+BOT_ACCURACY = 0.9  # Doğru hedefi / komutu seçme (odakta: topa bakma) olasılığı
+BOT_AIM = 8.0  # Nişan / bakış sapması (piksel, eksen başına standart sapma)
+
+BOT_DEFAULTS = {
+    'BOT_RT': BOT_RT,
+    'BOT_RT_SD': BOT_RT_SD,
+    'BOT_ACCURACY': BOT_ACCURACY,
+    'BOT_AIM': BOT_AIM,
+}
+
+# Oyun başına taranabilir parametreler ve varsayılanları (tür varsayılandan alınır)
+GAME_DEFAULTS = {
+    'mouse': {
+        'ROUNDS': MOUSE_ROUNDS,
+        'BASE_SPEED': float(MOUSE_BASE_SPEED),
+        'SPEED_PENALTY': MOUSE_SPEED_PENALTY,
+        'SWARM': 0,
+    },
+    'keyboard': {
+        'MAX_MOVES': KEYBOARD_MAX_MOVES,
+        'BASE_SPEED': KEYBOARD_BASE_SPEED,
+        'SPEED_INCREASE': KEYBOARD_SPEED_INCREASE,
+    },
+    'focus': {
+        'FOCUS_THRESHOLD': float(FOCUS_THRESHOLD),
+        'FOCUS_REQUIRED_TIME': FOCUS_REQUIRED_TIME,
+        'FOCUS_LOSS_TOLERANCE': FOCUS_LOSS_TOLERANCE,
+        'FOCUS_DECAY_RATE': FOCUS_DECAY_RATE,
+    },
+}
+
+
+# ============================================
+# RENDERER VE BOT
+# ============================================
+
+class NullRenderer:
+    """Çizim yapmayan renderer: kare yolunun yerini tutar, sadece kare sayar"""
+
+    def __init__(self):
+        self.frames = 0
+
+    def render(self, rules, alpha):
+        self.frames += 1
+
+
+class BotPlayer:
+    """Tepki süresi, isabet ve nişan sapması dağılımlı sanal oyuncu.
+
+    `rt_dist` 'lognormal' ise dağılımın ortalaması / standart sapması
+    `rt_mean` / `rt_sd` olur; 'normal' ise örnekler `rt_min` altından kırpılır.
+    """
+
+    def __init__(self, rt_mean=BOT_RT, rt_sd=BOT_RT_SD, accuracy=BOT_ACCURACY, aim_sd=BOT_AIM,
+                 rt_dist=BOT_RT_DIST, rt_min=BOT_RT_MIN, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.rt_mean = rt_mean
+        self.rt_sd = rt_sd
+        self.accuracy = accuracy
+        self.aim_sd = aim_sd
+        self.rt_dist = rt_dist
+        self.rt_min = rt_min
+        sigma_sq = math.log(1 + (rt_sd / rt_mean) ** 2)
+        self._mu = math.log(rt_mean) - sigma_sq / 2
+        self._sigma = math.sqrt(sigma_sq)
+
+    @classmethod
+    def from_params(cls, params, rng):
+        return cls(params['BOT_RT'], params['BOT_RT_SD'], params['BOT_ACCURACY'], params['BOT_AIM'], rng=rng)
+
+    def reaction(self):
+        """Bir tepki süresi örneği (saniye)"""
+        if self.rt_dist == 'lognormal':
+            return self.rng.lognormvariate(self._mu, self._sigma)
+        return max(self.rt_min, self.rng.gauss(self.rt_mean, self.rt_sd))
+
+    def hits(self):
+        """Bu denemede doğru seçimi yapıyor mu"""
+        return self.rng.random() < self.accuracy
+
+    def aim(self, x, y):
+        """Hedef noktaya sapmalı nişan"""
+        return x + self.rng.gauss(0.0, self.aim_sd), y + self.rng.gauss(0.0, self.aim_sd)
+
+
+def _new_stats():
+    return {'trials': 0, 'correct': 0, 'rt_n': 0, 'rt_sum': 0.0, 'rt_sq': 0.0, 'sessions': 0,
+            'virtual_time': 0.0, 'frames': 0, 'misses': 0, 'speed_sum': 0.0, 'wall_hits': 0,
+            'lost': 0, 'timeouts': 0}
+
+
+def _add_rt(stats, rt):
+    stats['rt_n'] += 1
+    stats['rt_sum'] += rt
+    stats['rt_sq'] += rt * rt
+
+
+# ============================================
+# SİMÜLATÖRLER
+# ============================================
+
+def simulate_mouse(trials, params, seed=None, renderer=None):
+    """Stage 1: bot her turda tepki süresi sonra hedefe (veya çeldiriciye) tıklar"""
+    rng = random.Random(seed)
+    bot = BotPlayer.from_params(params, rng)
+    renderer = renderer or NullRenderer()
+    stats = _new_stats()
+    now = 0.0
+    while stats['trials'] < trials:
+        rules = MouseRules(SIM_COLORS, (0, 100, SIM_WIDTH, SIM_HEIGHT), swarm=bool(params['SWARM']),
+                           rounds=params['ROUNDS'], base_speed=params['BASE_SPEED'],
+                           speed_penalty=params['SPEED_PENALTY'], seed=rng.getrandbits(32))
+        loop = GameLoop(rules.update_rate, max_updates=SIM_MAX_UPDATES)
+        loop.tick(rules.update, now)
+        rules.new_round()
+        onset = now
+        while not rules.game_over and stats['trials'] < trials:
+            now += bot.reaction()
+            loop.tick(rules.update, now)
+            renderer.render(rules, loop.alpha)
+
+            targets = rules.targets
+            target_kind = targets.names.index(rules.target_name)
+            wanted = targets.kinds == target_kind if bot.hits() else targets.kinds != target_kind
+            index = rng.choice(np.flatnonzero(wanted).tolist())
+            x, y = bot.aim(*targets.positions[index])
+            result = rules.click(x, y)
+            if result is None:
+                stats['misses'] += 1  # Iska: bot yeni bir tepkiyle tekrar dener
+                continue
+
+            stats['trials'] += 1
+            if result.correct:
+                stats['correct'] += 1
+                _add_rt(stats, now - onset)
+            rules.advance()
+            onset = now
+        if rules.game_over:
+            stats['sessions'] += 1
+            stats['speed_sum'] += rules.speed_multiplier
+    stats['virtual_time'] = now
+    stats['frames'] = renderer.frames
+    return stats
+
+
+def simulate_keyboard(trials, params, seed=None, renderer=None):
+    """Stage 2: bot her komuttan tepki süresi sonra doğru (veya yanlış) yön tuşuna basar"""
+    rng = random.Random(seed)
+    bot = BotPlayer.from_params(params, rng)
+    renderer = renderer or NullRenderer()
+    stats = _new_stats()
+    now = 0.0
+    while stats['trials'] < trials:
+        rules = KeyboardRules(SIM_WIDTH, SIM_HEIGHT, max_moves=params['MAX_MOVES'],
+                              base_speed=params['BASE_SPEED'], speed_increase=params['SPEED_INCREASE'],
+                              seed=rng.getrandbits(32))
+        loop = GameLoop(rules.update_rate, max_updates=SIM_MAX_UPDATES)
+        loop.tick(rules.update, now)
+        while not rules.game_over and stats['trials'] < trials:
+            rt = bot.reaction()
+            now += rt
+            loop.tick(rules.update, now)
+            renderer.render(rules, loop.alpha)
+
+            if bot.hits():
+                command = rules.command
+            else:
+                command = rng.choice([c for c in COMMANDS if c != rules.command])
+            move = rules.press(command)
+            stats['trials'] += 1
+            if move.correct:
+                stats['correct'] += 1
+                _add_rt(stats, rt)
+        if rules.game_over:
+            stats['sessions'] += 1
+            stats['speed_sum'] += rules.speed
+        stats['wall_hits'] += rules.wall_hits
+    stats['virtual_time'] = now
+    stats['frames'] = renderer.frames
+    return stats
+
+
+def simulate_focus(trials, params, seed=None, renderer=None):
+    """Stage 3: bot top yerleştikten tepki süresi sonra topu sapmalı bakışla izler
+
+    Her deneme bir toptur: puanlanınca (FOCUS_SUCCESS) veya FOCUS_TRIAL_TIMEOUT
+    dolunca biter. Bot topa `aim_sd` sapmayla bakar; `1 - accuracy` olasılıkla
+    izlemenin ilk `required_time` saniyesinde bir kez dikkati dağılır ve
+    FOCUS_LAPSE_SCALE tepki süresi boyunca ekranda rastgele bir noktaya bakar.
+    """
+    rng = random.Random(seed)
+    bot = BotPlayer.from_params(params, rng)
+    renderer = renderer or NullRenderer()
+    stats = _new_stats()
+    rule = FocusRule(params['FOCUS_THRESHOLD'], params['FOCUS_REQUIRED_TIME'],
+                     params['FOCUS_LOSS_TOLERANCE'], params['FOCUS_DECAY_RATE'])
+    ball = [EYE_WIDTH // 2, EYE_HEIGHT // 2, 0, 0]
+
+    def update_ball(dt):
+        ball[:] = move_ball(*ball, BALL_RADIUS, EYE_WIDTH, EYE_HEIGHT, dt * REFERENCE_FPS)[:4]
+
+    sample_dt = 1.0 / FOCUS_SAMPLE_FPS
+    loop = GameLoop(BALL_UPDATE_RATE, max_updates=SIM_MAX_UPDATES)
+    now = 0.0
+    loop.tick(update_ball, now)
+    gaze_x, gaze_y = EYE_WIDTH // 2, EYE_HEIGHT // 2
+    while stats['trials'] < trials:
+        ball[:] = [rng.randint(BALL_RADIUS + BALL_RESET_MARGIN, EYE_WIDTH - BALL_RADIUS - BALL_RESET_MARGIN),
+                   rng.randint(BALL_RADIUS + BALL_RESET_MARGIN, EYE_HEIGHT - BALL_RADIUS - BALL_RESET_MARGIN),
+                   rng.choice(BALL_SPEED_OPTIONS), rng.choice(BALL_SPEED_OPTIONS)]
+        start = now
+        tracking_at = now + bot.reaction()
+        lapse_start = lapse_end = math.inf
+        if not bot.hits():
+            lapse_start = tracking_at + rng.uniform(0, rule.required_time)
+            lapse_end = lapse_start + FOCUS_LAPSE_SCALE * bot.reaction()
+            lapse_x, lapse_y = rng.uniform(0, EYE_WIDTH), rng.uniform(0, EYE_HEIGHT)
+        while True:
+            now += sample_dt
+            loop.tick(update_ball, now)
+            renderer.render(rule, loop.alpha)
+            if lapse_start <= now < lapse_end:
+                gaze_x, gaze_y = lapse_x, lapse_y
+            elif now >= tracking_at:
+                gaze_x, gaze_y = bot.aim(ball[0], ball[1])
+            gaze_x = min(max(gaze_x, GAZE_MARGIN), EYE_WIDTH - GAZE_MARGIN)
+            gaze_y = min(max(gaze_y, GAZE_MARGIN), EYE_HEIGHT - GAZE_MARGIN)
+
+            event = rule.update(math.hypot(gaze_x - ball[0], gaze_y - ball[1]), now, sample_dt)
+            if event == FOCUS_SUCCESS:
+                stats['correct'] += 1
+                _add_rt(stats, now - start)
+                break
+            if event == FOCUS_LOST:
+                stats['lost'] += 1
+            if now - start > FOCUS_TRIAL_TIMEOUT:
+                stats['timeouts'] += 1
+                rule.reset()
+                break
+        stats['trials'] += 1
+    stats['virtual_time'] = now
+    stats['frames'] = renderer.frames
+    return stats
+
+
+SIMULATORS = {
+    'mouse': simulate_mouse,
+    'keyboard': simulate_keyboard,
+    'focus': simulate_focus,
+}
+
+
+# ============================================
+# ÖZET
+# ============================================
+
+def _per(stats, key, base):
+    return stats[key] / stats[base] if stats[base] else 0.0
+
+
+def summarize(game, stats):
+    """Toplanmış sayaçlardan CSV / tablo metrikleri"""
+    mean_rt = _per(stats, 'rt_sum', 'rt_n')
+    variance = _per(stats, 'rt_sq', 'rt_n') - mean_rt ** 2
+    summary = {
+        'Deneme': stats['trials'],
+        'Dogruluk': round(_per(stats, 'correct', 'trials'), 4),
+        'OrtTepki': round(mean_rt, 4),
+        'TepkiSapma': round(math.sqrt(max(variance, 0.0)), 4),
+    }
+    if game == 'mouse':
+        summary['IskaOrani'] = round(_per(stats, 'misses', 'trials'), 4)
+        summary['OrtSonHiz'] = round(_per(stats, 'speed_sum', 'sessions'), 3)
+    elif game == 'keyboard':
+        summary['DuvarDonusu'] = round(_per(stats, 'wall_hits', 'trials'), 4)
+        summary['OrtSonHiz'] = round(_per(stats, 'speed_sum', 'sessions'), 3)
+    else:
+        summary['OdakKaybi'] = round(_per(stats, 'lost', 'trials'), 4)
+        summary['ZamanAsimi'] = round(_per(stats, 'timeouts', 'trials'), 4)
+    summary['SanalSure'] = round(stats['virtual_time'], 1)
+    return summary
+
+
+# ============================================
+# TARAMA
+# ============================================
+
+def default_params(game):
+    """Oyunun ve botun varsayılan parametreleri"""
+    params = dict(GAME_DEFAULTS[game])
+    params.update(BOT_DEFAULTS)
+    return params
+
+
+def run_chunk(game, trials, params, seed):
+    """İşçi süreçte tek görev: `trials` deneme simüle et, sayaçları döndür"""
+    return SIMULATORS[game](trials, params, seed)
+
+
+def _merge(total, stats):
+    for key, value in stats.items():
+        total[key] = total.get(key, 0) + value
+
+
+def sweep(game, grid, trials=SIM_DEFAULT_TRIALS, workers=None, seed=0, chunk=SIM_CHUNK_TRIALS):
+    """Parametre ızgarasını tara; her nokta için (parametreler, özet) listesi döndür
+
+    `grid` parametre adı -> değer listesidir; verilmeyen parametreler
+    varsayılanda kalır. `workers` 1 ise süreç havuzu kullanılmaz.
+    """
+    names = list(grid)
+    points = [dict(default_params(game), **dict(zip(names, values)))
+              for values in itertools.product(*grid.values())]
+    jobs = []
+    for point_index, params in enumerate(points):
+        for chunk_index, start in enumerate(range(0, trials, chunk)):
+            # Her görevin tohumu (tarama tohumu, nokta, parça) ile belirlenir
+            jobs.append((point_index, min(chunk, trials - start), params, f"{seed}-{point_index}-{chunk_index}"))
+
+    totals = [{} for _ in points]
+    if workers == 1:
+        for point_index, count, params, job_seed in jobs:
+            _merge(totals[point_index], run_chunk(game, count, params, job_seed))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_chunk, game, count, params, job_seed): point_index
+                       for point_index, count, params, job_seed in jobs}
+            for future in as_completed(futures):
+                _merge(totals[futures[future]], future.result())
+    return [(params, summarize(game, total)) for params, total in zip(points, totals)]
+
+
+def write_results(game, results, path=None):
+    """Tarama sonuçlarını oyun CSV'sine ekle"""
+    path = path or os.path.join(SIM_RESULTS_DIR, f"simulation_{game}.csv")
+    params, summary = results[0]
+    header = ["Zaman"] + list(params) + list(summary)
+    stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    writer = ResultsWriter().start()
+    for params, summary in results:
+        writer.write(path, [stamp] + list(params.values()) + list(summary.values()), header)
+    writer.close()
+    return path
+
+
+def parse_grid(game, assignments):
+    """'AD=D1,D2' ifadelerini ızgaraya çevir; değer türü varsayılandan alınır"""
+    defaults = default_params(game)
+    grid = {}
+    for assignment in assignments:
+        name, _, values = assignment.partition('=')
+        name = name.strip().upper()
+        if name not in defaults:
+            raise ValueError(f"{name} bilinmiyor; {game} parametreleri: {', '.join(defaults)}")
+        kind = type(defaults[name])
+        grid[name] = [kind(v) for v in values.split(',') if v.strip()]
+    return grid
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ekransiz bot simulasyonu ve parametre taramasi")
+    parser.add_argument('game', choices=sorted(SIMULATORS), help="Simule edilecek asama")
+    parser.add_argument('--set', action='append', default=[], metavar='AD=D1,D2',
+                        help="Taranacak parametre ve degerleri (tekrarlanabilir)")
+    parser.add_argument('--trials', type=int, default=SIM_DEFAULT_TRIALS, help="Izgara noktasi basina deneme")
+    parser.add_argument('--workers', type=int, default=None, help="Surec sayisi (varsayilan: CPU sayisi)")
+    parser.add_argument('--seed', type=int, default=0, help="Tarama tohumu (ayni tohum ayni sonuc)")
+    parser.add_argument('--output', help="Sonuc CSV yolu (varsayilan: results/simulation_<oyun>.csv)")
+    args = parser.parse_args()
+    try:
+        grid = parse_grid(args.game, args.set)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    results = sweep(args.game, grid, args.trials, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    path = write_results(args.game, results, args.output)
+
+    names = list(grid)
+    columns = list(results[0][1])[1:]
+    print(" ".join(f"{name:>14}" for name in names + columns))
+    for params, summary in results:
+        print(" ".join(f"{params[name]:>14}" for name in names) + " " +
+              " ".join(f"{summary[column]:>14}" for column in columns))
+    total_trials = sum(summary['Deneme'] for _, summary in results)
+    virtual = sum(summary['SanalSure'] for _, summary in results)
+    print(f"{total_trials} deneme, {elapsed:.1f} s ({total_trials / elapsed:,.0f} deneme/s, "
+          f"gercek zamanin {virtual / elapsed:,.0f} kati) -> {path}")
@@ -0,0 +1,151 @@
+"""
+Dizi Tabanlı Hareketli Hedef Deposu (Stage 1)
+- Hedefler tek tek liste yerine sütun dizilerinde tutulur: konum, hız, yarıçap, renk
+- Hareket, duvar sekmesi ve tıklama testi tüm hedefler için tek NumPy ifadesiyle yapılır
+- Sürü modunda yüzlerce hedef ve çeldirici sabit kare hızında işlenir
+- Çizim son iki fizik adımı arasında ara konumla (interpolasyon) yapılabilir
+"""
+
+import cv2
+import numpy as np
+
+
+# ============================================
+# SABİTLER VE KONFİGÜRASYON
+# ============================================
+
+TARGET_INITIAL_CAPACITY = 16  # Kapasite aşılınca iki katına çıkarılır
+
+
+# ============================================
+# ANA SINIF
+# ============================================
+
+class TargetField:
+    """Hareketli daire hedefleri için struct-of-arrays depo.
+
+    `palette` renk adı -> BGR sözlüğüdür; her hedef paletteki renginin
+    indeksini (`kinds`) taşır. `bounds` (sol, üst, sağ, alt) sekme
+    sınırlarıdır. Diziler kapasiteye göre önceden ayrılır; geçerli hedefler
+    ilk `count` satırdır ve `positions` / `kinds` gibi görünümlerle okunur.
+    """
+
+    def __init__(self, palette, bounds, capacity=TARGET_INITIAL_CAPACITY, seed=None):
+        self.names = list(palette)
+        self.colors = [tuple(int(c) for c in palette[name]) for name in self.names]
+        self.bounds = bounds
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Dizileri `capacity` satıra (yeniden) ayır, mevcut hedefleri koru"""
+        n = self.count
+        pos = np.empty((capacity, 2), dtype=np.float64)
+        prev = np.empty((capacity, 2), dtype=np.float64)
+        vel = np.empty((capacity, 2), dtype=np.float64)
+        radius = np.empty(capacity, dtype=np.int32)
+        kind = np.empty(capacity, dtype=np.int16)
+        if n:
+            pos[:n] = self._pos[:n]
+            prev[:n] = self._prev[:n]
+            vel[:n] = self._vel[:n]
+            radius[:n] = self._radius[:n]
+            kind[:n] = self._kind[:n]
+        self._pos, self._prev, self._vel, self._radius, self._kind = pos, prev, vel, radius, kind
+
+    # ============================================
+    # GÖRÜNÜMLER
+    # ============================================
+
+    @property
+    def positions(self):
+        return self._pos[:self.count]
+
+    @property
+    def velocities(self):
+        return self._vel[:self.count]
+
+    @property
+    def radii(self):
+        return self._radius[:self.count]
+
+    @property
+    def kinds(self):
+        return self._kind[:self.count]
+
+    def name_of(self, index):
+        """Hedefin renk adı"""
+        return self.names[self._kind[index]]
+
+    # ============================================
+    # OLUŞTURMA
+    # ============================================
+
+    def clear(self):
+        """Tüm hedefleri kaldır (bellek korunur)"""
+        self.count = 0
+
+    def spawn(self, count, name, area, radius_range, speed):
+        """`name` renginde `count` hedef ekle
+
+        `area` (x0, y0, x1, y1) başlangıç konumu aralığı, `radius_range`
+        (min, max) yarıçap aralığıdır (uçlar dahil). Her eksende hız
+        rastgele yönde `speed` büyüklüğündedir.
+        """
+        start = self.count
+        end = start + count
+        if end > len(self._pos):
+            capacity = len(self._pos)
+            while capacity < end:
+                capacity *= 2
+            self._allocate(capacity)
+
+        rng = self._rng
+        x0, y0, x1, y1 = area
+        self._pos[start:end, 0] = rng.integers(x0, x1 + 1, count)
+        self._pos[start:end, 1] = rng.integers(y0, y1 + 1, count)
+        self._vel[start:end] = rng.choice((-1.0, 1.0), (count, 2)) * speed
+        self._radius[start:end] = rng.integers(radius_range[0], radius_range[1] + 1, count)
+        self._kind[start:end] = self.names.index(name)
+        self._prev[start:end] = self._pos[start:end]
+        self.count = end
+
+    # ============================================
+    # FİZİK VE TIKLAMA
+    # ============================================
+
+    def step(self, scale=1.0):
+        """Tüm hedefleri bir adım ilerlet; sınıra değenlerin hızını ters çevir"""
+        pos, vel = self.positions, self.velocities
+        self._prev[:self.count] = pos
+        pos += vel * scale
+        radius = self.radii[:, None]
+        left, top, right, bottom = self.bounds
+        low = pos - radius <= (left, top)
+        high = pos + radius >= (right, bottom)
+        vel[low | high] *= -1
+
+    def hit_test(self, x, y):
+        """(x, y) noktasındaki en üstteki (en son çizilen) hedefin indeksi; yoksa -1"""
+        delta = self.positions - (x, y)
+        hits = np.flatnonzero(np.einsum('ij,ij->i', delta, delta) <= self.radii.astype(np.float64) ** 2)
+        return int(hits[-1]) if len(hits) else -1
+
+    # ============================================
+    # ÇİZİM
+    # ============================================
+
+    def draw(self, screen, alpha=1.0):
+        """Hedefleri dizi sırasıyla çiz (sonraki hedef üstte kalır)
+
+        `alpha` < 1 ise konum önceki adım ile son adım arasından alınır.
+        """
+        colors = self.colors
+        positions = self.positions
+        if alpha < 1.0:
+            prev = self._prev[:self.count]
+            positions = prev + (positions - prev) * alpha
+        centers = positions.astype(np.int32).tolist()
+        for (x, y), r, k in zip(centers, self.radii.tolist(), self.kinds.tolist()):
+            cv2.circle(screen, (x, y), r, colors[k], -1)
@@ -0,0 +1,75 @@
+"""
+results_store CSV içe aktarma testleri
+- Asama kolonunda Mouse ve Keyboard satırları karışık eski ortak log
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from results_store import (import_csv_results, STAGE_MOUSE, STAGE_KEYBOARD,  # noqa: E402
+                           UNKNOWN_PLAYER)
+
+
+MIXED_LEGACY_LOG = """Asama,Tur,DogruMu,TepkiSuresi,HedefRenk,TiklananRenk,Zaman
+Mouse,1,1,0.80,mavi,mavi,2025-12-17 01:08:11
+Mouse,2,0,1.20,yesil,pembe,2025-12-17 01:08:13
+Keyboard,1,1,0.50,W,W,2025-12-23 22:00:13
+Keyboard,2,0,0.30,D,A,2025-12-23 22:00:14
+Keyboard,3,1,0.40,s,s,2025-12-23 22:00:15
+"""
+
+
+class MixedLegacyImportTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_dir = self._tmp.name
+        self.db = os.path.join(self.csv_dir, "results.db")
+        with open(os.path.join(self.csv_dir, "performance_log_mouse.csv"), "w", encoding="utf-8") as f:
+            f.write(MIXED_LEGACY_LOG)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def query(self, sql):
+        conn = sqlite3.connect(self.db)
+        try:
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.close()
+
+    def test_legacy_stages_are_normalised(self):
+        self.assertEqual(import_csv_results(self.db, self.csv_dir), {"performance_log_mouse.csv": 5})
+        sessions = self.query("SELECT stage, player, correct, total FROM sessions ORDER BY id")
+        self.assertEqual(sessions, [
+            (STAGE_MOUSE, UNKNOWN_PLAYER, 1, 2),
+            (STAGE_KEYBOARD, UNKNOWN_PLAYER, 2, 3),
+        ])
+        stages = {stage for (stage,) in self.query("SELECT DISTINCT stage FROM trials")}
+        self.assertEqual(stages, {STAGE_MOUSE, STAGE_KEYBOARD})
+
+    def test_keyboard_rows_use_keyboard_trial_shape(self):
+        import_csv_results(self.db, self.csv_dir)
+        keyboard = self.query(f"SELECT trial, at, target, response, correct FROM trials "
+                              f"WHERE stage = '{STAGE_KEYBOARD}' ORDER BY trial")
+        self.assertEqual(keyboard, [
+            (1, "2025-12-23 22:00:13", "YUKARI", "YUKARI", 1),
+            (2, "2025-12-23 22:00:14", "SAG", "SOL", 0),
+            (3, "2025-12-23 22:00:15", "ASAGI", "ASAGI", 1),
+        ])
+        mouse = self.query(f"SELECT target, response FROM trials WHERE stage = '{STAGE_MOUSE}' ORDER BY trial")
+        self.assertEqual(mouse, [("mavi", "mavi"), ("yesil", "pembe")])
+
+    def test_import_runs_once(self):
+        import_csv_results(self.db, self.csv_dir)
+        self.assertEqual(import_csv_results(self.db, self.csv_dir), {})
+        self.assertEqual(self.query("SELECT COUNT(*) FROM trials"), [(5,)])
+
+
+if __name__ == "__main__":
+    unittest.main()
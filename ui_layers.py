@@ -0,0 +1,121 @@
+"""
+Önbellekli Arayüz Katmanları
+- Sabit arayüz parçaları (başlıklar, çubuklar, alt bilgi) bir kez çizilir
+- Her karede sadece maskeli bölge çıktı karesine yerinde kopyalanır
+- Tam ekran karartma, önceden ayrılmış tampona tek ölçekleme ile yapılır
+"""
+
+import cv2
+import numpy as np
+
+
+# ============================================
+# KATMAN
+# ============================================
+
+class UILayer:
+    """Önceden çizilmiş, alfa maskeli ve sıkı kutuya kırpılmış arayüz parçası
+
+    Tamamen opak katmanlar (ör. düz çubuklar) doğrudan kopyalanır; metin gibi
+    kenar yumuşatmalı katmanlar önceden çarpılmış renk ve ters alfa ile tek
+    adımda karıştırılır.
+    """
+
+    __slots__ = ('x0', 'y0', 'image', 'premultiplied', 'inv_alpha')
+
+    def __init__(self, x0, y0, image, premultiplied=None, inv_alpha=None):
+        self.x0 = x0
+        self.y0 = y0
+        self.image = image  # (h, w, 3) uint8
+        self.premultiplied = premultiplied  # (h, w, 3) float32 - renk * alfa
+        self.inv_alpha = inv_alpha  # (h, w, 3) float32 - 1 - alfa; opak katmanda None
+
+    @classmethod
+    def render(cls, width, height, draw_fn):
+        """`draw_fn(canvas)` ile katmanı oluştur
+
+        Aynı çizim siyah ve beyaz tuvale yapılır; iki sonuç arasındaki fark
+        her pikselin alfa değerini verir.
+        """
+        on_black = np.zeros((height, width, 3), dtype=np.uint8)
+        on_white = np.full((height, width, 3), 255, dtype=np.uint8)
+        draw_fn(on_black)
+        draw_fn(on_white)
+
+        # beyaz - siyah = (1 - alfa) * 255
+        alpha = 255 - (on_white.astype(np.int16) - on_black).max(axis=2)
+        alpha = np.clip(alpha, 0, 255).astype(np.float32) / 255.0
+
+        ys, xs = np.nonzero(alpha)
+        if len(xs) == 0:
+            return cls(0, 0, np.zeros((0, 0, 3), dtype=np.uint8))
+        x0, x1 = xs.min(), xs.max() + 1
+        y0, y1 = ys.min(), ys.max() + 1
+
+        image = np.ascontiguousarray(on_black[y0:y1, x0:x1])
+        alpha = alpha[y0:y1, x0:x1]
+        if np.all(alpha == 1.0):
+            return cls(int(x0), int(y0), image)
+
+        premultiplied = image.astype(np.float32)  # Siyah tuvalde renk zaten alfa ile çarpılmış
+        inv_alpha = np.ascontiguousarray(np.repeat((1.0 - alpha)[..., None], 3, axis=2))
+        return cls(int(x0), int(y0), image, premultiplied, inv_alpha)
+
+    def composite(self, frame):
+        """Katmanı kareye yerinde uygula"""
+        h, w = self.image.shape[:2]
+        if h == 0:
+            return frame
+        region = frame[self.y0:self.y0 + h, self.x0:self.x0 + w]
+
+        if self.inv_alpha is None:
+            region[...] = self.image
+        else:
+            blended = cv2.multiply(region, self.inv_alpha, dtype=cv2.CV_32F)
+            cv2.add(blended, self.premultiplied, dst=blended)
+            region[...] = blended
+        return frame
+
+
+# ============================================
+# ÖNBELLEK
+# ============================================
+
+class LayerCache:
+    """İsimle erişilen katman önbelleği"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self._layers = {}
+        self._dim_buffer = None
+
+    def get(self, name, draw_fn):
+        """Katmanı döndür, ilk çağrıda `draw_fn` ile oluştur"""
+        layer = self._layers.get(name)
+        if layer is None:
+            layer = UILayer.render(self.width, self.height, draw_fn)
+            self._layers[name] = layer
+        return layer
+
+    def composite(self, frame, name, draw_fn):
+        """Katmanı (gerekirse oluşturup) kareye uygula"""
+        return self.get(name, draw_fn).composite(frame)
+
+    def invalidate(self, name=None):
+        """Tek katmanı veya tümünü yeniden çizilmek üzere sil"""
+        if name is None:
+            self._layers.clear()
+        else:
+            self._layers.pop(name, None)
+
+    def dim(self, frame, alpha, beta):
+        """`frame * alpha + beta` sonucunu yeniden kullanılan tampona yaz
+
+        cv2.addWeighted(overlay, 1 - alpha, frame, alpha, 0) ile aynı sonucu,
+        ara kopya ve yeni dizi ayırmadan verir (beta = overlay_rengi * (1 - alpha)).
+        """
+        if self._dim_buffer is None or self._dim_buffer.shape != frame.shape:
+            self._dim_buffer = np.empty_like(frame)
+        cv2.convertScaleAbs(frame, dst=self._dim_buffer, alpha=alpha, beta=beta)
+        return self._dim_buffer